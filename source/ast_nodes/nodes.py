@@ -1,29 +1,279 @@
+import weakref
+
 from boolean_logic.helpers import add_polynomials
 from boolean_logic.helpers import multiply_polynomials
 
 
+def postorder(root):
+    """
+    Iteratively yield every distinct node reachable from 'root' exactly once,
+    children before their parents. Uses an explicit stack, so the depth of
+    the expression is bounded only by memory.
+    """
+    visited = set()
+    stack = [(root, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+
+        if node in visited:
+            continue
+
+        if expanded:
+            visited.add(node)
+            yield node
+        else:
+            stack.append((node, True))
+
+            for child in reversed(node.children()):
+                if child not in visited:
+                    stack.append((child, False))
+
+def fold(root, combine):
+    """
+    Generic iterative post-order visitor: call combine(node, operand_results)
+    for every distinct node, where operand_results are the already computed
+    results of its children, and return the result for 'root'.
+    Shared subtrees are computed once.
+    """
+    results = {}
+
+    for node in postorder(root):
+        results[node] = combine(node, [results[child] for child in node.children()])
+
+    return results[root]
+
+def simplify_not(operand):
+    """
+    NOT rules applied to an already simplified operand.
+    """
+    if isinstance(operand, NotNode):
+        return operand.operand
+
+    if isinstance(operand, ConstNode):
+        return ConstNode(not operand.value)
+
+    return NotNode(operand)
+
+def simplify_and(*operands):
+    """
+    AND rules applied to already simplified operands, in one linear pass:
+    nested ANDs are flattened, 1 is dropped, 0 absorbs everything, duplicates
+    are removed and a complementary pair (x AND NOT x) yields 0.
+    """
+    return _simplify_absorbing(AndNode, operands, absorbing=False)
+
+def simplify_or(*operands):
+    """
+    OR rules applied to already simplified operands, in one linear pass:
+    nested ORs are flattened, 0 is dropped, 1 absorbs everything, duplicates
+    are removed and a complementary pair (x OR NOT x) yields 1.
+    """
+    return _simplify_absorbing(OrNode, operands, absorbing=True)
+
+def _simplify_absorbing(node_class, operands, absorbing):
+    unique = {}
+    negated = set()
+
+    for operand in _flatten(node_class, operands):
+        if isinstance(operand, ConstNode):
+            if operand.value == absorbing:
+                return operand
+            continue
+
+        if operand in unique:
+            continue
+
+        if operand in negated or (isinstance(operand, NotNode) and operand.operand in unique):
+            return ConstNode(absorbing)
+
+        unique[operand] = True
+
+        if isinstance(operand, NotNode):
+            negated.add(operand.operand)
+
+    if not unique:
+        return ConstNode(not absorbing)
+
+    if len(unique) == 1:
+        return next(iter(unique))
+
+    return node_class(*unique)
+
+def simplify_xor(*operands):
+    """
+    XOR rules applied to already simplified operands, in one linear pass:
+    constants and negations are folded into a single parity bit, nested XORs
+    are flattened and pairs of equal operands cancel out (so x XOR NOT x is 1).
+    """
+    parity = False
+    remaining = {}
+
+    for operand in operands:
+        if isinstance(operand, ConstNode):
+            parity ^= operand.value
+            continue
+
+        if isinstance(operand, NotNode):
+            parity = not parity
+            operand = operand.operand
+
+        for item in (operand.operands if isinstance(operand, XorNode) else (operand,)):
+            if item in remaining:
+                del remaining[item]
+            else:
+                remaining[item] = True
+
+    if not remaining:
+        return ConstNode(parity)
+
+    node = next(iter(remaining)) if len(remaining) == 1 else XorNode(*remaining)
+
+    return simplify_not(node) if parity else node
+
+def _flatten(node_class, operands):
+    for operand in operands:
+        if type(operand) is node_class:
+            yield from operand.operands
+        else:
+            yield operand
+
+
 class Node:
     """
     A base class for all AST nodes representing Boolean expressions.
+    Nodes are hash-consed: constructing a node that is structurally identical
+    to a live one returns the existing instance, so equal subtrees are shared,
+    equality is an identity check and every node carries a precomputed hash.
+    Nodes are therefore immutable once built, and use __slots__ instead of
+    a per-instance __dict__ to keep large expressions compact.
+
+    All traversals are built on the iterative fold(); subclasses only provide
+    the local step of each operation, given the results for their children.
     """
 
+    __slots__ = ("_hash", "_simplified", "__weakref__")
+
+    _intern_table = weakref.WeakValueDictionary()
+
+    def __new__(cls, *args):
+        key = (cls, *args)
+        node = Node._intern_table.get(key)
+
+        if node is None:
+            node = super().__new__(cls)
+            node._hash = hash(key)
+            node._simplified = None
+            Node._intern_table[key] = node
+
+        return node
+
+    def children(self):
+        return ()
+
     def simplify(self):
-        return self
+        """
+        Return the simplified node: the fixed point of the default rewrite engine
+        (see ast_nodes/rewriting.py), memoized on every (shared) node of the tree.
+        """
+        # Imported here: the rewriting module is built on top of the node classes.
+        from ast_nodes.rewriting import default_engine
+
+        return default_engine.rewrite(self)
 
     def evaluate(self, variables):
-        raise NotImplementedError("evaluate() must be implemented in subclasses")
+        return fold(self, lambda node, operands: node._evaluate(operands, variables))
+
+    def evaluate_bitwise(self, columns, mask):
+        return fold(self, lambda node, operands: node._evaluate_bitwise(operands, columns, mask))
+
+    def emit(self, lines, arguments):
+        """
+        Append straight-line Python statements computing this node to 'lines' and
+        return the name holding the result. 'arguments' maps variable names to
+        argument names. A shared subtree is computed once.
+        """
+        return fold(self, lambda node, operands: node._emit(operands, lines, arguments))
 
     def to_zhegalkin(self, variables):
-        raise NotImplementedError("to_zhegalkin() must be implemented in subclasses")
+        return fold(self, lambda node, operands: node._to_zhegalkin(operands, variables))
+
+    def substitute(self, variables):
+        """
+        Replace the variables with a known value by constants and simplify the result.
+        """
+        return fold(self, lambda node, operands: node._substitute(operands, variables))
+
+    def to_bdd(self, manager):
+        """
+        Build the ROBDD of this node in 'manager' (see boolean_logic/bdd.py)
+        and return its root.
+        """
+        return fold(self, lambda node, operands: node._to_bdd(operands, manager))
+
+    def to_cnf(self, encoder):
+        """
+        Encode this node into clauses through a Tseitin 'encoder'
+        (see boolean_logic/sat.py) and return the literal of the root.
+        """
+        return fold(self, lambda node, operands: node._to_cnf(operands, encoder))
+
+    def to_graphviz(self, graph, counter):
+        return fold(self, lambda node, operands: node._to_graphviz(operands, graph))
+
+    def __str__(self):
+        """
+        Format the expression without recursion: the stack holds nodes still to be
+        printed and literal pieces of text, in reverse order of output.
+        """
+        pieces = []
+        stack = [self]
+
+        while stack:
+            item = stack.pop()
+
+            if isinstance(item, str):
+                pieces.append(item)
+            else:
+                stack.extend(reversed(item._format_pieces()))
+
+        return "".join(pieces)
 
     def __eq__(self, other):
-        return isinstance(other, Node) and self.__dict__ == other.__dict__
+        return self is other
 
-    def substitute(self, variables):
+    def __hash__(self):
+        return self._hash
+
+    def _simplify(self, operands):
         return self
 
-    def to_graphviz(self, graph, counter):
-        raise NotImplementedError("to_graphviz() must be implemented in subclasses")
+    def _substitute(self, operands, variables):
+        return self._simplify(operands)
+
+    def _evaluate(self, operands, variables):
+        raise NotImplementedError("_evaluate() must be implemented in subclasses")
+
+    def _evaluate_bitwise(self, operands, columns, mask):
+        raise NotImplementedError("_evaluate_bitwise() must be implemented in subclasses")
+
+    def _emit(self, operands, lines, arguments):
+        raise NotImplementedError("_emit() must be implemented in subclasses")
+
+    def _to_zhegalkin(self, operands, variables):
+        raise NotImplementedError("_to_zhegalkin() must be implemented in subclasses")
+
+    def _to_bdd(self, operands, manager):
+        raise NotImplementedError("_to_bdd() must be implemented in subclasses")
+
+    def _to_cnf(self, operands, encoder):
+        raise NotImplementedError("_to_cnf() must be implemented in subclasses")
+
+    def _to_graphviz(self, operands, graph):
+        raise NotImplementedError("_to_graphviz() must be implemented in subclasses")
+
+    def _format_pieces(self):
+        raise NotImplementedError("_format_pieces() must be implemented in subclasses")
 
 
 class VariableNode(Node):
@@ -31,31 +281,42 @@ class VariableNode(Node):
     Represents a single variable in a Boolean expression.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = name
 
-    def simplify(self):
-        return self
-
-    def evaluate(self, variables):
+    def _evaluate(self, operands, variables):
         return variables[self.name]
 
-    def to_zhegalkin(self, variables):
+    def _evaluate_bitwise(self, operands, columns, mask):
+        return columns[self.name]
+
+    def _emit(self, operands, lines, arguments):
+        return arguments[self.name]
+
+    def _to_zhegalkin(self, operands, variables):
         index = variables.index(self.name)
         monomial = 1 << index
 
         return {monomial}
 
-    def substitute(self, variables):
+    def _to_bdd(self, operands, manager):
+        return manager.variable(self.name)
+
+    def _to_cnf(self, operands, encoder):
+        return encoder.variable(self.name)
+
+    def _substitute(self, operands, variables):
         if self.name in variables and variables[self.name] is not None:
             return ConstNode(variables[self.name])
-        
+
         return self
-            
-    def __str__(self):
-        return self.name
 
-    def to_graphviz(self, graph, counter):
+    def _format_pieces(self):
+        return [self.name]
+
+    def _to_graphviz(self, operands, graph):
         node_id = str(id(self))
         graph.node(node_id, self.name)
 
@@ -67,25 +328,36 @@ class ConstNode(Node):
     Represents a constant (True/False) in a Boolean expression.
     """
 
-    def __init__(self, value):
-        self.value = value
+    __slots__ = ("value",)
 
-    def simplify(self):
-        return self
+    def __new__(cls, value):
+        return super().__new__(cls, bool(value))
 
-    def evaluate(self, variables):
+    def __init__(self, value):
+        self.value = bool(value)
+
+    def _evaluate(self, operands, variables):
         return self.value
 
-    def to_zhegalkin(self, variables):
+    def _evaluate_bitwise(self, operands, columns, mask):
+        return mask if self.value else 0
+
+    def _emit(self, operands, lines, arguments):
+        return "mask" if self.value else "0"
+
+    def _to_zhegalkin(self, operands, variables):
         return {0} if self.value else set()
 
-    def substitute(self, variables):
-        return self
+    def _to_bdd(self, operands, manager):
+        return 1 if self.value else 0
 
-    def __str__(self):
-        return "1" if self.value else "0"
+    def _to_cnf(self, operands, encoder):
+        return encoder.constant(self.value)
 
-    def to_graphviz(self, graph, counter):
+    def _format_pieces(self):
+        return ["1" if self.value else "0"]
+
+    def _to_graphviz(self, operands, graph):
         node_id = str(id(self))
         label = "1" if self.value else "0"
         graph.node(node_id, label)
@@ -98,377 +370,372 @@ class NotNode(Node):
     Represents the logical NOT of a single operand.
     """
 
+    __slots__ = ("operand",)
+
     def __init__(self, operand):
         self.operand = operand
 
-    def simplify(self):
-        operand = self.operand.simplify()
+    def children(self):
+        return (self.operand,)
 
-        if isinstance(operand, NotNode):
-            return operand.operand
-        
-        if isinstance(operand, ConstNode):
-            return ConstNode(not operand.value)
-        
-        return NotNode(operand)
+    def _simplify(self, operands):
+        return simplify_not(operands[0])
 
-    def evaluate(self, variables):
-        return not self.operand.evaluate(variables)
+    def _evaluate(self, operands, variables):
+        return not operands[0]
 
-    def to_zhegalkin(self, variables):
-        operand_polynomial = self.operand.to_zhegalkin(variables)
-        one_polynomial = {0} 
+    def _evaluate_bitwise(self, operands, columns, mask):
+        return mask ^ operands[0]
 
-        return add_polynomials(one_polynomial, operand_polynomial)
+    def _emit(self, operands, lines, arguments):
+        lines.append(f"t{len(lines)} = mask ^ {operands[0]}")
 
-    def substitute(self, variables):
-        new_operand = self.operand.substitute(variables)
+        return f"t{len(lines) - 1}"
 
-        return NotNode(new_operand).simplify()
+    def _to_zhegalkin(self, operands, variables):
+        one_polynomial = {0}
 
-    def __str__(self):
-        return f"NOT {self.operand}"
+        return add_polynomials(one_polynomial, operands[0])
 
-    def to_graphviz(self, graph, counter):
+    def _to_bdd(self, operands, manager):
+        return manager.negate(operands[0])
+
+    def _to_cnf(self, operands, encoder):
+        return -operands[0]
+
+    def _format_pieces(self):
+        return ["NOT ", self.operand]
+
+    def _to_graphviz(self, operands, graph):
         node_id = str(id(self))
         graph.node(node_id, "NOT")
-        child_id = self.operand.to_graphviz(graph, counter)
-        graph.edge(node_id, child_id)
+        graph.edge(node_id, operands[0])
 
         return node_id
 
 
-class AndNode(Node):
+class BinaryNode(Node):
     """
-    Represents the logical AND of two operands.
+    Common base of the non-associative nodes with a left and a right operand.
+    Subclasses set 'symbol' (used for printing and graph labels) and 'template'
+    (the expression emitted for the compiled evaluator).
     """
 
+    __slots__ = ("left", "right")
+
+    symbol = None
+    template = None
+
     def __init__(self, left, right):
         self.left = left
         self.right = right
 
-    def simplify(self):
-        left = self.left.simplify()
-        right = self.right.simplify()
-
-        if isinstance(left, ConstNode):
-            return right if left.value else ConstNode(False)
-        
-        if isinstance(right, ConstNode):
-            return left if right.value else ConstNode(False)
-
-        if left == right:
-            return left
+    def children(self):
+        return (self.left, self.right)
 
-        return AndNode(left, right)
+    def _to_bdd(self, operands, manager):
+        return manager.apply(self.symbol, *operands)
 
-    def evaluate(self, variables):
-        return self.left.evaluate(variables) and self.right.evaluate(variables)
-
-    def to_zhegalkin(self, variables):
-        left_polynomial = self.left.to_zhegalkin(variables)
-        right_polynomial = self.right.to_zhegalkin(variables)
-
-        return multiply_polynomials(left_polynomial, right_polynomial)
+    def _to_cnf(self, operands, encoder):
+        return encoder.gate(self.symbol, operands)
 
-    def substitute(self, variables):
-        new_left = self.left.substitute(variables)
-        new_right = self.right.substitute(variables)
+    def _emit(self, operands, lines, arguments):
+        left, right = operands
+        lines.append(f"t{len(lines)} = " + self.template.format(left=left, right=right))
 
-        return AndNode(new_left, new_right).simplify()
+        return f"t{len(lines) - 1}"
 
-    def __str__(self):
-        return f"({self.left} AND {self.right})"
+    def _format_pieces(self):
+        return ["(", self.left, f" {self.symbol} ", self.right, ")"]
 
-    def to_graphviz(self, graph, counter):
+    def _to_graphviz(self, operands, graph):
         node_id = str(id(self))
-        graph.node(node_id, "AND")
-        left_id = self.left.to_graphviz(graph, counter)
-        right_id = self.right.to_graphviz(graph, counter)
-        graph.edge(node_id, left_id)
-        graph.edge(node_id, right_id)
+        graph.node(node_id, self.symbol)
+        graph.edge(node_id, operands[0])
+        graph.edge(node_id, operands[1])
 
         return node_id
 
 
-class OrNode(Node):
+class NaryNode(Node):
     """
-    Represents the logical OR of two operands.
+    Common base of the associative operators, which hold a flat tuple of operands
+    instead of a chain of binary nodes: an operand of the same class is spliced
+    into the tuple on construction, so A OR (B OR C) and (A OR B) OR C are one node.
+    Subclasses set 'symbol' and 'operator' (the Python bitwise operator used by
+    the compiled evaluator).
     """
 
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
+    __slots__ = ("operands",)
 
-    def simplify(self):
-        left = self.left.simplify()
-        right = self.right.simplify()
+    symbol = None
+    operator = None
 
-        if isinstance(left, ConstNode):
-            return ConstNode(True) if left.value else right
-        if isinstance(right, ConstNode):
-            return ConstNode(True) if right.value else left
+    # The compiled evaluator splits long chains over several statements
+    # to stay clear of the Python compiler's nesting limits.
+    emit_chunk_size = 64
 
-        if left == right:
-            return left
+    def __new__(cls, *operands):
+        operands = tuple(_flatten(cls, operands))
+        node = super().__new__(cls, *operands)
+        node.operands = operands
 
-        return OrNode(left, right)
+        return node
 
-    def evaluate(self, variables):
-        return self.left.evaluate(variables) or self.right.evaluate(variables)
+    def __init__(self, *operands):
+        pass
 
-    def to_zhegalkin(self, variables):
-        left_polynomial = self.left.to_zhegalkin(variables)
-        right_polynomial = self.right.to_zhegalkin(variables)
-        product = multiply_polynomials(left_polynomial, right_polynomial)
+    def children(self):
+        return self.operands
 
-        return add_polynomials(add_polynomials(left_polynomial, right_polynomial), product)
+    def _to_bdd(self, operands, manager):
+        # The operators are associative and commutative: starting from the operand whose
+        # top variable is lowest, each apply() only descends to where the next one starts.
+        operands = sorted(operands, key=manager.level, reverse=True)
+        result = operands[0]
 
-    def substitute(self, variables):
-        new_left = self.left.substitute(variables)
-        new_right = self.right.substitute(variables)
+        for operand in operands[1:]:
+            result = manager.apply(self.symbol, result, operand)
 
-        return OrNode(new_left, new_right).simplify()
+        return result
 
-    def __str__(self):
-        return f"({self.left} OR {self.right})"
+    def _to_cnf(self, operands, encoder):
+        return encoder.gate(self.symbol, operands)
 
-    def to_graphviz(self, graph, counter):
+    def _emit(self, operands, lines, arguments):
+        result = operands[0]
+        size = self.emit_chunk_size
+
+        for start in range(1, len(operands), size):
+            chunk = [result, *operands[start:start + size]]
+            lines.append(f"t{len(lines)} = " + f" {self.operator} ".join(chunk))
+            result = f"t{len(lines) - 1}"
+
+        return result
+
+    def _format_pieces(self):
+        pieces = ["("]
+
+        for operand in self.operands:
+            pieces.extend((operand, f" {self.symbol} "))
+
+        pieces[-1] = ")"
+
+        return pieces
+
+    def _to_graphviz(self, operands, graph):
         node_id = str(id(self))
-        graph.node(node_id, "OR")
-        left_id = self.left.to_graphviz(graph, counter)
-        right_id = self.right.to_graphviz(graph, counter)
-        graph.edge(node_id, left_id)
-        graph.edge(node_id, right_id)
+        graph.node(node_id, self.symbol)
+
+        for operand in operands:
+            graph.edge(node_id, operand)
 
         return node_id
 
 
-class XorNode(Node):
+class AndNode(NaryNode):
     """
-    Represents the logical XOR of two operands.
+    Represents the logical AND of two or more operands.
     """
 
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
+    __slots__ = ()
 
-    def simplify(self):
-        left = self.left.simplify()
-        right = self.right.simplify()
-
-        if isinstance(left, ConstNode) and isinstance(right, ConstNode):
-            return ConstNode(left.value != right.value)
-
-        if isinstance(left, ConstNode):
-            if left.value == False:
-                return right
-            return NotNode(right).simplify()
-        
-        if isinstance(right, ConstNode):
-            if right.value == False:
-                return left
-            return NotNode(left).simplify()
-                
-        if left == right:
-            return ConstNode(False)
-
-        return XorNode(left, right)
+    symbol = "AND"
+    operator = "&"
 
-    def evaluate(self, variables):
-        return self.left.evaluate(variables) != self.right.evaluate(variables)
+    def _simplify(self, operands):
+        return simplify_and(*operands)
 
-    def to_zhegalkin(self, variables):
-        left_polynomial = self.left.to_zhegalkin(variables)
-        right_polynomial = self.right.to_zhegalkin(variables)
+    def _evaluate(self, operands, variables):
+        return all(operands)
 
-        return add_polynomials(left_polynomial, right_polynomial)
+    def _evaluate_bitwise(self, operands, columns, mask):
+        result = mask
 
-    def substitute(self, variables):
-        new_left = self.left.substitute(variables)
-        new_right = self.right.substitute(variables)
+        for operand in operands:
+            result &= operand
 
-        return XorNode(new_left, new_right).simplify()
+        return result
 
-    def __str__(self):
-        return f"({self.left} XOR {self.right})"
+    def _to_zhegalkin(self, operands, variables):
+        result = operands[0]
 
-    def to_graphviz(self, graph, counter):
-        node_id = str(id(self))
-        graph.node(node_id, "XOR")
-        left_id = self.left.to_graphviz(graph, counter)
-        right_id = self.right.to_graphviz(graph, counter)
-        graph.edge(node_id, left_id)
-        graph.edge(node_id, right_id)
+        for operand in operands[1:]:
+            result = multiply_polynomials(result, operand)
 
-        return node_id
+        return result
 
 
-class ImpNode(Node):
+class OrNode(NaryNode):
     """
-    Represents the logical implication of left -> right.
+    Represents the logical OR of two or more operands.
     """
 
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
+    __slots__ = ()
 
-    def simplify(self):
-        return OrNode(NotNode(self.left), self.right).simplify()
+    symbol = "OR"
+    operator = "|"
 
-    def evaluate(self, variables):
-        return (not self.left.evaluate(variables)) or self.right.evaluate(variables)
+    def _simplify(self, operands):
+        return simplify_or(*operands)
 
-    def to_zhegalkin(self, variables):
-        one_polynomial = {0}
-        left_polynomial = self.left.to_zhegalkin(variables)
-        right_polynomial = self.right.to_zhegalkin(variables)
-        mult_polynomial = multiply_polynomials(left_polynomial, right_polynomial)
-        result_polynomial = add_polynomials(one_polynomial, left_polynomial)
-        result_polynomial = add_polynomials(result_polynomial, mult_polynomial)
+    def _evaluate(self, operands, variables):
+        return any(operands)
 
-        return result_polynomial
+    def _evaluate_bitwise(self, operands, columns, mask):
+        result = 0
 
-    def substitute(self, variables):
-        new_left = self.left.substitute(variables)
-        new_right = self.right.substitute(variables)
+        for operand in operands:
+            result |= operand
 
-        return ImpNode(new_left, new_right).simplify()
+        return result
 
-    def __str__(self):
-        return f"({self.left} IMP {self.right})"
+    def _to_zhegalkin(self, operands, variables):
+        result = operands[0]
 
-    def to_graphviz(self, graph, counter):
-        node_id = str(id(self))
-        graph.node(node_id, "IMP")
-        left_id = self.left.to_graphviz(graph, counter)
-        right_id = self.right.to_graphviz(graph, counter)
-        graph.edge(node_id, left_id)
-        graph.edge(node_id, right_id)
+        for operand in operands[1:]:
+            product = multiply_polynomials(result, operand)
+            result = add_polynomials(add_polynomials(result, operand), product)
 
-        return node_id
+        return result
 
 
-class EqvNode(Node):
+class XorNode(NaryNode):
     """
-    Represents the logical equivalence of left <-> right.
+    Represents the logical XOR (odd parity) of two or more operands.
     """
 
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
+    __slots__ = ()
 
-    def simplify(self):
-        return NotNode(XorNode(self.left, self.right)).simplify()
+    symbol = "XOR"
+    operator = "^"
 
-    def evaluate(self, variables):
-        return self.left.evaluate(variables) == self.right.evaluate(variables)
+    def _simplify(self, operands):
+        return simplify_xor(*operands)
 
-    def to_zhegalkin(self, variables):
-        left_polynomial = self.left.to_zhegalkin(variables)
-        right_polynomial = self.right.to_zhegalkin(variables)
-        xor_polynomial = add_polynomials(left_polynomial, right_polynomial)
+    def _evaluate(self, operands, variables):
+        return sum(map(bool, operands)) % 2 == 1
 
-        return add_polynomials({0}, xor_polynomial)
+    def _evaluate_bitwise(self, operands, columns, mask):
+        result = 0
 
-    def substitute(self, variables):
-        new_left = self.left.substitute(variables)
-        new_right = self.right.substitute(variables)
+        for operand in operands:
+            result ^= operand
 
-        return EqvNode(new_left, new_right).simplify()
+        return result
 
-    def __str__(self):
-        return f"({self.left} EQV {self.right})"
+    def _to_zhegalkin(self, operands, variables):
+        result = set()
 
-    def to_graphviz(self, graph, counter):
-        node_id = str(id(self))
-        graph.node(node_id, "EQV")
-        left_id = self.left.to_graphviz(graph, counter)
-        right_id = self.right.to_graphviz(graph, counter)
-        graph.edge(node_id, left_id)
-        graph.edge(node_id, right_id)
+        for operand in operands:
+            result.symmetric_difference_update(operand)
 
-        return node_id
+        return result
 
 
-class NandNode(Node):
+class ImpNode(BinaryNode):
     """
-    Represents the logical NAND of two operands (negated AND).
+    Represents the logical implication of left -> right.
     """
 
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
+    __slots__ = ()
 
-    def simplify(self):
-        return NotNode(AndNode(self.left, self.right)).simplify()
+    symbol = "IMP"
+    template = "(mask ^ {left}) | {right}"
 
-    def evaluate(self, variables):
-        return not (self.left.evaluate(variables) and self.right.evaluate(variables))
+    def _simplify(self, operands):
+        left, right = operands
 
-    def to_zhegalkin(self, variables):
-        and_polynomial = AndNode(self.left, self.right).to_zhegalkin(variables)
+        return simplify_or(simplify_not(left), right)
 
-        return add_polynomials({0}, and_polynomial)
+    def _evaluate(self, operands, variables):
+        return (not operands[0]) or operands[1]
 
-    def substitute(self, variables):
-        new_left = self.left.substitute(variables)
-        new_right = self.right.substitute(variables)
+    def _evaluate_bitwise(self, operands, columns, mask):
+        return (mask ^ operands[0]) | operands[1]
 
-        return NandNode(new_left, new_right).simplify()
+    def _to_zhegalkin(self, operands, variables):
+        one_polynomial = {0}
+        left_polynomial, right_polynomial = operands
+        mult_polynomial = multiply_polynomials(left_polynomial, right_polynomial)
+        result_polynomial = add_polynomials(one_polynomial, left_polynomial)
+        result_polynomial = add_polynomials(result_polynomial, mult_polynomial)
 
-    def __str__(self):
-        return f"({self.left} NAND {self.right})"
+        return result_polynomial
 
-    def to_graphviz(self, graph, counter):
-        node_id = str(id(self))
-        graph.node(node_id, "NAND")
-        left_id = self.left.to_graphviz(graph, counter)
-        right_id = self.right.to_graphviz(graph, counter)
-        graph.edge(node_id, left_id)
-        graph.edge(node_id, right_id)
 
-        return node_id
+class EqvNode(BinaryNode):
+    """
+    Represents the logical equivalence of left <-> right.
+    """
+
+    __slots__ = ()
+
+    symbol = "EQV"
+    template = "mask ^ {left} ^ {right}"
+
+    def _simplify(self, operands):
+        return simplify_not(simplify_xor(*operands))
+
+    def _evaluate(self, operands, variables):
+        return operands[0] == operands[1]
+
+    def _evaluate_bitwise(self, operands, columns, mask):
+        return mask ^ operands[0] ^ operands[1]
+
+    def _to_zhegalkin(self, operands, variables):
+        xor_polynomial = add_polynomials(*operands)
+
+        return add_polynomials({0}, xor_polynomial)
 
 
-class NorNode(Node):
+class NandNode(BinaryNode):
     """
-    Represents the logical NOR of two operands (negated OR).
+    Represents the logical NAND of two operands (negated AND).
     """
 
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
+    __slots__ = ()
 
-    def simplify(self):
-        return NotNode(OrNode(self.left, self.right)).simplify()
+    symbol = "NAND"
+    template = "mask ^ ({left} & {right})"
 
-    def evaluate(self, variables):
-        return not (self.left.evaluate(variables) or self.right.evaluate(variables))
+    def _simplify(self, operands):
+        return simplify_not(simplify_and(*operands))
 
-    def to_zhegalkin(self, variables):
-        left_polynomial = self.left.to_zhegalkin(variables)
-        right_polynomial = self.right.to_zhegalkin(variables)
-        product = multiply_polynomials(left_polynomial, right_polynomial)
-        or_polynomial = add_polynomials(add_polynomials(left_polynomial, right_polynomial), product)
+    def _evaluate(self, operands, variables):
+        return not (operands[0] and operands[1])
 
-        return add_polynomials({0}, or_polynomial)
+    def _evaluate_bitwise(self, operands, columns, mask):
+        return mask ^ (operands[0] & operands[1])
 
-    def substitute(self, variables):
-        new_left = self.left.substitute(variables)
-        new_right = self.right.substitute(variables)
+    def _to_zhegalkin(self, operands, variables):
+        and_polynomial = multiply_polynomials(*operands)
 
-        return NorNode(new_left, new_right).simplify()
+        return add_polynomials({0}, and_polynomial)
 
-    def __str__(self):
-        return f"({self.left} NOR {self.right})"
 
-    def to_graphviz(self, graph, counter):
-        node_id = str(id(self))
-        graph.node(node_id, "NOR")
-        left_id = self.left.to_graphviz(graph, counter)
-        right_id = self.right.to_graphviz(graph, counter)
-        graph.edge(node_id, left_id)
-        graph.edge(node_id, right_id)
+class NorNode(BinaryNode):
+    """
+    Represents the logical NOR of two operands (negated OR).
+    """
 
-        return node_id
+    __slots__ = ()
+
+    symbol = "NOR"
+    template = "mask ^ ({left} | {right})"
+
+    def _simplify(self, operands):
+        return simplify_not(simplify_or(*operands))
+
+    def _evaluate(self, operands, variables):
+        return not (operands[0] or operands[1])
+
+    def _evaluate_bitwise(self, operands, columns, mask):
+        return mask ^ (operands[0] | operands[1])
+
+    def _to_zhegalkin(self, operands, variables):
+        left_polynomial, right_polynomial = operands
+        product = multiply_polynomials(left_polynomial, right_polynomial)
+        or_polynomial = add_polynomials(add_polynomials(left_polynomial, right_polynomial), product)
+
+        return add_polynomials({0}, or_polynomial)
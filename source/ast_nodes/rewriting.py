@@ -0,0 +1,236 @@
+import time
+from collections import namedtuple
+
+from ast_nodes.nodes import (
+    AndNode, OrNode, NotNode,
+    fold, simplify_and, simplify_or, simplify_not
+)
+
+
+RuleInfo = namedtuple("RuleInfo", ["name", "hits", "seconds"])
+
+
+class RewriteRule:
+    """
+    A named rewrite of a single node. 'function' receives a node whose operands
+    are already rewritten and returns the replacement node, or None when the
+    rule does not apply. 'node_types' lists the node classes it is tried on.
+    """
+
+    __slots__ = ("name", "node_types", "function")
+
+    def __init__(self, name, node_types, function):
+        self.name = name
+        self.node_types = node_types
+        self.function = function
+
+    def __repr__(self):
+        return f"RewriteRule({self.name})"
+
+def rewrite_rule(*node_types):
+    """
+    Decorator turning a function into a RewriteRule named after it.
+    """
+    def decorator(function):
+        return RewriteRule(function.__name__, node_types, function)
+
+    return decorator
+
+
+def _dual(node):
+    return OrNode if type(node) is AndNode else AndNode
+
+def _simplify_nary(node_class, operands):
+    return simplify_and(*operands) if node_class is AndNode else simplify_or(*operands)
+
+@rewrite_rule(AndNode, OrNode)
+def absorption(node):
+    """
+    x AND (x OR y) -> x,  x OR (x AND y) -> x
+    """
+    dual = _dual(node)
+    operands = set(node.operands)
+    kept = [
+        operand for operand in node.operands
+        if type(operand) is not dual or not any(item in operands for item in operand.operands)
+    ]
+
+    if len(kept) == len(node.operands):
+        return None
+
+    return _simplify_nary(type(node), kept)
+
+@rewrite_rule(AndNode, OrNode)
+def redundancy(node):
+    """
+    x AND (NOT x OR y) -> x AND y,  x OR (NOT x AND y) -> x OR y
+    """
+    dual = _dual(node)
+    operands = set(node.operands)
+    negated = {operand.operand for operand in node.operands if isinstance(operand, NotNode)}
+    changed = False
+    result = []
+
+    for operand in node.operands:
+        if type(operand) is dual:
+            reduced = [
+                item for item in operand.operands
+                if item not in negated and not (isinstance(item, NotNode) and item.operand in operands)
+            ]
+
+            if len(reduced) < len(operand.operands):
+                changed = True
+                operand = _simplify_nary(dual, reduced)
+
+        result.append(operand)
+
+    return _simplify_nary(type(node), result) if changed else None
+
+@rewrite_rule(AndNode, OrNode)
+def factoring(node):
+    """
+    (x AND y) OR (x AND z) -> x AND (y OR z),  and the dual for AND of ORs.
+    The operand shared by the most terms is factored out first.
+    """
+    dual = _dual(node)
+    terms = [operand for operand in node.operands if type(operand) is dual]
+    occurrences = {}
+
+    for term in terms:
+        for item in term.operands:
+            occurrences[item] = occurrences.get(item, 0) + 1
+
+    if not occurrences:
+        return None
+
+    common, count = max(occurrences.items(), key=lambda item: item[1])
+
+    if count < 2:
+        return None
+
+    factored = []
+    rest = []
+
+    for operand in node.operands:
+        if type(operand) is dual and common in operand.operands:
+            factored.append(_simplify_nary(dual, [item for item in operand.operands if item is not common]))
+        else:
+            rest.append(operand)
+
+    inner = _simplify_nary(type(node), factored)
+
+    return _simplify_nary(type(node), rest + [_simplify_nary(dual, [common, inner])])
+
+@rewrite_rule(NotNode)
+def de_morgan(node):
+    """
+    NOT (x AND y) -> NOT x OR NOT y,  NOT (x OR y) -> NOT x AND NOT y
+    Applied only when it does not increase the number of negations,
+    i.e. when at least half of the operands are negated.
+    """
+    operand = node.operand
+
+    if type(operand) not in (AndNode, OrNode):
+        return None
+
+    negated_count = sum(1 for item in operand.operands if isinstance(item, NotNode))
+
+    if 2 * negated_count < len(operand.operands):
+        return None
+
+    return _simplify_nary(_dual(operand), [simplify_not(item) for item in operand.operands])
+
+
+DEFAULT_RULES = (absorption, redundancy, factoring, de_morgan)
+
+
+class NodeMemo:
+    """
+    Memo that stores the rewritten form of a node on the node itself,
+    so it lives exactly as long as the (interned) node does.
+    """
+
+    __slots__ = ()
+
+    def get(self, node, default=None):
+        result = node._simplified
+        return default if result is None else result
+
+    def __setitem__(self, node, result):
+        node._simplified = result
+
+
+class RewriteEngine:
+    """
+    Rewrites an AST to a fixed point of a set of rules.
+
+    Every pass folds the tree bottom-up: each node is rebuilt from its rewritten
+    operands with the node's own local rules (constants, duplicates, complements,
+    double negation, lowering of IMP/EQV/NAND/NOR) and then the first matching
+    rule is applied. Passes repeat until the root no longer changes.
+    The result of every subtree is memoized, so shared and already
+    rewritten subtrees are not processed again.
+
+    The rules must not grow the expression without bound, otherwise the
+    fixed point is never reached.
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, memo=None):
+        self.rules = tuple(rules)
+        self.memo = {} if memo is None else memo
+        self._rules_by_type = {}
+        self._hits = {rule.name: 0 for rule in self.rules}
+        self._seconds = {rule.name: 0.0 for rule in self.rules}
+
+        for rule in self.rules:
+            for node_type in rule.node_types:
+                self._rules_by_type.setdefault(node_type, []).append(rule)
+
+    def rewrite(self, root):
+        current = root
+
+        while True:
+            result = fold(current, self._combine)
+
+            if result is current:
+                break
+            current = result
+
+        self.memo[root] = current
+
+        return current
+
+    def rule_info(self):
+        """
+        Return the number of times each rule fired and the time spent trying it.
+        """
+        return [RuleInfo(rule.name, self._hits[rule.name], self._seconds[rule.name]) for rule in self.rules]
+
+    def reset_statistics(self):
+        for rule in self.rules:
+            self._hits[rule.name] = 0
+            self._seconds[rule.name] = 0.0
+
+    def _combine(self, node, operands):
+        result = self.memo.get(node)
+
+        if result is None:
+            result = self._apply_rules(node._simplify(operands))
+            self.memo[node] = result
+
+        return result
+
+    def _apply_rules(self, node):
+        for rule in self._rules_by_type.get(type(node), ()):
+            start = time.perf_counter()
+            result = rule.function(node)
+            self._seconds[rule.name] += time.perf_counter() - start
+
+            if result is not None and result is not node:
+                self._hits[rule.name] += 1
+                return result
+
+        return node
+
+
+default_engine = RewriteEngine(memo=NodeMemo())
@@ -0,0 +1,880 @@
+import os
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from itertools import product
+
+from ast_nodes.nodes import AndNode, OrNode, XorNode, NotNode, VariableNode, Node, postorder
+from ast_nodes.rewriting import RewriteEngine
+from boolean_logic.boolean_functions import BooleanFunction, BooleanFunctionSet, count_literals
+from boolean_logic.covering import CoveringSolver
+from boolean_logic.espresso import espresso
+from boolean_logic.helpers import truth_table_columns, truth_table_mask
+from boolean_logic.multi_output import MultiOutputCover, cover_netlist, minimize_multi_output
+from boolean_logic.ordering import ORDERING_METHODS, ordered_bdd
+from boolean_logic.quine_mccluskey import find_essential_prime_implicants_with_dont_cares, prime_implicants
+from boolean_logic.result_store import ResultStore, warm
+from boolean_logic.truth_table import TruthTable
+from parser_lexer.lexer import Lexer
+from parser_lexer.parser import Parser
+
+
+def variable_names(count):
+    """
+    Return 'count' distinct variable names made only of letters (A, B, ..., Z, AA, AB, ...),
+    since the lexer does not accept digits in identifiers.
+    """
+    names = []
+
+    for index in range(count):
+        name = ""
+        index += 1
+
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            name = chr(ord("A") + remainder) + name
+        names.append(name)
+
+    return names
+
+def report(title, rows):
+    """
+    Print a simple aligned table of benchmark results.
+    """
+    print(title)
+
+    for row in rows:
+        print("  " + "  ".join(f"{str(cell):>14}" for cell in row))
+    print()
+
+def benchmark_compiled_evaluation():
+    """
+    Compare the tree-walking evaluate() with the compiled evaluator
+    over every assignment of a mixed-operator expression, and with one
+    bit-parallel call of the compiled evaluator over packed columns.
+    """
+    rows = [("variables", "tree walk (s)", "compiled (s)", "speedup", "packed (s)")]
+
+    for variables_count in (6, 10, 14):
+        names = variable_names(variables_count)
+        expression = " OR ".join(
+            f"({first} AND NOT {second}) XOR ({second} IMP {third})"
+            for first, second, third in zip(names, names[1:] + names[:1], names[2:] + names[:2])
+        )
+        boolean_function = BooleanFunction(expression)
+        assignments = list(product([0, 1], repeat=variables_count))
+        compiled = boolean_function.compile()
+        columns = list(truth_table_columns(boolean_function.variables).values())
+        mask = truth_table_mask(variables_count)
+
+        def tree_walk():
+            for values in assignments:
+                boolean_function.evaluate(dict(zip(boolean_function.variables, values)))
+
+        def compiled_walk():
+            for values in assignments:
+                compiled(*values)
+
+        tree_time = min(timeit.repeat(tree_walk, number=1, repeat=3))
+        compiled_time = min(timeit.repeat(compiled_walk, number=1, repeat=3))
+        packed_time = min(timeit.repeat(lambda: compiled(*columns, mask), number=1, repeat=3))
+        rows.append((
+            variables_count, f"{tree_time:.4f}", f"{compiled_time:.4f}",
+            f"{tree_time / compiled_time:.1f}x", f"{packed_time:.6f}"
+            ))
+
+    report("Compiled evaluation", rows)
+
+def benchmark_monotonicity():
+    """
+    Time the bit-parallel monotonicity check from 4 to 20 variables on a monotone
+    function (the worst case, every variable is checked), next to the former
+    all-pairs comparison for the sizes where it is still feasible.
+    """
+    rows = [("variables", "all pairs (s)", "bitset (s)")]
+
+    for variables_count in (4, 6, 8, 10, 12, 14, 16, 18, 20):
+        names = variable_names(variables_count)
+        expression = " OR ".join(f"({first} AND {second})" for first, second in zip(names, names[1:]))
+        boolean_function = BooleanFunction(expression)
+        truth_table = boolean_function.get_truth_table()
+
+        def all_pairs():
+            rows_list = list(truth_table)
+
+            return all(
+                result1 <= result2 
+                for values1, result1 in rows_list for values2, result2 in rows_list
+                if all(v1 <= v2 for v1, v2 in zip(values1, values2))
+                )
+
+        pairs_time = "-"
+
+        if variables_count <= 8:
+            pairs_time = f"{min(timeit.repeat(all_pairs, number=1, repeat=3)):.4f}"
+
+        bitset_time = min(timeit.repeat(boolean_function.monotonicity_witness, number=1, repeat=3))
+        rows.append((variables_count, pairs_time, f"{bitset_time:.6f}"))
+
+    report("Monotonicity check", rows)
+
+def build_balanced_expression(nodes_count, node_types, variable_node):
+    """
+    Build a balanced expression of roughly 'nodes_count' nodes bottom-up (without
+    recursion) over randomly drawn leaves, cycling through the binary 'node_types'
+    and negating every seventh node, so that interning finds few identical subtrees.
+    """
+    leaves_count = nodes_count // 2
+    names = variable_names(2000)
+    generator = random.Random(nodes_count)
+    layer = [variable_node(generator.choice(names)) for _ in range(leaves_count)]
+    built = leaves_count
+
+    while len(layer) > 1:
+        next_layer = []
+
+        for index in range(0, len(layer) - 1, 2):
+            node = node_types[built % len(node_types)](layer[index], layer[index + 1])
+
+            if built % 7 == 0:
+                node = NotNode(node)
+                built += 1
+
+            next_layer.append(node)
+            built += 1
+
+        if len(layer) % 2:
+            next_layer.append(layer[-1])
+        layer = next_layer
+
+    return layer[0]
+
+def benchmark_node_memory():
+    """
+    Measure the memory held by expressions with 10^5 to 10^6 nodes built from the
+    slotted, interned AST classes, against plain __dict__-based node objects of
+    the same shape. The traced totals include the intern table entries, which
+    the plain objects do not have; the per-object columns compare the nodes alone.
+    """
+
+    class DictNode:
+        def __init__(self, left, right=None):
+            self.left = left
+            self.right = right
+
+    leaf = VariableNode("A")
+    slotted_object_size = sys.getsizeof(AndNode(leaf, NotNode(leaf)))
+    dict_node = DictNode(leaf, leaf)
+    dict_object_size = sys.getsizeof(dict_node) + sys.getsizeof(dict_node.__dict__)
+    rows = [(
+        "nodes", "distinct", "slotted obj B", "dict obj B", 
+        "slotted B/node", "dict B/node"
+        )]
+
+    for nodes_count in (10 ** 5, 10 ** 6):
+        interned_before = len(Node._intern_table)
+        tracemalloc.start()
+        root = build_balanced_expression(nodes_count, (AndNode, OrNode, XorNode), VariableNode)
+        slotted_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        distinct_count = len(Node._intern_table) - interned_before
+        del root
+
+        tracemalloc.start()
+        root = build_balanced_expression(nodes_count, (DictNode,), DictNode)
+        dict_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del root
+
+        rows.append((
+            nodes_count, distinct_count, slotted_object_size, dict_object_size,
+            slotted_size // distinct_count, dict_size // nodes_count
+            ))
+
+    report("AST node memory", rows)
+
+def benchmark_lexer_throughput():
+    """
+    Measure lexer throughput (tokens per second) on long expressions, for the
+    materialized token list, the lazy token stream, and lexing plus parsing.
+    """
+    rows = [("tokens", "tokenize tok/s", "iter tok/s", "parse tok/s")]
+    names = variable_names(200)
+    operators = ["AND", "||", "XOR", "=>", "&", "NOR", "<=>", "nand"]
+
+    for terms_count in (10 ** 3, 10 ** 4, 10 ** 5):
+        expression = " ".join(
+            f"{operators[index % len(operators)]} ({'NOT ' if index % 3 else ''}{names[index % len(names)]})"
+            for index in range(terms_count)
+        )[len(operators[0]) + 1:]
+        tokens_count = len(Lexer(expression).tokenize())
+
+        def tokenize():
+            Lexer(expression).tokenize()
+
+        def iterate():
+            for _ in Lexer(expression).iter_tokens():
+                pass
+
+        def parse():
+            Parser(Lexer(expression).iter_tokens()).parse()
+
+        timings = [min(timeit.repeat(function, number=1, repeat=3)) for function in (tokenize, iterate, parse)]
+        rows.append((tokens_count, *(f"{tokens_count / timing:,.0f}" for timing in timings)))
+
+    report("Lexer throughput", rows)
+
+def random_expression(generator, depth, names):
+    """
+    Build a random expression string of at most the given depth over 'names',
+    with every operator of the grammar, constants and negations.
+    """
+    operators = ["AND", "OR", "XOR", "IMP", "EQV", "NAND", "NOR"]
+    # Iterative generation: the stack holds subexpression depths and literal text.
+    stack = [depth]
+    pieces = []
+
+    while stack:
+        item = stack.pop()
+
+        if isinstance(item, str):
+            pieces.append(item)
+        elif item == 0 or generator.random() < 0.15:
+            pieces.append(generator.choice(names) if generator.random() < 0.95 else generator.choice("01"))
+        else:
+            if generator.random() < 0.25:
+                pieces.append("NOT")
+
+            pieces.append("(")
+            stack.extend([")", item - 1, generator.choice(operators), item - 1])
+
+    return " ".join(pieces)
+
+def benchmark_simplification():
+    """
+    Compare the size (distinct AST nodes) and runtime of simplifying a corpus of
+    random expressions with the local rules only against the full rewrite engine,
+    and report how often each rule fired and the time spent in it.
+    """
+    rows = [("depth", "nodes", "local nodes", "local (s)", "rules nodes", "rules (s)")]
+    generator = random.Random(14)
+    names = variable_names(8)
+    rules_engine = RewriteEngine()
+
+    for depth in (4, 6, 8, 10):
+        corpus = [
+            Parser(Lexer(random_expression(generator, depth, names)).iter_tokens()).parse()
+            for _ in range(200)
+        ]
+        sizes = [sum(1 for _ in postorder(root)) for root in corpus]
+        results = []
+
+        for engine in (RewriteEngine(rules=()), rules_engine):
+            engine.memo.clear()
+            start = timeit.default_timer()
+            simplified = [engine.rewrite(root) for root in corpus]
+            elapsed = timeit.default_timer() - start
+            results.append((sum(sum(1 for _ in postorder(root)) for root in simplified), elapsed))
+
+        (local_size, local_time), (rules_size, rules_time) = results
+        rows.append((depth, sum(sizes), local_size, f"{local_time:.4f}", rules_size, f"{rules_time:.4f}"))
+
+    report("Simplification of random expressions", rows)
+    report("Rewrite rules", [("rule", "hits", "seconds")] + [
+        (info.name, info.hits, f"{info.seconds:.4f}") for info in rules_engine.rule_info()
+    ])
+
+def benchmark_variable_ordering():
+    """
+    BDD node counts and build times per variable ordering method on functions
+    whose alphabetical order is exponentially bad: a sum of products of pairs
+    (AA AND BA) OR (AB AND BB) OR ..., and a comparator of two words A* = B*.
+    """
+    rows = [("function", "pairs", "method", "nodes", "seconds")]
+
+    for pairs_count in (4, 8, 12):
+        letters = [name.lower() for name in variable_names(pairs_count)]
+        functions = {
+            "pairs": " OR ".join(f"(A{letter} AND B{letter})" for letter in letters),
+            "comparator": " AND ".join(f"(A{letter} EQV B{letter})" for letter in letters),
+        }
+
+        for function_name, expression in functions.items():
+            ast = Parser(Lexer(expression).iter_tokens()).parse()
+
+            for method in ORDERING_METHODS:
+                start = timeit.default_timer()
+                manager, roots = ordered_bdd([ast], method)
+                elapsed = timeit.default_timer() - start
+                rows.append((function_name, pairs_count, method, manager.node_count(*roots), f"{elapsed:.4f}"))
+
+    report("Variable ordering", rows)
+
+def benchmark_equivalence():
+    """
+    Time equivalence checks of two structurally different forms of the same
+    function, (a AND (b OR c)) versus ((a AND b) OR (c AND a)) over groups joined
+    by XOR, with the SAT solver on the miter, shared BDDs and packed truth tables.
+    """
+    rows = [("variables", "SAT (s)", "BDD (s)", "truth table (s)")]
+
+    for variables_count in (12, 24, 48, 99, 201):
+        names = variable_names(variables_count)
+        groups = list(zip(names[0::3], names[1::3], names[2::3]))
+        expression1 = " XOR ".join(f"({a} AND ({b} OR {c}))" for a, b, c in groups)
+        expression2 = " XOR ".join(f"(({a} AND {b}) OR ({c} AND {a}))" for a, b, c in groups)
+        boolean_function1 = BooleanFunction(expression1)
+        boolean_function2 = BooleanFunction(expression2)
+
+        def truth_tables():
+            # Fresh instances, so that the memoized truth vectors are not reused.
+            return BooleanFunction(expression1).get_truth_vector() == BooleanFunction(expression2).get_truth_vector()
+
+        sat_time = min(timeit.repeat(lambda: boolean_function1.is_equivalent(boolean_function2), number=1, repeat=3))
+        bdd_time = min(timeit.repeat(lambda: boolean_function1.is_equivalent(boolean_function2, "bdd"), number=1, repeat=3))
+        table_time = "-"
+
+        if variables_count <= 24:
+            table_time = f"{min(timeit.repeat(truth_tables, number=1, repeat=3)):.4f}"
+
+        rows.append((variables_count, f"{sat_time:.4f}", f"{bdd_time:.4f}", table_time))
+
+    report("Equivalence checking", rows)
+
+def benchmark_difference_measure():
+    """
+    Time difference_measure between a sum of products of pairs and the same sum
+    without its first product: enumerating the assignments with dict environments
+    (the former GUI code), bit-parallel enumeration, and BDD sat_count.
+    """
+    rows = [("variables", "dict walk (s)", "bit-parallel (s)", "BDD (s)", "difference")]
+
+    for variables_count in (8, 12, 16, 20, 40, 100, 200):
+        names = variable_names(variables_count)
+        expression = " OR ".join(f"({first} AND {second})" for first, second in zip(names[0::2], names[1::2]))
+        boolean_function1 = BooleanFunction(expression)
+        boolean_function2 = BooleanFunction(expression.split(" OR ", 1)[1])
+
+        def dict_walk():
+            variables = boolean_function1.variables
+
+            return sum(
+                boolean_function1.evaluate(dict(zip(variables, values))) !=
+                boolean_function2.evaluate(dict(zip(variables[2:], values[2:])))
+                for values in product([0, 1], repeat=len(variables))
+                )
+
+        def measure(method):
+            return min(timeit.repeat(
+                lambda: boolean_function1.difference_measure(boolean_function2, method), number=1, repeat=3
+                ))
+
+        walk_time = f"{min(timeit.repeat(dict_walk, number=1, repeat=1)):.4f}" if variables_count <= 12 else "-"
+        enumeration_time = f"{measure('enumeration'):.4f}" if variables_count <= 20 else "-"
+        rows.append((
+            variables_count, walk_time, enumeration_time, f"{measure('bdd'):.4f}",
+            boolean_function1.difference_measure(boolean_function2)
+            ))
+
+    report("Difference measure", rows)
+
+def string_prime_implicants(minterms, variables_count):
+    """
+    The former string-based prime implicant generation ("1-0-" terms merged by
+    zipping characters), kept as the reference for benchmark_quine_mccluskey.
+    """
+    current_groups = {}
+
+    for term in minterms:
+        current_groups.setdefault(bin(term).count("1"), []).append(f"{term:0{variables_count}b}")
+
+    primes = set()
+
+    while True:
+        new_terms = set()
+        checked = set()
+        group_keys = sorted(current_groups)
+
+        for group_index in range(len(group_keys) - 1):
+            for term1 in current_groups[group_keys[group_index]]:
+                for term2 in current_groups[group_keys[group_index + 1]]:
+                    if sum(c1 != c2 for c1, c2 in zip(term1, term2)) == 1:
+                        position = next(index for index, (c1, c2) in enumerate(zip(term1, term2)) if c1 != c2)
+                        new_terms.add(term1[:position] + "-" + term1[position + 1:])
+                        checked.update((term1, term2))
+
+        primes.update(term for group in current_groups.values() for term in group if term not in checked)
+
+        if not new_terms:
+            return primes
+
+        current_groups = {}
+
+        for term in new_terms:
+            current_groups.setdefault(term.count("1"), []).append(term)
+
+def benchmark_quine_mccluskey():
+    """
+    Compare prime implicant generation with string terms against (value, mask)
+    integer implicants, on random functions with a quarter of the rows set.
+    """
+    rows = [("variables", "minterms", "primes", "strings (s)", "integers (s)", "speedup")]
+    generator = random.Random(19)
+
+    for variables_count in (8, 10, 11, 12, 13, 14):
+        minterms = generator.sample(range(1 << variables_count), (1 << variables_count) // 4)
+        integer_time = min(timeit.repeat(lambda: prime_implicants(minterms, variables_count), number=1, repeat=3))
+        primes_count = len(prime_implicants(minterms, variables_count))
+        string_time = "-"
+        speedup = "-"
+
+        if variables_count <= 12:
+            string_seconds = min(timeit.repeat(
+                lambda: string_prime_implicants(minterms, variables_count), number=1, repeat=1
+                ))
+            string_time = f"{string_seconds:.4f}"
+            speedup = f"{string_seconds / integer_time:.0f}x"
+
+        rows.append((variables_count, len(minterms), primes_count, string_time, f"{integer_time:.4f}", speedup))
+
+    report("Quine-McCluskey prime implicants", rows)
+
+
+def benchmark_parallel_quine_mccluskey():
+    """
+    Time prime implicant generation with 1 to 16 worker processes, on random
+    functions with a quarter of the rows set (the speedup is bounded by the
+    cores of the machine).
+    """
+    rows = [("variables", "minterms", "workers", "time (s)", "speedup")]
+    generator = random.Random(23)
+
+    for variables_count in (12, 14, 16):
+        minterms = generator.sample(range(1 << variables_count), (1 << variables_count) // 4)
+        serial_time = None
+
+        for workers in (1, 2, 4, 8, 16):
+            seconds = min(timeit.repeat(
+                lambda: prime_implicants(minterms, variables_count, workers=workers), number=1, repeat=2
+                ))
+
+            if serial_time is None:
+                serial_time = seconds
+
+            rows.append((variables_count, len(minterms), workers, f"{seconds:.4f}", f"{serial_time / seconds:.2f}x"))
+
+    report(f"Parallel Quine-McCluskey prime implicants ({os.cpu_count()} cores)", rows)
+
+
+def backtracking_cover(primes, minterms):
+    """
+    The former covering step: essential prime implicants, then an include/exclude
+    search over the remaining ones in sorted order, bounded only by the best size
+    found. Kept as the reference for benchmark_covering.
+    """
+    coverage = {
+        prime: sum(1 << position for position, minterm in enumerate(minterms) if minterm & ~prime[1] == prime[0])
+        for prime in primes
+        }
+    all_minterms = (1 << len(minterms)) - 1
+    essentials = set()
+
+    for position in range(len(minterms)):
+        covering = [prime for prime, covered in coverage.items() if covered >> position & 1]
+
+        if len(covering) == 1:
+            essentials.add(covering[0])
+
+    covered = 0
+
+    for prime in essentials:
+        covered |= coverage[prime]
+
+    best = None
+
+    def backtrack(selected, covered, candidates):
+        nonlocal best
+
+        if best is not None and len(selected) >= len(best):
+            return
+        if covered == all_minterms:
+            best = selected[:]
+            return
+        if not candidates:
+            return
+
+        selected.append(candidates[0])
+        backtrack(selected, covered | coverage[candidates[0]], candidates[1:])
+        selected.pop()
+        backtrack(selected, covered, candidates[1:])
+
+    backtrack([], covered, sorted(set(primes) - essentials))
+
+    return essentials.union(best)
+
+def cyclic_functions():
+    """
+    Functions whose covering tables have no essential prime implicant: the classic
+    three-variable cycle, the "not all equal" functions (rings of n(n - 1) primes)
+    and functions with two or three ones among n variables.
+    """
+    functions = [("cycle m(0,1,2,5,6,7)", 3, [0, 1, 2, 5, 6, 7])]
+
+    for variables_count in (5, 6, 7, 8):
+        functions.append((
+            f"not all equal, n={variables_count}", variables_count,
+            [minterm for minterm in range(1 << variables_count) if 0 < minterm.bit_count() < variables_count]
+            ))
+
+    for variables_count in (5, 6, 7):
+        functions.append((
+            f"2 or 3 ones, n={variables_count}", variables_count,
+            [minterm for minterm in range(1 << variables_count) if minterm.bit_count() in (2, 3)]
+            ))
+
+    return functions
+
+def benchmark_covering():
+    """
+    Compare the former backtracking cover with the branch-and-bound CoveringSolver
+    on cyclic covering problems, reporting the cyclic core left by the reductions.
+    """
+    rows = [("function", "primes", "cyclic core", "branches", "cover", "backtrack (s)", "B&B (s)")]
+
+    for name, variables_count, minterms in cyclic_functions():
+        primes = sorted(prime_implicants(minterms, variables_count))
+        coverage = [
+            sum(1 << position for position, minterm in enumerate(minterms) if minterm & ~mask == value)
+            for value, mask in primes
+            ]
+        solver = CoveringSolver(coverage)
+        solver_time = min(timeit.repeat(lambda: solver.solve(), number=1, repeat=3))
+        cover = solver.solve()
+        backtrack_time = "-"
+
+        if len(primes) <= 24:
+            backtrack_time = min(timeit.repeat(lambda: backtracking_cover(primes, minterms), number=1, repeat=1))
+            assert len(backtracking_cover(primes, minterms)) == len(cover)
+            backtrack_time = f"{backtrack_time:.4f}"
+
+        core_rows, core_columns = solver.cyclic_core
+        rows.append((
+            name, len(primes), f"{core_rows}x{core_columns}", solver.branches,
+            len(cover), backtrack_time, f"{solver_time:.4f}"
+            ))
+
+    report("Unate covering of cyclic cores", rows)
+
+def benchmark_espresso():
+    """
+    Compare exact minimization (Quine-McCluskey and the covering solver) with
+    Espresso on random functions, then run Espresso alone on structured
+    functions far beyond the exact range, starting from the ISOP of their BDD.
+    """
+    rows = [("variables", "minterms", "exact cubes", "exact (s)", "espresso cubes", "espresso (s)")]
+    generator = random.Random(20)
+
+    for variables_count in (6, 8, 9, 10):
+        minterms = generator.sample(range(1 << variables_count), (1 << variables_count) // 4)
+        start = timeit.default_timer()
+        exact = find_essential_prime_implicants_with_dont_cares(
+            prime_implicants(minterms, variables_count), minterms, variables_count, time_limit=30
+            )
+        exact_time = timeit.default_timer() - start
+        start = timeit.default_timer()
+        heuristic = espresso([(minterm, 0) for minterm in minterms], [], variables_count)
+        heuristic_time = timeit.default_timer() - start
+        rows.append((
+            variables_count, len(minterms), len(exact), f"{exact_time:.4f}",
+            len(heuristic), f"{heuristic_time:.4f}"
+            ))
+
+    report("Exact vs Espresso, random functions", rows)
+
+    rows = [("function", "variables", "terms", "minimize (s)")]
+
+    for variables_count in (16, 24, 32, 40):
+        names = variable_names(variables_count)
+        pairs = [(names[index], names[index + 1]) for index in range(0, variables_count, 2)]
+        expressions = {
+            "sum of pairs": " OR ".join(f"({first} AND NOT {second})" for first, second in pairs),
+            "majority chain": " OR ".join(
+                f"({first} AND {second} AND {third})"
+                for first, second, third in zip(names, names[1:], names[2:])
+                ),
+            "mux tree": " OR ".join(
+                f"(({first} AND {second}) OR (NOT {first} AND {third}))"
+                for first, second, third in zip(names[0::3], names[1::3], names[2::3])
+                ),
+            }
+
+        for name, expression in expressions.items():
+            boolean_function = BooleanFunction(expression)
+            start = timeit.default_timer()
+            minimized = boolean_function.minimize("heuristic")
+            rows.append((
+                name, len(boolean_function.variables), minimized.count(" OR ") + 1,
+                f"{timeit.default_timer() - start:.4f}"
+                ))
+
+    report("Espresso from the ISOP of the BDD", rows)
+
+
+def minterms_expression(minterms, names):
+    """
+    The sum of the given minterms as an expression string over 'names'.
+    """
+    return " OR ".join(
+        "(" + " AND ".join(
+            name if minterm >> (len(names) - index - 1) & 1 else f"NOT {name}"
+            for index, name in enumerate(names)
+            ) + ")"
+        for minterm in minterms
+        )
+
+def cover_size(minimized):
+    """
+    Number of products and of literals of a minimized sum-of-products string.
+    """
+    if minimized in ("0", "1"):
+        return 0, 0
+
+    tokens = minimized.replace("(", " ").replace(")", " ").split()
+
+    return minimized.count(" OR ") + 1, sum(token not in ("AND", "OR", "NOT") for token in tokens)
+
+SEVEN_SEGMENT_DIGITS = {
+    "a": [0, 2, 3, 5, 6, 7, 8, 9],
+    "b": [0, 1, 2, 3, 4, 7, 8, 9],
+    "c": [0, 1, 3, 4, 5, 6, 7, 8, 9],
+    "d": [0, 2, 3, 5, 6, 8, 9],
+    "e": [0, 2, 6, 8],
+    "f": [0, 4, 5, 6, 8, 9],
+    "g": [2, 3, 4, 5, 6, 8, 9],
+}
+
+def benchmark_dont_cares():
+    """
+    Measure how don't cares shrink the minimized covers and the runtime: the
+    segments of a BCD to seven-segment decoder (inputs 10 to 15 never occur),
+    then random functions with a growing share of their off-set left free.
+    """
+    rows = [("segment", "cubes/literals", "with don't cares", "time (s)", "with don't cares (s)")]
+    names = variable_names(4)
+
+    for segment, digits in SEVEN_SEGMENT_DIGITS.items():
+        expression = minterms_expression(digits, names)
+        start = timeit.default_timer()
+        plain = BooleanFunction(expression).minimize()
+        plain_time = timeit.default_timer() - start
+        start = timeit.default_timer()
+        relaxed = BooleanFunction(expression, dont_cares=range(10, 16)).minimize()
+        relaxed_time = timeit.default_timer() - start
+        rows.append((
+            segment, "/".join(map(str, cover_size(plain))), "/".join(map(str, cover_size(relaxed))),
+            f"{plain_time:.4f}", f"{relaxed_time:.4f}"
+            ))
+
+    report("Seven-segment decoder with don't cares", rows)
+
+    rows = [("variables", "method", "don't cares", "cubes", "literals", "time (s)")]
+    generator = random.Random(21)
+
+    for variables_count, method in ((8, "exact"), (10, "exact"), (10, "heuristic"), (12, "heuristic")):
+        names = variable_names(variables_count)
+        rows_count = 1 << variables_count
+        minterms = generator.sample(range(rows_count), rows_count // 4)
+        off_set = sorted(set(range(rows_count)) - set(minterms))
+        expression = minterms_expression(minterms, names)
+
+        for share in (0, 0.1, 0.25, 0.5):
+            dont_cares = generator.sample(off_set, int(share * len(off_set)))
+            boolean_function = BooleanFunction(expression, dont_cares=dont_cares)
+            start = timeit.default_timer()
+            minimized = boolean_function.minimize(method, time_limit=10)
+            elapsed = timeit.default_timer() - start
+            rows.append((variables_count, method, f"{share:.0%}", *cover_size(minimized), f"{elapsed:.4f}"))
+
+    report("Random functions with don't cares", rows)
+
+
+def benchmark_minimization_forms():
+    """
+    Compare the literals of the sum of products, product of sums and exclusive
+    sum of products of parity, product-of-clauses and random functions, with
+    the form minimize(form="best") picks and the time of the exclusive sum.
+    """
+    rows = [("function", "variables", "sop", "pos", "esop", "best", "esop time (s)")]
+    generator = random.Random(24)
+
+    for variables_count in (4, 6, 8, 10):
+        names = variable_names(variables_count)
+        clauses = [
+            " OR ".join(name if generator.random() < 0.5 else f"NOT {name}" for name in generator.sample(names, 3))
+            for _ in range(variables_count // 2)
+            ]
+        minterms = generator.sample(range(1 << variables_count), 1 << (variables_count - 1))
+        functions = (
+            ("parity", " XOR ".join(names)),
+            ("clauses", " AND ".join(f"({clause})" for clause in clauses)),
+            ("random", minterms_expression(minterms, names)),
+            )
+
+        for name, expression in functions:
+            boolean_function = BooleanFunction(expression)
+            literals = [
+                count_literals(boolean_function.minimized_terms(time_limit=10, form=form))
+                for form in ("sop", "pos")
+                ]
+            start = timeit.default_timer()
+            literals.append(count_literals(boolean_function.minimized_terms(time_limit=10, form="esop")))
+            esop_time = timeit.default_timer() - start
+            best = ("sop", "pos", "esop")[literals.index(min(literals))]
+            rows.append((name, variables_count, *literals, best, f"{esop_time:.4f}"))
+
+    report("Minimization forms (literals)", rows)
+
+
+def benchmark_result_store():
+    """
+    Time warming an empty store with random functions (cold: every result
+    computed without a time limit) and then minimize(form="best") by a new
+    BooleanFunction under the default time limit (warm), with its store hits.
+    """
+    rows = [("variables", "cold (s)", "warm (s)", "warm hits", "stored bytes")]
+    generator = random.Random(25)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ResultStore(f"{directory}/results.sqlite")
+        BooleanFunction.result_store = store
+
+        try:
+            for variables_count in (8, 10, 12):
+                names = variable_names(variables_count)
+                minterms = generator.sample(range(1 << variables_count), 1 << (variables_count - 2))
+                expression = minterms_expression(minterms, names)
+                start = timeit.default_timer()
+                warm(store, [expression])
+                cold_time = timeit.default_timer() - start
+                hits = store.hits
+                start = timeit.default_timer()
+                BooleanFunction(expression).minimize(form="best")
+                warm_time = timeit.default_timer() - start
+                rows.append((
+                    variables_count, f"{cold_time:.4f}", f"{warm_time:.4f}", store.hits - hits, store.stats()["bytes"]
+                    ))
+        finally:
+            BooleanFunction.result_store = None
+            store.close()
+
+    report("Persistent result store", rows)
+
+
+def independent_covers(on_sets, dont_care_sets, variables_count):
+    """
+    Minimize every output on its own with Quine-McCluskey and return the covers
+    as single-output MultiOutputCover objects.
+    """
+    covers = []
+
+    for on_set, dont_cares in zip(on_sets, dont_care_sets):
+        minterms = list(TruthTable(on_set, variables_count).minterms())
+        dont_care_minterms = list(TruthTable(dont_cares, variables_count).minterms())
+        products = sorted(find_essential_prime_implicants_with_dont_cares(
+            prime_implicants(minterms, variables_count, dont_care_minterms), minterms, variables_count
+            )) if minterms else []
+        covers.append(MultiOutputCover(products, [list(range(len(products)))]))
+
+    return covers
+
+def benchmark_multi_output():
+    """
+    Compare the gates of separately drawn circuits, of independently minimized
+    outputs merged into one netlist (identical products shared), and of the
+    joint multi-output minimization, with the time of both minimizations
+    (the joint covering problem is larger: it gets a budget of 5 seconds).
+    """
+    rows = [(
+        "block", "outputs", "separate gates", "merged gates", "joint gates",
+        "independent (s)", "joint (s)"
+        )]
+    blocks = []
+    names = variable_names(4)
+    function_set = BooleanFunctionSet()
+
+    for digits in SEVEN_SEGMENT_DIGITS.values():
+        function_set.add_function(BooleanFunction(minterms_expression(digits, names), dont_cares=range(10, 16)))
+
+    _, variables, on_sets, dont_care_sets = function_set.output_vectors()
+    blocks.append(("seven segments", variables, on_sets, dont_care_sets))
+    generator = random.Random(22)
+
+    for variables_count, outputs_count in ((6, 4), (6, 8), (8, 4), (8, 8)):
+        rows_count = 1 << variables_count
+        # Outputs built from a few common terms, as in control logic.
+        terms = [generator.getrandbits(rows_count) & generator.getrandbits(rows_count) for _ in range(6)]
+        on_sets = [
+            terms[generator.randrange(6)] | terms[generator.randrange(6)] |
+            (generator.getrandbits(rows_count) & generator.getrandbits(rows_count) & generator.getrandbits(rows_count))
+            for _ in range(outputs_count)
+            ]
+        blocks.append((f"random, n={variables_count}", variable_names(variables_count), on_sets, [0] * outputs_count))
+
+    for name, variables, on_sets, dont_care_sets in blocks:
+        variables_count = len(variables)
+        output_names = [f"F{index}" for index in range(len(on_sets))]
+        start = timeit.default_timer()
+        covers = independent_covers(on_sets, dont_care_sets, variables_count)
+        independent_time = timeit.default_timer() - start
+        start = timeit.default_timer()
+        joint = minimize_multi_output(on_sets, dont_care_sets, variables_count, time_limit=5)
+        joint_time = timeit.default_timer() - start
+
+        separate_gates = sum(
+            cover_netlist(cover, variables, [output_name]).gate_count()
+            for cover, output_name in zip(covers, output_names)
+            )
+        products = sorted({product for cover in covers for product in cover.products})
+        merged = MultiOutputCover(
+            products, [[products.index(product) for product in cover.products] for cover in covers]
+            )
+        rows.append((
+            name, len(on_sets), separate_gates,
+            cover_netlist(merged, variables, output_names).gate_count(),
+            cover_netlist(joint, variables, output_names).gate_count(),
+            f"{independent_time:.4f}", f"{joint_time:.4f}"
+            ))
+
+    report("Multi-output minimization", rows)
+
+
+BENCHMARKS = {
+    "compiled_evaluation": benchmark_compiled_evaluation,
+    "monotonicity": benchmark_monotonicity,
+    "node_memory": benchmark_node_memory,
+    "lexer_throughput": benchmark_lexer_throughput,
+    "simplification": benchmark_simplification,
+    "variable_ordering": benchmark_variable_ordering,
+    "equivalence": benchmark_equivalence,
+    "difference_measure": benchmark_difference_measure,
+    "quine_mccluskey": benchmark_quine_mccluskey,
+    "parallel_quine_mccluskey": benchmark_parallel_quine_mccluskey,
+    "covering": benchmark_covering,
+    "espresso": benchmark_espresso,
+    "dont_cares": benchmark_dont_cares,
+    "minimization_forms": benchmark_minimization_forms,
+    "result_store": benchmark_result_store,
+    "multi_output": benchmark_multi_output,
+}
+
+
+def main():
+    selected = sys.argv[1:] or list(BENCHMARKS)
+
+    for name in selected:
+        BENCHMARKS[name]()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+import sys
+import time
+
+from boolean_logic.memoization import LRUCache
+
+
+FALSE = 0
+TRUE = 1
+
+# Level of the two terminal nodes: below every variable.
+TERMINAL_LEVEL = sys.maxsize
+
+
+class BudgetExceeded(RuntimeError):
+    """
+    Raised when building a diagram needs more nodes or time than its manager allows.
+    """
+
+
+class BDD:
+    """
+    A manager of Reduced Ordered Binary Decision Diagrams over a fixed variable order.
+
+    Nodes are small integers: 0 and 1 are the terminals, every other node is
+    a (level, low, high) triple stored once in the unique table, so two nodes
+    of the same manager represent the same function exactly when they are
+    the same integer. Results of ite() are kept in an LRU computed table.
+
+    Operations walk the diagram with explicit stacks rather than recursion, so
+    the number of variables is bounded only by memory, as for the ASTs.
+
+    'max_nodes' and 'deadline' (a time.perf_counter() value) bound the work:
+    creating a node beyond either raises BudgetExceeded.
+
+    The order can be changed in place by swapping adjacent levels (see
+    swap_levels): a node keeps its integer and its function, so roots stay valid.
+    """
+
+    def __init__(self, variables, cache_size=1 << 18, max_nodes=None, deadline=None):
+        self.max_nodes = max_nodes
+        self.deadline = deadline
+        self.variables = []
+        self.levels = {}
+        self._levels = [TERMINAL_LEVEL, TERMINAL_LEVEL]
+        self._lows = [FALSE, TRUE]
+        self._highs = [FALSE, TRUE]
+        self._unique = {}
+        self.computed = LRUCache(maxsize=cache_size)
+        # Reference counts and per-level nodes, kept only while reordering.
+        self._references = None
+        self._level_nodes = None
+
+        for name in variables:
+            self.add_variable(name)
+
+    def add_variable(self, name):
+        """
+        Append a variable at the bottom of the order, if it is not known yet.
+        """
+        if name not in self.levels:
+            self.levels[name] = len(self.variables)
+            self.variables.append(name)
+
+    def __len__(self):
+        """
+        Number of nodes created by this manager, terminals included.
+        """
+        return len(self._levels)
+
+    def make_node(self, level, low, high):
+        """
+        Return the node testing the variable at 'level', applying the reduction
+        rule (equal children) and the unique table (shared identical nodes).
+        """
+        if low == high:
+            return low
+
+        key = (level, low, high)
+        node = self._unique.get(key)
+
+        if node is None:
+            node = len(self._levels)
+
+            if self.max_nodes is not None and len(self._unique) + 2 >= self.max_nodes:
+                raise BudgetExceeded(f"The BDD exceeded its budget of {self.max_nodes} nodes.")
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise BudgetExceeded("The BDD exceeded its time budget.")
+
+            self._levels.append(level)
+            self._lows.append(low)
+            self._highs.append(high)
+            self._unique[key] = node
+
+        return node
+
+    def variable(self, name):
+        if name not in self.levels:
+            raise ValueError(f"The variable {name} is not part of the BDD order.")
+
+        return self.make_node(self.levels[name], FALSE, TRUE)
+
+    def level(self, node):
+        return self._levels[node]
+
+    def low(self, node):
+        return self._lows[node]
+
+    def high(self, node):
+        return self._highs[node]
+
+    def _cofactors(self, node, level):
+        if self._levels[node] != level:
+            return node, node
+
+        return self._lows[node], self._highs[node]
+
+    def _ite_known(self, f, g, h):
+        # The result of ite() when a terminal case or the computed table gives it, else None.
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+
+        return self.computed.get((f, g, h))
+
+    def ite(self, f, g, h):
+        """
+        If-then-else: the function (f AND g) OR (NOT f AND h).
+        The pending (f, g, h) calls are kept on an explicit stack: a call is
+        resolved once the calls on both cofactors are.
+        """
+        result = self._ite_known(f, g, h)
+
+        if result is not None:
+            return result
+
+        root = (f, g, h)
+        results = {}
+        stack = [root]
+
+        while stack:
+            key = stack[-1]
+
+            if key in results:
+                stack.pop()
+                continue
+
+            f, g, h = key
+            level = min(self._levels[f], self._levels[g], self._levels[h])
+            f0, f1 = self._cofactors(f, level)
+            g0, g1 = self._cofactors(g, level)
+            h0, h1 = self._cofactors(h, level)
+            low_key, high_key = (f0, g0, h0), (f1, g1, h1)
+            low = results[low_key] if low_key in results else self._ite_known(*low_key)
+            high = results[high_key] if high_key in results else self._ite_known(*high_key)
+
+            if low is None or high is None:
+                if low is None:
+                    stack.append(low_key)
+                if high is None:
+                    stack.append(high_key)
+                continue
+
+            stack.pop()
+            results[key] = self.make_node(level, low, high)
+            self.computed.put(key, results[key])
+
+        return results[root]
+
+    def negate(self, f):
+        return self.ite(f, FALSE, TRUE)
+
+    def apply(self, operator, f, g):
+        """
+        Combine two nodes with a binary operator given by its token name
+        (AND, OR, XOR, IMP, EQV, NAND, NOR), expressed through ite().
+        """
+        if operator == "AND":
+            return self.ite(f, g, FALSE)
+        if operator == "OR":
+            return self.ite(f, TRUE, g)
+        if operator == "XOR":
+            return self.ite(f, self.negate(g), g)
+        if operator == "IMP":
+            return self.ite(f, g, TRUE)
+        if operator == "EQV":
+            return self.ite(f, g, self.negate(g))
+        if operator == "NAND":
+            return self.negate(self.ite(f, g, FALSE))
+        if operator == "NOR":
+            return self.negate(self.ite(f, TRUE, g))
+
+        raise ValueError(f"Unknown operator {operator}")
+
+    def restrict(self, f, name, value):
+        """
+        Return the cofactor of 'f' with the variable 'name' fixed to 'value'.
+        """
+        level = self.levels[name]
+        results = {}
+
+        def known(node):
+            if self._levels[node] > level:
+                return node
+            if self._levels[node] == level:
+                return self._highs[node] if value else self._lows[node]
+
+            return results.get(node)
+
+        stack = [f]
+
+        while stack:
+            node = stack[-1]
+
+            if known(node) is not None:
+                stack.pop()
+                continue
+
+            low, high = known(self._lows[node]), known(self._highs[node])
+
+            if low is None or high is None:
+                if low is None:
+                    stack.append(self._lows[node])
+                if high is None:
+                    stack.append(self._highs[node])
+                continue
+
+            stack.pop()
+            results[node] = self.make_node(self._levels[node], low, high)
+
+        return known(f)
+
+    def sat_count(self, f, variables_count=None):
+        """
+        Count the assignments of the first 'variables_count' variables of the
+        order (all of them by default) for which 'f' is true. 'f' must not
+        depend on variables below that point.
+        """
+        if variables_count is None:
+            variables_count = len(self.variables)
+
+        counts = {FALSE: 0, TRUE: 1}
+
+        def level(node):
+            return min(self._levels[node], variables_count)
+
+        stack = [f]
+
+        while stack:
+            node = stack[-1]
+
+            if node in counts:
+                stack.pop()
+                continue
+
+            low, high = self._lows[node], self._highs[node]
+
+            if low not in counts or high not in counts:
+                stack.extend(child for child in (low, high) if child not in counts)
+                continue
+
+            stack.pop()
+            counts[node] = (
+                (counts[low] << (level(low) - level(node) - 1)) +
+                (counts[high] << (level(high) - level(node) - 1))
+                )
+
+        return counts[f] << level(f)
+
+    def evaluate(self, f, assignment):
+        """
+        Follow the path selected by 'assignment' (variable name -> 0/1) to a terminal.
+        """
+        while f > TRUE:
+            f = self._highs[f] if assignment[self.variables[self._levels[f]]] else self._lows[f]
+
+        return f == TRUE
+
+    def satisfying_assignment(self, f):
+        """
+        Return one assignment (variable name -> 0/1) of the variables on a path to
+        the TRUE terminal, or None if 'f' is unsatisfiable. Variables that do not
+        appear on the path may take any value and are set to 0.
+        The assignment lists the variables alphabetically, whatever the BDD order.
+        """
+        if f == FALSE:
+            return None
+
+        assignment = dict.fromkeys(sorted(self.variables), 0)
+
+        while f > TRUE:
+            name = self.variables[self._levels[f]]
+
+            if self._lows[f] != FALSE:
+                f = self._lows[f]
+            else:
+                assignment[name] = 1
+                f = self._highs[f]
+
+        return assignment
+
+    def node_count(self, *roots):
+        """
+        Number of distinct nodes reachable from the given roots, terminals included.
+        """
+        return len(self.reachable(*roots))
+
+    def reachable(self, *roots):
+        seen = set()
+        stack = list(roots)
+
+        while stack:
+            node = stack.pop()
+
+            if node not in seen:
+                seen.add(node)
+
+                if node > TRUE:
+                    stack.extend((self._lows[node], self._highs[node]))
+
+        return seen
+
+    def collect_garbage(self, *roots):
+        """
+        Forget the nodes that cannot be reached from 'roots' and count the references
+        of the others, which swap_levels() keeps up to date: from then on, the nodes
+        of the unique table are exactly the live ones. The computed table is cleared.
+        Returns the number of live nodes, terminals included.
+        """
+        live = self.reachable(*roots, FALSE, TRUE)
+        self._references = dict.fromkeys(live, 0)
+        self._level_nodes = [set() for _ in self.variables]
+
+        for root in roots:
+            self._references[root] += 1
+
+        for node in live:
+            if node > TRUE:
+                self._references[self._lows[node]] += 1
+                self._references[self._highs[node]] += 1
+                self._level_nodes[self._levels[node]].add(node)
+
+        self._unique = {key: node for key, node in self._unique.items() if node in live}
+        self.computed.clear()
+
+        return len(live)
+
+    def live_node_count(self):
+        """
+        Number of nodes of the unique table, terminals included. Right after
+        collect_garbage() and while reordering these are exactly the live nodes;
+        otherwise the dead intermediate results of later operations count too.
+        """
+        return len(self._unique) + 2
+
+    def level_population(self, level):
+        """
+        Number of live nodes at 'level', since the last collect_garbage().
+        """
+        return len(self._level_nodes[level])
+
+    def _reference(self, node):
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+
+            if node in self._references:
+                self._references[node] += 1
+            else:
+                self._references[node] = 1
+                stack.extend((self._lows[node], self._highs[node]))
+
+    def _dereference(self, node):
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+            self._references[node] -= 1
+
+            if self._references[node] == 0 and node > TRUE:
+                del self._references[node]
+                del self._unique[(self._levels[node], self._lows[node], self._highs[node])]
+                self._level_nodes[self._levels[node]].discard(node)
+                stack.extend((self._lows[node], self._highs[node]))
+
+    def _find_or_add(self, level, low, high):
+        # make_node without the budget checks: a swap must not stop halfway.
+        if low == high:
+            return low
+
+        key = (level, low, high)
+        node = self._unique.get(key)
+
+        if node is None:
+            node = len(self._levels)
+            self._levels.append(level)
+            self._lows.append(low)
+            self._highs.append(high)
+            self._unique[key] = node
+            self._level_nodes[level].add(node)
+
+        return node
+
+    def swap_levels(self, level):
+        """
+        Exchange the variables at 'level' and 'level' + 1 in place (collect_garbage()
+        must have been called). Nodes of the upper variable that do not test the
+        lower one just move down and nodes of the lower variable move up; every
+        other node of the upper variable is relabelled with the lower variable
+        and gets new children testing the upper one:
+        x ? (y ? f11 : f10) : (y ? f01 : f00) = y ? (x ? f11 : f01) : (x ? f10 : f00).
+        Only the two levels are touched, and the nodes keep their functions.
+        """
+        upper, lower = level, level + 1
+        x_nodes, y_nodes = self._level_nodes[upper], self._level_nodes[lower]
+        self._level_nodes[upper], self._level_nodes[lower] = set(), set()
+        dependent = []
+
+        for node in x_nodes:
+            del self._unique[(upper, self._lows[node], self._highs[node])]
+
+            if self._levels[self._lows[node]] == lower or self._levels[self._highs[node]] == lower:
+                dependent.append(node)
+
+        for node in y_nodes:
+            del self._unique[(lower, self._lows[node], self._highs[node])]
+
+        for node in y_nodes:
+            self._levels[node] = upper
+            self._unique[(upper, self._lows[node], self._highs[node])] = node
+            self._level_nodes[upper].add(node)
+
+        for node in x_nodes.difference(dependent):
+            self._levels[node] = lower
+            self._unique[(lower, self._lows[node], self._highs[node])] = node
+            self._level_nodes[lower].add(node)
+
+        for node in dependent:
+            f0, f1 = self._lows[node], self._highs[node]
+            f00, f01 = (self._lows[f0], self._highs[f0]) if f0 in y_nodes else (f0, f0)
+            f10, f11 = (self._lows[f1], self._highs[f1]) if f1 in y_nodes else (f1, f1)
+            low = self._find_or_add(lower, f00, f10)
+            high = self._find_or_add(lower, f01, f11)
+            self._reference(low)
+            self._reference(high)
+            self._levels[node], self._lows[node], self._highs[node] = upper, low, high
+            self._unique[(upper, low, high)] = node
+            self._level_nodes[upper].add(node)
+            self._dereference(f0)
+            self._dereference(f1)
+
+        upper_name, lower_name = self.variables[upper], self.variables[lower]
+        self.variables[upper], self.variables[lower] = lower_name, upper_name
+        self.levels[lower_name], self.levels[upper_name] = upper, lower
+
+    def transfer(self, f, target):
+        """
+        Rebuild 'f' in the manager 'target', which may use a different variable order.
+        """
+        results = {FALSE: FALSE, TRUE: TRUE}
+        stack = [f]
+
+        while stack:
+            node = stack[-1]
+
+            if node in results:
+                stack.pop()
+                continue
+
+            low, high = self._lows[node], self._highs[node]
+
+            if low not in results or high not in results:
+                stack.extend(child for child in (low, high) if child not in results)
+                continue
+
+            stack.pop()
+            results[node] = target.ite(
+                target.variable(self.variables[self._levels[node]]), results[high], results[low]
+                )
+
+        return results[f]
@@ -1,36 +1,255 @@
-from functools import lru_cache
-from itertools import product
+import hashlib
+import sys
+import time
 
 from parser_lexer.lexer import Lexer
 from parser_lexer.parser import Parser
 from ast_nodes.nodes import (
-    EqvNode, ImpNode, OrNode, NorNode, 
-    XorNode, AndNode, NandNode, NotNode, 
-    VariableNode
+    EqvNode, XorNode, AndNode, OrNode, NandNode, 
+    NotNode, VariableNode, ConstNode,
+    fold, postorder
 )
-from boolean_logic.helpers import zhegalkin_polynomial_to_str
-from boolean_logic.quine_mccluskey import quine_mccluskey
+from boolean_logic.bdd import BDD, FALSE, TRUE
+from boolean_logic.esop import anf_cubes, exorcism
+from boolean_logic.espresso import bdd_implicant_check, espresso, isop
+from boolean_logic.helpers import (
+    anf_vector_to_polynomial, mobius_transform,
+    truth_table_column, truth_table_columns, 
+    truth_table_mask, zhegalkin_polynomial_to_str
+)
+from boolean_logic.memoization import LRUCache, memoized_artifact
+from boolean_logic.model_counting import count_models
+from boolean_logic.multi_output import cover_netlist, minimize_multi_output
+from boolean_logic.ordering import ordered_bdd, ordering_report
+from boolean_logic.quine_mccluskey import (
+    find_essential_prime_implicants_with_dont_cares, literal_covering_solver,
+    implicant_to_string, prime_implicants
+)
+from boolean_logic.result_store import stored_artifact
+from boolean_logic.sat import find_difference
+from boolean_logic.truth_table import TruthTable
 
 
 def get_variables(node):
     """
-    Recursively gather all variable names from the given AST node.
+    Gather all variable names from the given AST node, iteratively.
     For example, if the node is (A AND (NOT B)), returns {'A', 'B'}.
     """
-    variables = set()
+    return {
+        current.name for current in postorder(node) 
+        if isinstance(current, VariableNode)
+        }
+
+def estimate_zhegalkin_cost(node, size_limit):
+    """
+    Estimate the work of building the Zhegalkin polynomial bottom-up from the AST.
+    Returns (size, cost): an upper bound on the number of monomials of the node
+    (capped at 'size_limit') and the accumulated number of monomial operations.
+    """
+    def combine(current, operands):
+        if isinstance(current, (VariableNode, ConstNode)):
+            return 1, 1
+        
+        if isinstance(current, NotNode):
+            size, cost = operands[0]
+            return min(size + 1, size_limit), cost + size
+        
+        (size, cost), *rest = operands
+
+        for right_size, right_cost in rest:
+            left_size = size
+            cost += right_cost
+
+            if isinstance(current, (XorNode, EqvNode)):
+                size = left_size + right_size + 1
+                cost += left_size + right_size
+            elif isinstance(current, (AndNode, NandNode)):
+                size = left_size * right_size + 1
+                cost += left_size * right_size
+            else:
+                size = left_size + right_size + left_size * right_size
+                cost += left_size * right_size + left_size + right_size
+
+            size = min(size, size_limit)
+
+        return min(size, size_limit), cost
+
+    return fold(node, combine)
+
+def artifact_size(value):
+    """
+    Rough size in bytes of a cached artifact: integers and truth tables by their
+    bits, strings by their length, containers by their items and BDDs by their nodes.
+    """
+    if isinstance(value, bool) or value is None:
+        return 16
+
+    if isinstance(value, int):
+        return 28 + value.bit_length() // 8
+
+    if isinstance(value, str):
+        return 49 + len(value)
+
+    if isinstance(value, TruthTable):
+        return 2 * artifact_size(value.vector)
+
+    if isinstance(value, BDD):
+        return 200 * len(value)
+
+    if isinstance(value, dict):
+        return 64 + sum(artifact_size(key) + artifact_size(item) for key, item in value.items())
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return 64 + sum(8 + artifact_size(item) for item in value)
+
+    return sys.getsizeof(value)
+
+def minterms_to_ast(minterms, variables):
+    """
+    Build the sum of the given minterms (row indices, the first variable being the
+    most significant bit) as an AST over 'variables'.
+    """
+    variables_count = len(variables)
+    products = []
+
+    for minterm in sorted(set(minterms)):
+        if not 0 <= minterm < 1 << variables_count:
+            raise ValueError(f"The minterm {minterm} is out of range for {variables_count} variables.")
+
+        literals = [
+            VariableNode(name) if minterm >> (variables_count - index - 1) & 1 else NotNode(VariableNode(name))
+            for index, name in enumerate(variables)
+            ]
+        products.append(AndNode(*literals) if len(literals) > 1 else literals[0] if literals else ConstNode(1))
+
+    if not products:
+        return ConstNode(0)
+
+    return OrNode(*products) if len(products) > 1 else products[0]
+
+def sum_of_products_to_str(terms, variables, operator="OR"):
+    """
+    Format implicants given as strings of "0", "1" and "-" (one character per
+    variable of 'variables') as a sum of products, e.g. "(A AND NOT C) OR B";
+    operator="XOR" formats an exclusive sum of products.
+    """
+    products = []
+
+    for term in sorted(terms, reverse=True):
+        literals = []
+
+        for idx, val in enumerate(term):
+            if val == "1":
+                literals.append(variables[idx])
+            elif val == "0":
+                literals.append(f"NOT {variables[idx]}")
+
+        products.append(" AND ".join(literals) if literals else "1")
+
+    if not products:
+        return "0"
+
+    if len(products) == 1:
+        return products[0]
+
+    return f" {operator} ".join(f"({product})" if " AND " in product else product for product in products)
+
+def product_of_sums_to_str(terms, variables):
+    """
+    Format the implicants of the complement of a function (strings of "0", "1"
+    and "-") as a product of sums of the function, e.g. "(NOT A OR C) AND B":
+    each implicant of the complement is a clause with its literals negated.
+    """
+    sums = []
+
+    for term in sorted(terms):
+        literals = []
+
+        for idx, val in enumerate(term):
+            if val == "0":
+                literals.append(variables[idx])
+            elif val == "1":
+                literals.append(f"NOT {variables[idx]}")
+
+        sums.append(" OR ".join(literals) if literals else "0")
+
+    if not sums:
+        return "1"
+
+    if len(sums) == 1:
+        return sums[0]
+
+    return " AND ".join(f"({clause})" if " OR " in clause else clause for clause in sums)
+
+def count_literals(terms):
+    """
+    Number of literals of implicants given as strings of "0", "1" and "-".
+    """
+    return sum(len(term) - term.count("-") for term in terms)
+
+def canonical_tokens(tokens):
+    """
+    Normalize a token stream so that spellings of the same expression share one key:
+    operator synonyms collapse to their token type, constants to "1"/"0",
+    and whitespace is already dropped by the lexer.
+    """
+    canonical = []
+
+    for token in tokens:
+        if token.type == "IDENTIFIER":
+            canonical.append((token.type, token.value))
+        elif token.type == "CONST":
+            canonical.append((token.type, "1" if token.value.lower() in {"1", "true"} else "0"))
+        elif token.type != "EOF":
+            canonical.append((token.type, None))
+
+    return tuple(canonical)
+
+MOBIUS_VARIABLE_LIMIT = 24
+
+# Functions with more variables than this are not kept in the result store:
+# their key would need the whole truth table.
+RESULT_STORE_VARIABLE_LIMIT = 20
+
+# Above this many variables minimize() defaults to the Espresso heuristic.
+EXACT_MINIMIZATION_LIMIT = 10
 
-    if isinstance(node, VariableNode):
-        variables.add(node.name)
-    elif isinstance(node, NotNode):
-        variables.update(get_variables(node.operand))
-    elif isinstance(node, (
-        AndNode, OrNode, XorNode, ImpNode, 
-        EqvNode, NandNode, NorNode)
-        ):
-        variables.update(get_variables(node.left))
-        variables.update(get_variables(node.right))
+# Largest cyclic core (in minterms) of the product-of-sums covering problem that
+# minimize(form="best") solves exactly; Espresso handles larger ones, which the
+# exact search rarely finishes within the time limit.
+BEST_EXACT_CORE_LIMIT = 64
 
-    return variables
+MINIMIZATION_METHODS = ("auto", "exact", "heuristic")
+
+# Forms minimize() can return; "best" picks the fewest literals (earlier forms win ties).
+MINIMIZATION_FORMS = ("sop", "pos", "esop", "best")
+
+POST_CLASS_PROPERTIES = {
+    "T0": "preserves_zero",
+    "T1": "preserves_one",
+    "S": "is_self_dual",
+    "M": "is_monotonic",
+    "L": "is_linear",
+}
+
+def compile_ast(node, variables):
+    """
+    Lower an AST into a flat, generated Python function. The function takes one
+    positional argument per variable (in the order of 'variables') and an optional
+    'mask'. With 0/1 arguments and the default mask it returns the function value;
+    with packed truth table columns and the full row mask it returns the packed
+    truth vector.
+    """
+    arguments = {variable: f"x{index}" for index, variable in enumerate(variables)}
+    parameters = "".join(f"{argument}, " for argument in arguments.values())
+    lines = []
+    result = node.emit(lines, arguments)
+    body = "".join(f"    {line}\n" for line in lines)
+    source = f"def compiled({parameters}mask=1):\n{body}    return {result}\n"
+    namespace = {}
+    exec(compile(source, "<boolean_function>", "exec"), namespace)
+
+    return namespace["compiled"]
 
 
 class BooleanFunction:
@@ -39,34 +258,105 @@ class BooleanFunction:
     for simplification, minimization, property checks, and more.
     """
 
-    def __init__(self, expression):
+    artifact_cache_size = 16
+    # Variable order heuristic of the BDDs (see boolean_logic/ordering.py).
+    # It only affects the diagrams: results are presented in alphabetical order.
+    bdd_ordering = "force"
+    # Default node budget of the diagrams used for model counting.
+    model_count_max_nodes = 1 << 21
+    # Default time budget of minimize(), in seconds (None waits for the optimum).
+    minimization_time_limit = 10.0
+    # Worker processes generating the prime implicants of the exact method (1 stays in this process).
+    minimization_workers = 1
+    # Persistent ResultStore consulted before computing (see boolean_logic/result_store.py), off by default.
+    result_store = None
+    expression_cache = LRUCache(
+        maxsize=256, maxweight=64 * 1024 * 1024, 
+        weigher=lambda function: function.estimated_size(), reweigh=True
+        )
+
+    @classmethod
+    def get(cls, expression, dont_cares=None):
+        """
+        Return a shared BooleanFunction for 'expression' (and 'dont_cares') from the
+        process-wide expression cache, keyed by the normalized token streams, so that
+        cached truth tables, Zhegalkin forms and minimizations are reused across calls.
+        """
+        key = canonical_tokens(Lexer(expression).iter_tokens())
+
+        if isinstance(dont_cares, str):
+            key = (key, canonical_tokens(Lexer(dont_cares).iter_tokens()))
+        elif dont_cares is not None:
+            key = (key, frozenset(dont_cares))
+
+        boolean_function = cls.expression_cache.get(key)
+
+        if boolean_function is None:
+            boolean_function = cls(expression, dont_cares=dont_cares)
+            cls.expression_cache.put(key, boolean_function)
+
+        return boolean_function
+
+    @classmethod
+    def expression_cache_info(cls):
+        """
+        Return the hit/miss statistics and size of the process-wide expression cache.
+        """
+        return cls.expression_cache.cache_info()
+
+    def __init__(self, expression, cache_size=None, dont_cares=None):
+        """
+        'dont_cares' optionally gives the inputs on which the value of the function
+        does not matter, used by minimize() and shown by the Karnaugh map: either an
+        expression (its variables join those of the function) or a set of minterms
+        (row indices over the variables of the function).
+        """
         self.expression = expression
         lexer = Lexer(expression)
-        tokens = lexer.tokenize()
-        parser = Parser(tokens)
+        parser = Parser(lexer.iter_tokens())
         self.ast = parser.parse()
         self.variables = sorted(list(get_variables(self.ast)))
+        self.dont_cares = dont_cares
+        self.dont_care_ast = None
 
-        self._truth_table_cache = None
-        self._zhegalkin_cache = None
-        self._minimized_cache = None
-        self._properties_cache = {}  
-        self._simplified_cache = None
+        if isinstance(dont_cares, str):
+            self.dont_care_ast = Parser(Lexer(dont_cares).iter_tokens()).parse()
+            self.variables = sorted(set(self.variables) | get_variables(self.dont_care_ast))
+        elif dont_cares is not None:
+            self.dont_cares = frozenset(dont_cares)
+            self.dont_care_ast = minterms_to_ast(self.dont_cares, self.variables)
 
-    def simplify(self):
+        self._artifacts = LRUCache(
+            self.artifact_cache_size if cache_size is None else cache_size, weigher=artifact_size
+            )
+
+    def cache_info(self):
         """
-        Return a simplified string representation of the Boolean function,
-        caching the result if already computed.
+        Return the hit/miss statistics and size of this function's artifact cache
+        (truth table, Zhegalkin polynomial, minimized form, properties, ...).
         """
-        if self._simplified_cache is not None:
-            return self._simplified_cache
-        
-        self.ast = self.ast.simplify()
-        simplified_expression = str(self.ast) 
-        simplified_expression = self.remove_outer_parens(simplified_expression)
-        self._simplified_cache = simplified_expression
+        return self._artifacts.cache_info()
+
+    def estimated_size(self):
+        """
+        Rough size, in bytes, of the memory this function holds: its expression
+        and the artifacts it has computed so far (see artifact_size).
+        """
+        return 64 * len(self.expression) + self._artifacts.weight
 
-        return simplified_expression
+    @memoized_artifact
+    def simplified_ast(self):
+        """
+        Return the simplified AST of the function. The parsed AST is left as it
+        is: instances from get() are shared, and other views still need it.
+        """
+        return self.ast.simplify()
+
+    def simplify(self):
+        """
+        Return a simplified string representation of the Boolean function.
+        """
+        return self.remove_outer_parens(str(self.simplified_ast()))
 
     def remove_outer_parens(self, expression):
         expression = expression.strip()
@@ -87,38 +377,111 @@ class BooleanFunction:
                 return expression[1:-1].strip()
         return expression
 
-    @lru_cache(None)
+    @memoized_artifact
     def to_zhegalkin(self):
         """
         Return the Zhegalkin polynomial representation of this Boolean function as a string.
         Uses caching to avoid recomputation.
         """
-        if self._zhegalkin_cache is not None:
-            return self._zhegalkin_cache
+        polynomial = self.get_zhegalkin_polynomial()
+
+        return zhegalkin_polynomial_to_str(polynomial, self.variables)
+
+    @memoized_artifact
+    @stored_artifact(decode=set)
+    def get_zhegalkin_polynomial(self):
+        """
+        Return the Zhegalkin polynomial as a set of monomial bitmasks, caching it
+        so that both the string form and the linearity check share one computation.
+        """
+        if self.zhegalkin_strategy() == "mobius":
+            variables_count = len(self.variables)
+            anf_vector = mobius_transform(self.get_truth_vector(), variables_count)
+            polynomial = anf_vector_to_polynomial(anf_vector, variables_count)
+        else:
+            polynomial = self.ast.to_zhegalkin(self.variables)
+
+        return polynomial
+
+    def zhegalkin_strategy(self):
+        """
+        Choose how to build the Zhegalkin polynomial: "ast" multiplies polynomials
+        bottom-up over the AST, "mobius" runs the fast Möbius transform over the
+        packed truth table in O(n * 2^n), then reads the monomials off its 2^n-bit
+        result in one byte scan. The cheaper estimate wins; past
+        MOBIUS_VARIABLE_LIMIT variables the truth table is never built.
+        """
+        variables_count = len(self.variables)
+
+        if variables_count > MOBIUS_VARIABLE_LIMIT:
+            return "ast"
         
-        polynomial = self.ast.to_zhegalkin(self.variables)
-        self._zhegalkin_cache = zhegalkin_polynomial_to_str(polynomial, self.variables)
+        rows_count = 1 << variables_count
+        _, ast_cost = estimate_zhegalkin_cost(self.ast, rows_count)
+        mobius_cost = variables_count * rows_count // 64 + rows_count // 8 + 1
+
+        return "ast" if ast_cost <= mobius_cost else "mobius"
+
+    @memoized_artifact
+    def compile(self):
+        """
+        Return the AST lowered to a single generated Python function taking
+        positional bits (see compile_ast), caching it for subsequent calls.
+        """
+        return compile_ast(self.ast, self.variables)
+
+    def _packed_vector(self, columns, mask):
+        # The compiled function on packed columns given by name, a superset of its variables.
+        return self.compile()(*(columns[variable] for variable in self.variables), mask)
 
-        return self._zhegalkin_cache
+    def get_truth_vector(self):
+        """
+        Return the packed truth table: an integer whose bit r is the
+        function value in row r (rows follow itertools.product order).
+        """
+        return self.get_truth_table().vector
 
+    @memoized_artifact
     def get_truth_table(self):
         """
-        Build and cache the truth table (list of (input_tuple, result) pairs)
-        for the current Boolean function.
+        Build and cache the truth table of the current Boolean function as a packed
+        TruthTable. The whole table is produced by a single bit-parallel call of the
+        compiled function; iterating it still yields (input_tuple, result) pairs.
         """
-        if self._truth_table_cache is not None:
-            return self._truth_table_cache
-        
         variables_count = len(self.variables)
-        truth_table = []
+        columns = truth_table_columns(self.variables)
+        mask = truth_table_mask(variables_count)
+        compiled = self.compile()
+
+        return TruthTable(compiled(*columns.values(), mask), variables_count)
+
+    @memoized_artifact
+    def get_dont_care_vector(self):
+        """
+        Return the packed truth vector of the don't-care condition over the
+        variables of the function (0 when there is none).
+        """
+        if self.dont_care_ast is None:
+            return 0
+
+        columns = truth_table_columns(self.variables)
+        compiled = compile_ast(self.dont_care_ast, self.variables)
+
+        return compiled(*columns.values(), truth_table_mask(len(self.variables)))
+
+    @memoized_artifact
+    def content_key(self):
+        """
+        Return the hash of the canonical truth table (variables, truth vector and
+        don't-care vector) that identifies the function in the result store, or
+        None above RESULT_STORE_VARIABLE_LIMIT variables.
+        """
+        if len(self.variables) > RESULT_STORE_VARIABLE_LIMIT:
+            return None
 
-        for values in product([0, 1], repeat=variables_count):
-            env = dict(zip(self.variables, values))
-            result = int(self.evaluate(env))
-            truth_table.append((values, result))
+        canonical = f"{','.join(self.variables)}|{self.get_truth_vector():x}|{self.get_dont_care_vector():x}"
 
-        self._truth_table_cache = truth_table
-        return truth_table
+        return hashlib.sha256(canonical.encode()).hexdigest()
 
     def evaluate(self, variables):
         """
@@ -130,144 +493,288 @@ class BooleanFunction:
         """
         Check if the function preserves zero (returns 0 when all variables are 0).
         """
-        if "preserves_zero" in self._properties_cache:
-            return self._properties_cache["preserves_zero"]
-        
-        new_variables = dict.fromkeys(self.variables, 0)
-        value = self.evaluate(new_variables) == 0
-        self._properties_cache["preserves_zero"] = value
-
-        return value
+        return self.post_classes()["T0"]
 
     def preserves_one(self):
         """
         Check if the function preserves one (returns 1 when all variables are 1).
         """
-        if "preserves_one" in self._properties_cache:
-            return self._properties_cache["preserves_one"]
-        
-        new_variables = dict.fromkeys(self.variables, 1)
-        value = self.evaluate(new_variables) == 1
-        self._properties_cache["preserves_one"] = value
-
-        return value
+        return self.post_classes()["T1"]
 
     def is_self_dual(self):
         """
         Check if the function is self-dual, i.e., F(~x) = ~F(x).
         """
-        if "is_self_dual" in self._properties_cache:
-            return self._properties_cache["is_self_dual"]
-        
-        truth_table = self.get_truth_table()
-        mapping = {}
-
-        for values, result in truth_table:
-            inverted_values = tuple(1 - v for v in values)
-            mapping[inverted_values] = 1 - result
-
-        for values, result in truth_table:
-            if result != mapping.get(values, result):
-                self._properties_cache["is_self_dual"] = False
-                return False
-        self._properties_cache["is_self_dual"] = True
-
-        return True
+        return self.post_classes()["S"]
 
     def is_monotonic(self):
         """
         Check if the function is monotonic, i.e., non-decreasing when inputs are flipped from 0 to 1.
         """
-        if "is_monotonic" in self._properties_cache:
-            return self._properties_cache["is_monotonic"]
-        
+        return self.post_classes()["M"]
+
+    @memoized_artifact
+    def monotonicity_witness(self):
+        """
+        Return a pair of input tuples (lower, upper) that differ in a single variable,
+        with lower < upper but F(lower) = 1 and F(upper) = 0, or None if the function
+        is monotonic. Each variable is checked with one shift of the packed truth table,
+        comparing every row only with its single-bit-flip neighbour: O(n * 2^n) bit work.
+        """
         truth_table = self.get_truth_table()
+        vector = truth_table.vector
+        variables_count = len(self.variables)
 
-        for (values1, result1) in truth_table:
-            for (values2, result2) in truth_table:
-                if all(v1 <= v2 for v1, v2 in zip(values1, values2)):
-                    if result1 > result2:
-                        self._properties_cache["is_monotonic"] = False
-                        return False
-                    
-        self._properties_cache["is_monotonic"] = True
-        return True
+        for index in range(variables_count):
+            column = truth_table_column(index, variables_count)
+            block = 1 << (variables_count - index - 1)
+            violations = ((vector & ~column) << block) & ~vector & column
+
+            if violations:
+                upper = (violations & -violations).bit_length() - 1
+                lower = upper - block
+                return truth_table.row_values(lower), truth_table.row_values(upper)
+            
+        return None
 
     def is_linear(self):
         """
         Check if the function is linear, meaning each monomial in its Zhegalkin polynomial
         has at most one variable (no products of multiple variables).
         """
-        if "is_linear" in self._properties_cache:
-            return self._properties_cache["is_linear"]
-        
-        polynomial = self.ast.to_zhegalkin(self.variables)
+        return self.post_classes()["L"]
 
-        for monomial in polynomial:
-            if bin(monomial).count("1") > 1:
-                self._properties_cache["is_linear"] = False
-                return False
-            
-        self._properties_cache["is_linear"] = True
-        return True
+    @memoized_artifact
+    @stored_artifact()
+    def post_classes(self):
+        """
+        Return the membership of the function in the five Post classes
+        (T0, T1, S, M, L) as a dict, computed from a single packed truth table.
+        Self-duality is the XOR of the truth vector against its bit-reverse:
+        row r and row 2^n - 1 - r hold complementary inputs.
+        """
+        truth_table = self.get_truth_table()
+        vector = truth_table.vector
+        rows_count = len(truth_table)
+        reversed_vector = int(format(vector, f"0{rows_count}b")[::-1], 2)
+
+        return {
+            "T0": truth_table[0] == 0,
+            "T1": truth_table[-1] == 1,
+            "S": vector ^ reversed_vector == truth_table_mask(len(self.variables)),
+            "M": self.monotonicity_witness() is None,
+            "L": all(monomial.bit_count() <= 1 for monomial in self.get_zhegalkin_polynomial()),
+        }
+
+    def minimize(self, method="auto", time_limit=None, form="sop"):
+        """
+        Minimize the function and return it as a string, free to take either value
+        on the don't cares. form="sop" gives a sum of products, form="pos" a product
+        of sums (the sum of products of the complement, negated), form="esop" an
+        exclusive sum of products and form="best" whichever of the three has the
+        fewest literals (see best_form).
+        For sums and products of sums, method="exact" runs Quine-McCluskey with
+        an exact minimum cover, method="heuristic" runs Espresso from the ISOP of
+        the BDD and builds no truth table itself (the 'result_store' does, up to
+        RESULT_STORE_VARIABLE_LIMIT variables: its keys hash the truth table,
+        see content_key); "auto" picks exact up to
+        EXACT_MINIMIZATION_LIMIT variables. Past 'time_limit' seconds the best
+        cover found so far is used (for the exact method, only the covering step
+        is bounded), 'minimization_time_limit' by default: the exact cover is then
+        no longer proven minimum, which minimized_cover() tells.
+        """
+        if method not in MINIMIZATION_METHODS:
+            raise ValueError(f"Unknown minimization method {method}")
+
+        if form not in MINIMIZATION_FORMS:
+            raise ValueError(f"Unknown minimization form {form}")
+
+        if form == "best":
+            form, terms = self.best_form(method, time_limit)
+        else:
+            terms = self.minimized_terms(method, time_limit, form)
+
+        if form == "pos":
+            return product_of_sums_to_str(terms, self.variables)
 
-    def minimize(self):
+        return sum_of_products_to_str(terms, self.variables, "XOR" if form == "esop" else "OR")
+
+    def best_form(self, method="auto", time_limit=None):
         """
-        Minimize the function using the Quine-McCluskey algorithm.
-        Returns a string of the minimized expression.
+        Return (form, terms) for minimize(form="best"). The sum of products, the
+        exclusive sum and the product of sums are minimized in that order under
+        one shared deadline, 'time_limit' seconds away, and the fewest literals
+        win (the earlier form in MINIMIZATION_FORMS on ties). The exact product
+        of sums, usually the costliest cover, is skipped when a lower bound on its
+        literals shows it cannot win, and left to Espresso when the cyclic core
+        of its covering problem exceeds BEST_EXACT_CORE_LIMIT minterms.
+        The choice is kept in the result store once every form it ran finished.
         """
-        if self._minimized_cache is not None:
-            return self._minimized_cache
+        if time_limit is None:
+            time_limit = self.minimization_time_limit
 
-        truth_table = self.get_truth_table()
-        minterms = [values for values, result in truth_table if result == 1]
+        form, terms, _ = self._best_form(method, time_limit=time_limit)
+
+        return form, terms
+
+    @stored_artifact(
+        decode=lambda value: (value[0], set(value[1]), value[2]), finished=lambda value: value[2],
+        budget=("time_limit",)
+        )
+    def _best_form(self, method, time_limit=None):
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        exact = method == "exact" or method == "auto" and len(self.variables) <= EXACT_MINIMIZATION_LIMIT
+        candidates = {}
+        finished = True
+
+        for form in ("sop", "esop", "pos"):
+            form_method = method
+
+            if form == "pos" and exact:
+                minterms, primes = self.exact_cover_problem("pos")
+                solver = literal_covering_solver(primes, minterms, len(self.variables))
+                bound = solver.lower_bound()
+
+                if bound >= count_literals(candidates["sop"]) or bound > count_literals(candidates["esop"]):
+                    continue
+
+                core_rows, _ = solver.reduce()
+
+                if core_rows.bit_count() > BEST_EXACT_CORE_LIMIT:
+                    form_method = "heuristic"
+
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            candidates[form], form_finished = self.minimized_cover(form_method, remaining, form)
+            finished = finished and form_finished
+
+        form = min(candidates, key=lambda form: (count_literals(candidates[form]), MINIMIZATION_FORMS.index(form)))
+
+        return form, candidates[form], finished
+
+    def minimized_terms(self, method="auto", time_limit=None, form="sop"):
+        """
+        The products minimize() formats, as strings of "0", "1" and "-": the
+        implicants of the function for "sop", of its complement for "pos", and
+        the cubes of the exclusive sum for "esop" (see minimized_cover).
+        """
+        return self.minimized_cover(method, time_limit, form)[0]
+
+    def minimized_cover(self, method="auto", time_limit=None, form="sop"):
+        """
+        Return (terms, finished): the terms of minimized_terms() and whether the
+        minimization ran to its end within 'time_limit'. For the exact method,
+        'finished' means the cover is proven minimum; when it is False, the cover
+        is only the best one found before the time limit. The exclusive sum is
+        minimized by exorcism (see boolean_logic/esop.py) from the Zhegalkin
+        polynomial and follows the expression on the don't cares.
+
+        A finished cover does not depend on the time limit, so it is reused for
+        every limit (and kept in the result store); one that was cut short is
+        only reused for limits no larger than the one it had.
+        """
+        if time_limit is None:
+            time_limit = self.minimization_time_limit
+
+        key = ("minimized_cover", method, form)
+        cover = self._artifacts.get(key)
+
+        if cover is not None and not cover[1]:
+            previous_limit = cover[2]
+
+            if previous_limit is not None and (time_limit is None or time_limit > previous_limit):
+                cover = None
+
+        if cover is None:
+            terms, finished = self._minimized_cover(method, form, time_limit=time_limit)
+            cover = (terms, finished, time_limit)
+            self._artifacts.put(key, cover)
+
+        return cover[0], cover[1]
+
+    @stored_artifact(
+        decode=lambda value: (set(value[0]), value[1]), finished=lambda value: value[1], budget=("time_limit",)
+        )
+    def _minimized_cover(self, method, form, time_limit=None):
         variables_count = len(self.variables)
 
-        if not minterms:
-            self._minimized_cache = "0"
-            return "0"
-        
-        if len(minterms) == 2 ** variables_count:
-            self._minimized_cache = "1"
-            return "1"
+        if form == "esop":
+            cubes, finished = exorcism(
+                anf_cubes(self.get_zhegalkin_polynomial(), variables_count), variables_count, time_limit,
+                return_finished=True
+                )
 
-        minterm_numbers = [
-            sum(val << (variables_count - idx - 1) for idx, val
-            in enumerate(values)) for values in minterms
-            ]
-        minimized_terms = quine_mccluskey(minterm_numbers, variables_count)
-        terms_str = []
+            return {implicant_to_string(cube, variables_count) for cube in cubes}, finished
 
-        for term in minimized_terms:
-            literals = []
+        if method == "auto":
+            method = "exact" if variables_count <= EXACT_MINIMIZATION_LIMIT else "heuristic"
 
-            for idx, val in enumerate(term):
-                if val == "1":
-                    literals.append(self.variables[idx])
-                elif val == "0":
-                    literals.append(f"NOT {self.variables[idx]}")
+        if method == "exact":
+            minterms, primes = self.exact_cover_problem(form)
+            cover, finished = find_essential_prime_implicants_with_dont_cares(
+                primes, minterms, variables_count, time_limit, return_finished=True
+                )
 
-            if not literals:
-                term_str = "1"
-            else:
-                if len(literals) == 1:
-                    term_str = literals[0]
-                else:
-                    term_str = " AND ".join(literals)
-                    term_str = f"({term_str})"
+            return {implicant_to_string(implicant, variables_count) for implicant in cover}, finished
+
+        if self.dont_care_ast is None:
+            manager, root = self.to_bdd()
+            dont_care_root = FALSE
+        else:
+            manager, (root, dont_care_root) = ordered_bdd([self.ast, self.dont_care_ast], self.bdd_ordering)
+
+        if form == "pos":
+            root = manager.negate(root)
+
+        lower = manager.apply("AND", root, manager.negate(dont_care_root))
+        upper = manager.apply("OR", root, dont_care_root)
+
+        if lower == FALSE:
+            return set(), True
 
-            terms_str.append(term_str)
+        if upper == TRUE:
+            return {"-" * variables_count}, True
 
-        minimized_expression = " OR ".join(terms_str)
-        minimized_expression = self.remove_outer_parens(minimized_expression)
-        self._minimized_cache = minimized_expression
+        cover, finished = espresso(
+            isop(manager, lower, upper, self.variables),
+            isop(manager, dont_care_root, dont_care_root, self.variables), variables_count,
+            time_limit=time_limit, is_implicant=bdd_implicant_check(manager, upper, self.variables),
+            return_finished=True
+            )
 
-        return minimized_expression
+        return {implicant_to_string(cube, variables_count) for cube in cover}, finished
+
+    @memoized_artifact
+    def exact_cover_problem(self, form="sop"):
+        """
+        The covering problem the exact method solves for "sop", or for "pos" on
+        the complement: the minterms to cover, and the prime implicants of the
+        minterms and don't cares as (value, mask) pairs (see quine_mccluskey.py).
+        """
+        variables_count = len(self.variables)
+        dont_care_vector = self.get_dont_care_vector()
+        truth_vector = self.get_truth_vector()
+
+        if form == "pos":
+            truth_vector ^= truth_table_mask(variables_count)
+
+        on_set = TruthTable(truth_vector & ~dont_care_vector, variables_count)
+        minterms = list(on_set.minterms())
+
+        if not minterms:
+            return minterms, set()
+
+        if on_set.vector | dont_care_vector == truth_table_mask(variables_count):
+            return minterms, {(0, (1 << variables_count) - 1)}
+
+        dont_cares = list(TruthTable(dont_care_vector, variables_count).minterms())
+
+        return minterms, prime_implicants(minterms, variables_count, dont_cares, self.minimization_workers)
 
     def cofactor(self, variable, value):
         """
         Return a new BooleanFunction that is the cofactor of self by setting
-        a given variable to a specified value (0 or 1).
+        a given variable to a specified value (0 or 1). The don't cares are
+        restricted the same way and carried over as an expression.
         """
         if variable not in self.variables:
             raise ValueError(f"The variable {variable} is not part of the function.")
@@ -275,8 +782,15 @@ class BooleanFunction:
         new_variables = {var: value if var == variable else None for var in self.variables}
         new_ast = self.ast.substitute(new_variables).simplify()
         new_expression = str(new_ast)
+        new_dont_cares = None
+
+        if self.dont_care_ast is not None:
+            dont_care_ast = self.dont_care_ast.substitute(new_variables).simplify()
 
-        return BooleanFunction(new_expression)
+            if dont_care_ast is not ConstNode(0):
+                new_dont_cares = str(dont_care_ast)
+
+        return BooleanFunction.get(new_expression, dont_cares=new_dont_cares)
 
     def decompose(self, variable):
         """
@@ -291,10 +805,87 @@ class BooleanFunction:
 
         return cofactor0, cofactor1
 
+    @memoized_artifact
+    def to_bdd(self):
+        """
+        Build the reduced ordered BDD of the function, with the variable order
+        chosen by 'bdd_ordering', and return the (manager, root) pair.
+        """
+        manager, (root,) = ordered_bdd([self.ast], self.bdd_ordering)
+
+        return manager, root
+
+    def variable_order_report(self):
+        """
+        Compare the BDD node counts given by every variable ordering method,
+        as a list of (method, order, node_count) tuples.
+        """
+        return ordering_report([self.ast])
+
+    def shared_bdd(self, other):
+        """
+        Build this function and 'other' in one BDD manager over the union
+        of their variables and return (manager, root1, root2).
+        """
+        manager, (root1, root2) = ordered_bdd([self.ast, other.ast], self.bdd_ordering)
+
+        return manager, root1, root2
+
+    def find_counterexample(self, other):
+        """
+        Return an assignment (variable name -> 0/1, over the variables of both
+        functions) on which the two functions differ, or None if they are equivalent.
+        Decided by the SAT solver on the Tseitin encoding of f XOR g.
+        """
+        return find_difference(self.ast, other.ast)
+
+    def is_equivalent(self, other, method="sat"):
+        """
+        Check whether both functions take the same value on every assignment.
+        With method="sat" the miter f XOR g must be unsatisfiable; with method="bdd"
+        the two roots must be the same node of a shared BDD manager.
+        """
+        if method == "sat":
+            return self.find_counterexample(other) is None
+
+        if method == "bdd":
+            _, root1, root2 = self.shared_bdd(other)
+            return root1 == root2
+
+        raise ValueError(f"Unknown equivalence method {method}")
+
+    def count_models(self, method="auto", max_nodes=None, time_limit=None):
+        """
+        Count the assignments of the variables for which the function is 1:
+        bit-parallel enumeration for few variables, BDD sat_count otherwise
+        (see boolean_logic/model_counting.py). Raises BudgetExceeded when the
+        diagram needs more than 'max_nodes' nodes or 'time_limit' seconds.
+        Enumeration runs the cached compiled function.
+        """
+        return count_models(
+            self.ast, self.variables, method, self.bdd_ordering,
+            self.model_count_max_nodes if max_nodes is None else max_nodes, time_limit, self._packed_vector
+            )
+
+    def difference_measure(self, other, method="auto", max_nodes=None, time_limit=None):
+        """
+        Count the assignments of the union of the variables on which
+        the two functions differ, as the number of models of f XOR g.
+        """
+        variables = sorted(set(self.variables) | set(other.variables))
+
+        def truth_vector(columns, mask):
+            return self._packed_vector(columns, mask) ^ other._packed_vector(columns, mask)
+
+        return count_models(
+            XorNode(self.ast, other.ast), variables, method, self.bdd_ordering,
+            self.model_count_max_nodes if max_nodes is None else max_nodes, time_limit, truth_vector
+            )
+
     def __eq__(self, other):
         if not isinstance(other, BooleanFunction):
             return NotImplemented
-        return self.expression == other.expression
+        return self.expression == other.expression and self.dont_cares == other.dont_cares
 
     def __hash__(self):
         return hash(self.expression)
@@ -314,6 +905,64 @@ class BooleanFunctionSet:
         """
         self.functions.add(boolean_function)
 
+    def output_vectors(self):
+        """
+        Return (functions, variables, on_sets, dont_care_sets): the functions ordered
+        by expression, the union of their variables, and their truth vectors and
+        don't-care vectors over that union.
+        """
+        functions = sorted(self.functions, key=lambda function: function.expression)
+        variables = sorted(set().union(*(function.variables for function in functions)))
+        columns = truth_table_columns(variables)
+        mask = truth_table_mask(len(variables))
+        on_sets = []
+        dont_care_sets = []
+
+        for function in functions:
+            dont_cares = 0
+
+            if function.dont_care_ast is not None:
+                dont_cares = compile_ast(function.dont_care_ast, variables)(*columns.values(), mask)
+
+            dont_care_sets.append(dont_cares)
+            on_sets.append(compile_ast(function.ast, variables)(*columns.values(), mask) & ~dont_cares)
+
+        return functions, variables, on_sets, dont_care_sets
+
+    def minimize_jointly(self, time_limit=None):
+        """
+        Minimize all the functions together so that they share product terms
+        (see boolean_logic/multi_output.py) and return a dict function -> sum of
+        products over the union of their variables. The covering step is bounded
+        by 'time_limit' seconds, BooleanFunction.minimization_time_limit by default.
+        """
+        if time_limit is None:
+            time_limit = BooleanFunction.minimization_time_limit
+
+        functions, variables, on_sets, dont_care_sets = self.output_vectors()
+        cover = minimize_multi_output(on_sets, dont_care_sets, len(variables), time_limit)
+
+        return {
+            function: sum_of_products_to_str(
+                [implicant_to_string(cover.products[index], len(variables)) for index in product_indices],
+                variables
+                )
+            for function, product_indices in zip(functions, cover.outputs)
+        }
+
+    def shared_netlist(self, time_limit=None):
+        """
+        Return the jointly minimized functions as one Netlist whose outputs, named
+        by the expressions, share their NOT and AND gates.
+        """
+        if time_limit is None:
+            time_limit = BooleanFunction.minimization_time_limit
+
+        functions, variables, on_sets, dont_care_sets = self.output_vectors()
+        cover = minimize_multi_output(on_sets, dont_care_sets, len(variables), time_limit)
+
+        return cover_netlist(cover, variables, [function.expression for function in functions])
+
     def get_functions_info(self):
         """
         Collect descriptive information about each stored BooleanFunction,
@@ -322,16 +971,14 @@ class BooleanFunctionSet:
         functions_info = []
 
         for current_function in self.functions:
+            post_classes = current_function.post_classes()
             info = {
                 "expression": current_function.expression,
                 "simplified": current_function.simplify(),
                 "zhegalkin": current_function.to_zhegalkin(),
                 "properties": {
-                    "preserves_zero": current_function.preserves_zero(),
-                    "preserves_one": current_function.preserves_one(),
-                    "is_self_dual": current_function.is_self_dual(),
-                    "is_monotonic": current_function.is_monotonic(),
-                    "is_linear": current_function.is_linear(),
+                    name: post_classes[post_class] 
+                    for post_class, name in POST_CLASS_PROPERTIES.items()
                 },
                 "minimized": current_function.minimize(),
                 "number_of_variables": len(current_function.variables),
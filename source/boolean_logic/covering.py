@@ -0,0 +1,228 @@
+import time
+
+
+def iterate_bits(bitset):
+    """
+    Yield the indices of the bits set in 'bitset', lowest first.
+    """
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+class CoveringSolver:
+    """
+    Exact solver of the unate covering problem: choose a minimum-cost set of
+    columns (implicants) so that every row (minterm) is covered by one of them.
+
+    The matrix is stored as bitsets both ways: column_rows[j] holds the rows
+    covered by column j, and the rows of each column are looked up the same way.
+    The search alternates reductions and branching:
+
+    - essential columns: a row covered by a single column forces that column;
+    - row dominance: a row whose columns include all the columns of another
+      row is covered whenever that row is, and is dropped;
+    - column dominance: a column whose rows are a subset of the rows of
+      a column that is not more expensive is dropped.
+
+    What remains is the cyclic core. It is solved by branch and bound over the
+    columns of its hardest row, pruned with a lower bound from a maximal set of
+    independent rows (rows sharing no column, so each needs its own column).
+    A greedy cover gives the initial upper bound, so when 'time_limit' runs out
+    the best cover found so far is returned (and 'optimal' is False).
+    """
+
+    def __init__(self, column_rows, costs=None):
+        self.column_rows = list(column_rows)
+        self.costs = list(costs) if costs is not None else [1] * len(self.column_rows)
+        self.row_columns = {}
+
+        for column, rows in enumerate(self.column_rows):
+            for row in iterate_bits(rows):
+                self.row_columns[row] = self.row_columns.get(row, 0) | (1 << column)
+
+        self.branches = 0
+        self.cyclic_core = None
+        self.optimal = True
+        self._deadline = None
+        self._best = None
+        self._best_cost = None
+
+    def solve(self, rows=None, time_limit=None):
+        """
+        Return the sorted indices of a minimum-cost set of columns covering
+        'rows' (a bitset, by default every row of the matrix).
+        Raises ValueError if some row is not covered by any column.
+        """
+        if rows is None:
+            rows = 0
+
+            for column_rows in self.column_rows:
+                rows |= column_rows
+
+        for row in iterate_bits(rows):
+            if row not in self.row_columns:
+                raise ValueError(f"Row {row} is not covered by any column.")
+
+        self._deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.branches = 0
+        self.cyclic_core = None
+        self.optimal = True
+        self._best = self._greedy_cover(rows, (1 << len(self.column_rows)) - 1)
+        self._best_cost = sum(self.costs[column] for column in self._best)
+        self._search(rows, (1 << len(self.column_rows)) - 1, [])
+
+        return sorted(self._best)
+
+    def lower_bound(self, rows=None):
+        """
+        A lower bound on the cost of every cover of 'rows' (by default every row
+        of the matrix), from a maximal set of independent rows.
+        """
+        if rows is None:
+            rows = 0
+
+            for column_rows in self.column_rows:
+                rows |= column_rows
+
+        return self._lower_bound(rows, (1 << len(self.column_rows)) - 1)
+
+    def reduce(self, rows=None):
+        """
+        Apply the reductions of solve() without branching and return the (rows,
+        columns) bitsets of the cyclic core they leave, whose size tells how hard
+        the search will be, or None if some row is not covered by any column.
+        """
+        if rows is None:
+            rows = 0
+
+            for column_rows in self.column_rows:
+                rows |= column_rows
+
+        reduced = self._reduce(rows, (1 << len(self.column_rows)) - 1, [])
+
+        return None if reduced is None else reduced[:2]
+
+    def _search(self, rows, columns, selected):
+        reduced = self._reduce(rows, columns, list(selected))
+
+        if reduced is None:
+            return
+
+        rows, columns, selected = reduced
+        cost = sum(self.costs[column] for column in selected)
+
+        if self.cyclic_core is None:
+            self.cyclic_core = (rows.bit_count(), columns.bit_count())
+
+        if not rows:
+            if cost < self._best_cost:
+                self._best, self._best_cost = selected, cost
+            return
+
+        if cost + self._lower_bound(rows, columns) >= self._best_cost:
+            return
+
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            self.optimal = False
+            return
+
+        self.branches += 1
+        row = min(iterate_bits(rows), key=lambda row: (self.row_columns[row] & columns).bit_count())
+        candidates = sorted(
+            iterate_bits(self.row_columns[row] & columns),
+            key=lambda column: (self.costs[column], -(self.column_rows[column] & rows).bit_count())
+            )
+
+        for column in candidates:
+            self._search(rows & ~self.column_rows[column], columns & ~(1 << column), selected + [column])
+            # Later branches do not use this column: covers containing it were just explored.
+            columns &= ~(1 << column)
+
+    def _reduce(self, rows, columns, selected):
+        """
+        Apply essential columns, row dominance and column dominance until none
+        applies. Returns None if some row can no longer be covered.
+        """
+        changed = True
+
+        while changed and rows:
+            changed = False
+
+            for row in iterate_bits(rows):
+                if not rows >> row & 1:
+                    continue
+
+                row_columns = self.row_columns[row] & columns
+
+                if not row_columns:
+                    return None
+
+                if row_columns & (row_columns - 1) == 0:
+                    column = row_columns.bit_length() - 1
+                    selected.append(column)
+                    rows &= ~self.column_rows[column]
+                    columns &= ~row_columns
+                    changed = True
+
+            if changed:
+                continue
+
+            # The rows dominated by a row are those covered by every one of its columns.
+            for row in iterate_bits(rows):
+                if rows >> row & 1:
+                    dominated = rows
+
+                    for column in iterate_bits(self.row_columns[row] & columns):
+                        dominated &= self.column_rows[column]
+
+                    dominated &= ~(1 << row)
+
+                    if dominated:
+                        rows &= ~dominated
+                        changed = True
+
+            # The columns dominating a column are those covering every one of its rows.
+            for column in iterate_bits(columns):
+                dominating = columns & ~(1 << column)
+
+                for row in iterate_bits(self.column_rows[column] & rows):
+                    dominating &= self.row_columns[row]
+
+                if any(self.costs[other] <= self.costs[column] for other in iterate_bits(dominating)):
+                    columns &= ~(1 << column)
+                    changed = True
+
+        return rows, columns, selected
+
+    def _lower_bound(self, rows, columns):
+        """
+        Cost of a maximal independent set of rows, picked greedily from the rows
+        with the fewest columns: no column covers two of them.
+        """
+        bound = 0
+        blocked = 0
+
+        for row_columns in sorted(
+                (self.row_columns[row] & columns for row in iterate_bits(rows)), key=int.bit_count
+                ):
+            if not row_columns & blocked:
+                blocked |= row_columns
+                bound += min(self.costs[column] for column in iterate_bits(row_columns))
+
+        return bound
+
+    def _greedy_cover(self, rows, columns):
+        selected = []
+
+        while rows:
+            column = max(
+                iterate_bits(columns),
+                key=lambda column: (self.column_rows[column] & rows).bit_count() / self.costs[column]
+                )
+            selected.append(column)
+            rows &= ~self.column_rows[column]
+            columns &= ~(1 << column)
+
+        return selected
@@ -0,0 +1,168 @@
+import time
+
+
+def anf_cubes(polynomial, num_vars):
+    """
+    The monomials of a Zhegalkin polynomial (bit i standing for the i-th variable)
+    as positive (value, mask) cubes, the first variable being the most significant bit.
+    """
+    full = (1 << num_vars) - 1
+    cubes = []
+
+    for monomial in polynomial:
+        value = 0
+
+        for index in range(num_vars):
+            if monomial >> index & 1:
+                value |= 1 << (num_vars - index - 1)
+
+        cubes.append((value, full & ~value))
+
+    return cubes
+
+def xor_literal(a, b, position):
+    """
+    Cube 'a' with its literal at 'position' replaced by the XOR of the literals
+    of 'a' and 'b' there: x XOR NOT x is free, x XOR 1 is NOT x.
+    """
+    (a_value, a_mask), (b_value, b_mask) = a, b
+
+    if not (a_mask | b_mask) & position:
+        return a_value & ~position, a_mask | position
+
+    fixed_value = b_value if a_mask & position else a_value
+
+    return (a_value & ~position) | (~fixed_value & position), a_mask & ~position
+
+def esop_cost(cover, num_vars):
+    """
+    (cubes, literals) of an exclusive sum of products.
+    """
+    return len(cover), sum(num_vars - mask.bit_count() for _, mask in cover)
+
+def literal_alternatives(cube, position):
+    """
+    The two cubes that differ from 'cube' only by their literal at 'position'.
+    """
+    value, mask = cube
+
+    if mask & position:
+        return (value, mask & ~position), (value | position, mask & ~position)
+
+    return (value ^ position, mask), (value & ~position, mask | position)
+
+def exorlink(a, b, distance):
+    """
+    The two pairs of cubes whose exclusive sum equals a XOR b, for cubes at
+    distance 2: each keeps one of the differing positions of one cube and
+    takes the XOR of both literals at the other.
+    """
+    first = distance & -distance
+    second = distance ^ first
+
+    return (
+        (xor_literal(a, b, first), xor_literal(b, a, second)),
+        (xor_literal(b, a, first), xor_literal(a, b, second)),
+        )
+
+def _insert(cover, cube, positions, journal):
+    """
+    Add 'cube' to a cover where no two cubes are at distance 0 or 1, keeping it
+    so: equal cubes cancel and a cube at distance 1 merges into the new one.
+    Every change is appended to 'journal' as (added, cube).
+    """
+    while cube not in cover:
+        partner = None
+
+        for position in positions:
+            for other in literal_alternatives(cube, position):
+                if other in cover:
+                    partner = other
+                    break
+
+            if partner is not None:
+                break
+        else:
+            cover.add(cube)
+            journal.append((True, cube))
+            return
+
+        cover.remove(partner)
+        journal.append((False, partner))
+        cube = xor_literal(cube, partner, position)
+
+    cover.remove(cube)
+    journal.append((False, cube))
+
+def _journal_cost(journal, num_vars):
+    # Change of (cubes, literals) recorded by a journal.
+    cubes = literals = 0
+
+    for added, (_, mask) in journal:
+        sign = 1 if added else -1
+        cubes += sign
+        literals += sign * (num_vars - mask.bit_count())
+
+    return cubes, literals
+
+def exorcism(cubes, num_vars, time_limit=None, return_finished=False):
+    """
+    Heuristic minimization of an exclusive sum of products, in the style of
+    EXORCISM: cubes at distance 0 cancel and cubes at distance 1 merge as they
+    are inserted; then every pair at distance 2 is rewritten by an exorlink into
+    another pair whenever that, with the merges it enables, shrinks the cover in
+    (cubes, literals). Passes repeat until none improves or 'time_limit' seconds
+    have passed. Returns the cubes as a sorted list, or with 'return_finished'
+    (cubes, finished), 'finished' being False when the time limit stopped the passes.
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    positions = [1 << index for index in range(num_vars)]
+    position_pairs = [(first, second) for first in positions for second in positions if first < second]
+    cover = set()
+
+    for cube in cubes:
+        _insert(cover, cube, positions, [])
+
+    improved = True
+
+    while improved:
+        improved = False
+
+        for a in sorted(cover):
+            if deadline is not None and time.perf_counter() > deadline:
+                return (sorted(cover), False) if return_finished else sorted(cover)
+
+            for first, second in position_pairs:
+                if a not in cover:
+                    break
+
+                for middle in literal_alternatives(a, first):
+                    for b in literal_alternatives(middle, second):
+                        if b not in cover or b < a:
+                            continue
+
+                        for pair in exorlink(a, b, first | second):
+                            journal = [(False, a), (False, b)]
+                            cover.remove(a)
+                            cover.remove(b)
+
+                            for cube in pair:
+                                _insert(cover, cube, positions, journal)
+
+                            if _journal_cost(journal, num_vars) < (0, 0):
+                                improved = True
+                                break
+
+                            for added, cube in reversed(journal):
+                                if added:
+                                    cover.remove(cube)
+                                else:
+                                    cover.add(cube)
+
+                        if a not in cover:
+                            break
+
+                    if a not in cover:
+                        break
+
+    return (sorted(cover), True) if return_finished else sorted(cover)
@@ -0,0 +1,435 @@
+import time
+
+from boolean_logic.bdd import FALSE, TRUE
+from boolean_logic.covering import iterate_bits
+
+
+# Cubes are (value, mask) integer pairs, as the implicants of quine_mccluskey.py:
+# the bits set in 'mask' are free variables ("-") and 'value' holds the fixed
+# bits (0 under the mask). The first variable is the most significant bit.
+
+def cubes_intersect(first, second):
+    return (first[0] ^ second[0]) & ~first[1] & ~second[1] == 0
+
+def cube_contains(outer, inner):
+    return inner[1] & ~outer[1] == 0 and (outer[0] ^ inner[0]) & ~outer[1] == 0
+
+def cube_literals(cube, full):
+    return (full & ~cube[1]).bit_count()
+
+def cover_cost(cover, full):
+    """
+    Number of cubes, then number of literals: the order minimizers compare covers by.
+    """
+    return len(cover), sum(cube_literals(cube, full) for cube in cover)
+
+def cofactor(cubes, cube, full):
+    """
+    The cofactor of a cover with respect to 'cube': the cubes meeting it,
+    with the variables fixed by 'cube' made free.
+    """
+    cube_value, cube_mask = cube
+    fixed = full & ~cube_mask
+
+    return [
+        (value & cube_mask, mask | fixed) for value, mask in cubes
+        if (value ^ cube_value) & fixed & ~mask == 0
+        ]
+
+def _cofactor_variable(cubes, bit, polarity):
+    return [
+        (value & ~bit, mask | bit) for value, mask in cubes
+        if mask & bit or bool(value & bit) == polarity
+        ]
+
+def _splitting_variable(cubes, full):
+    """
+    The variable fixed in the most cubes, preferring binate ones (fixed
+    to 0 in some cubes and to 1 in others), or None if every cube is universal.
+    """
+    positive = negative = 0
+    counts = {}
+
+    for value, mask in cubes:
+        positive |= value
+        negative |= full & ~mask & ~value
+
+        for bit in iterate_bits(full & ~mask):
+            counts[bit] = counts.get(bit, 0) + 1
+
+    if not counts:
+        return None
+
+    binate = positive & negative
+
+    return 1 << max(counts, key=lambda bit: (binate >> bit & 1, counts[bit]))
+
+def complement(cubes, full):
+    """
+    A cover of the complement of 'cubes', by Shannon expansion on the most
+    binate variable; cubes that appear in both halves are kept whole.
+    """
+    if not cubes:
+        return [(0, full)]
+
+    if any(mask == full for _, mask in cubes):
+        return []
+
+    if len(cubes) == 1:
+        value, mask = cubes[0]
+        # De Morgan: one cube per fixed literal, with that literal flipped.
+        return [(~value & bit, full & ~bit) for bit in (1 << index for index in iterate_bits(full & ~mask))]
+
+    bit = _splitting_variable(cubes, full)
+    low = complement(_cofactor_variable(cubes, bit, False), full)
+    high = complement(_cofactor_variable(cubes, bit, True), full)
+    shared = set(low) & set(high)
+
+    return (
+        list(shared) +
+        [(value, mask & ~bit) for value, mask in low if (value, mask) not in shared] +
+        [(value | bit, mask & ~bit) for value, mask in high if (value, mask) not in shared]
+        )
+
+def is_tautology(cubes, full):
+    """
+    Check whether the cubes cover every assignment, by the unate recursive paradigm:
+    a cover that is unate in every variable is a tautology only if it holds the
+    universal cube; otherwise split on a binate variable.
+    """
+    if not cubes:
+        return False
+
+    if any(mask == full for _, mask in cubes):
+        return True
+
+    if sum(1 << mask.bit_count() for _, mask in cubes) < 1 << full.bit_count():
+        return False
+
+    positive = negative = 0
+
+    for value, mask in cubes:
+        positive |= value
+        negative |= full & ~mask & ~value
+
+    if not positive & negative:
+        return False
+
+    bit = _splitting_variable(cubes, full)
+
+    return (
+        is_tautology(_cofactor_variable(cubes, bit, False), full) and
+        is_tautology(_cofactor_variable(cubes, bit, True), full)
+        )
+
+def cube_is_covered(cube, cubes, full):
+    return is_tautology(cofactor(cubes, cube, full), full)
+
+def supercube_of_complement(cubes, full):
+    """
+    The smallest cube containing the complement of 'cubes', or None if they are
+    a tautology. The complement lies in x = 1 exactly when the cofactor x = 0
+    of the cover is a tautology, so no complement is built.
+    """
+    if is_tautology(cubes, full):
+        return None
+
+    fixed = 0
+
+    for _, mask in cubes:
+        fixed |= full & ~mask
+
+    ones = zeros = 0
+
+    for bit in (1 << index for index in iterate_bits(fixed)):
+        if is_tautology(_cofactor_variable(cubes, bit, False), full):
+            ones |= bit
+        elif is_tautology(_cofactor_variable(cubes, bit, True), full):
+            zeros |= bit
+
+    return ones, full & ~(ones | zeros)
+
+def expand(cover, off_set, full, is_implicant=None):
+    """
+    Make every cube prime by freeing its literals while it does not meet the off-set
+    (or, when 'is_implicant' is given, while that predicate accepts the cube).
+    At each step the literal freed is the one whose expansion meets the most other
+    cubes of the cover, so that the cube grows towards its neighbours; the cubes
+    contained in an expanded one are dropped. Large cubes are expanded first.
+    """
+    expanded = []
+    pending = sorted(cover, key=lambda cube: cube[1].bit_count(), reverse=True)
+
+    for index, cube in enumerate(pending):
+        if any(cube_contains(other, cube) for other in expanded):
+            continue
+
+        value, mask = cube
+        # Literals that cannot be freed stay so: the cube only grows.
+        blocked = 0
+        # The literals on which the cube clashes with each off-set cube: a literal
+        # cannot be freed while it is the only clash with some off-set cube.
+        conflicts = None if is_implicant else [
+            (value ^ other_value) & ~mask & ~other_mask for other_value, other_mask in off_set
+            ]
+
+        while True:
+            if conflicts is not None:
+                for conflict in conflicts:
+                    if conflict & (conflict - 1) == 0:
+                        blocked |= conflict
+
+            free = full & ~mask & ~blocked
+            scores = dict.fromkeys(iterate_bits(free), 0)
+
+            # A neighbour conflicting with the cube in a single literal is met once that literal is freed.
+            for other_value, other_mask in pending[index + 1:]:
+                conflict = (value ^ other_value) & ~mask & ~other_mask
+
+                if conflict & free and conflict & (conflict - 1) == 0:
+                    scores[conflict.bit_length() - 1] += 1
+
+            for bit in sorted(scores, key=scores.get, reverse=True):
+                if conflicts is not None or is_implicant((value & ~(1 << bit), mask | (1 << bit))):
+                    break
+
+                blocked |= 1 << bit
+            else:
+                break
+
+            value, mask = value & ~(1 << bit), mask | (1 << bit)
+
+            if conflicts is not None:
+                conflicts = [conflict & ~(1 << bit) for conflict in conflicts]
+
+        expanded.append((value, mask))
+
+    return [
+        cube for index, cube in enumerate(expanded)
+        if not any(cube_contains(other, cube) for other in expanded[index + 1:])
+        ]
+
+def irredundant(cover, dont_cares, full):
+    """
+    Drop, smallest first, the cubes covered by the rest of the cover and the don't cares.
+    """
+    cover = list(cover)
+
+    for cube in sorted(cover, key=lambda cube: cube[1].bit_count()):
+        others = [other for other in cover if other != cube]
+
+        if cube_is_covered(cube, others + dont_cares, full):
+            cover = others
+
+    return cover
+
+def _reduce_cube(cube, others, full):
+    """
+    The smallest cube containing the minterms of 'cube' that 'others' do not cover,
+    or None if there are none.
+    """
+    remainder = supercube_of_complement(cofactor(others, cube, full), full)
+
+    if remainder is None:
+        return None
+
+    return cube[0] | remainder[0], cube[1] & remainder[1]
+
+def reduce(cover, dont_cares, full):
+    """
+    Shrink, largest first, every cube to the smallest cube containing the minterms
+    only it covers, so that the next expansion can move it somewhere better.
+    Cubes covering nothing of their own are dropped.
+    """
+    cover = sorted(cover, key=lambda cube: cube[1].bit_count(), reverse=True)
+    index = 0
+
+    while index < len(cover):
+        reduced = _reduce_cube(cover[index], cover[:index] + cover[index + 1:] + dont_cares, full)
+
+        if reduced is None:
+            del cover[index]
+        else:
+            cover[index] = reduced
+            index += 1
+
+    return cover
+
+def last_gasp(cover, dont_cares, off_set, full, is_implicant=None):
+    """
+    Reduce every cube against the rest of the cover independently (rather than one
+    after the other), expand the results, and let IRREDUNDANT choose among the old
+    and the new primes: a way out of the local minimum REDUCE/EXPAND settled in.
+    """
+    reduced = [
+        _reduce_cube(cube, cover[:index] + cover[index + 1:] + dont_cares, full)
+        for index, cube in enumerate(cover)
+        ]
+    new_primes = [
+        cube for cube in expand([cube for cube in reduced if cube is not None], off_set, full, is_implicant)
+        if cube not in cover
+        ]
+
+    return irredundant(new_primes + cover, dont_cares, full)
+
+def espresso(on_set, dont_cares, num_vars, off_set=None, time_limit=None, is_implicant=None, return_finished=False):
+    """
+    Heuristic two-level minimization in the style of Espresso-II: starting from
+    any cover of the on-set (minterms, an ISOP, ...), iterate EXPAND,
+    IRREDUNDANT and REDUCE until the cost (cubes, then literals) stops improving,
+    then try LAST_GASP and go on while it helps.
+    No prime implicant is enumerated, so it scales past the range of exact
+    Quine-McCluskey, but the result is only a local minimum: an irredundant
+    cover of primes.
+
+    EXPAND checks cubes against the off-set, the complement of the on-set and the
+    don't cares unless it is given, or with the 'is_implicant' predicate when the
+    off-set is too large to list (see bdd_implicant_check).
+    Past 'time_limit' seconds the best cover so far is returned. With
+    'return_finished', returns (cover, finished), 'finished' being False when the
+    time limit stopped the iterations before they converged.
+    """
+    full = (1 << num_vars) - 1
+    on_set = list(on_set)
+    dont_cares = list(dont_cares or [])
+
+    if off_set is None and is_implicant is None:
+        off_set = complement(on_set + dont_cares, full)
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    best = irredundant(expand(on_set, off_set, full, is_implicant), dont_cares, full)
+    best_cost = cover_cost(best, full)
+    finished = False
+
+    while deadline is None or time.perf_counter() < deadline:
+        cover = expand(reduce(best, dont_cares, full), off_set, full, is_implicant)
+        cover = irredundant(cover, dont_cares, full)
+        cost = cover_cost(cover, full)
+
+        if cost >= best_cost:
+            cover = last_gasp(best, dont_cares, off_set, full, is_implicant)
+            cost = cover_cost(cover, full)
+
+            if cost >= best_cost:
+                finished = True
+                break
+
+        best, best_cost = cover, cost
+
+    return (best, finished) if return_finished else best
+
+def _variable_bits(variables):
+    return {name: 1 << (len(variables) - 1 - index) for index, name in enumerate(variables)}
+
+def isop(manager, lower, upper, variables):
+    """
+    Minato-Morreale irredundant sum of products of any function between the BDDs
+    'lower' and 'upper' (the on-set, and the on-set with the don't cares), as
+    cubes over 'variables' (the first one is the most significant bit, whatever
+    the BDD order). It gives Espresso a compact starting cover: unlike the paths
+    of the diagram, its cubes are not forced to be disjoint.
+    Each call is a generator that yields the (lower, upper) calls it needs and
+    is sent their results, so the pending calls live on an explicit stack.
+    """
+    bits = _variable_bits(variables)
+    full = (1 << len(variables)) - 1
+    results = {}
+
+    def cofactors(node, level):
+        if manager.level(node) != level:
+            return node, node
+
+        return manager.low(node), manager.high(node)
+
+    def known(lower, upper):
+        if lower == FALSE:
+            return [], FALSE
+        if upper == TRUE:
+            return [(0, full)], TRUE
+
+        return results.get((lower, upper))
+
+    def cover(lower, upper):
+        level = min(manager.level(lower), manager.level(upper))
+        bit = bits[manager.variables[level]]
+        lower0, lower1 = cofactors(lower, level)
+        upper0, upper1 = cofactors(upper, level)
+        # Cubes that need the literal: parts of the on-set outside the other half.
+        cubes0, cover0 = yield manager.apply("AND", lower0, manager.negate(upper1)), upper0
+        cubes1, cover1 = yield manager.apply("AND", lower1, manager.negate(upper0)), upper1
+        rest = manager.apply(
+            "OR",
+            manager.apply("AND", lower0, manager.negate(cover0)),
+            manager.apply("AND", lower1, manager.negate(cover1))
+            )
+        cubes, shared = yield rest, manager.apply("AND", upper0, upper1)
+        results[lower, upper] = (
+            [(value, mask & ~bit) for value, mask in cubes0] +
+            [(value | bit, mask & ~bit) for value, mask in cubes1] +
+            cubes,
+            manager.ite(
+                manager.make_node(level, FALSE, TRUE),
+                manager.apply("OR", cover1, shared), manager.apply("OR", cover0, shared)
+                )
+            )
+
+    if known(lower, upper) is not None:
+        return known(lower, upper)[0]
+
+    stack = [((lower, upper), cover(lower, upper))]
+    result = None
+
+    while stack:
+        key, call = stack[-1]
+
+        try:
+            request = call.send(result)
+        except StopIteration:
+            stack.pop()
+            result = results[key]
+            continue
+
+        result = known(*request)
+
+        if result is None:
+            stack.append((request, cover(*request)))
+
+    return results[lower, upper][0]
+
+def bdd_implicant_check(manager, root, variables):
+    """
+    A predicate telling whether a cube over 'variables' implies the function
+    of the BDD 'root': every path the cube allows ends in TRUE.
+    """
+    bits = _variable_bits(variables)
+    node_bits = {}
+
+    def is_implicant(cube):
+        value, mask = cube
+        stack = [root]
+        seen = set()
+
+        while stack:
+            node = stack.pop()
+
+            if node == FALSE:
+                return False
+
+            if node == TRUE or node in seen:
+                continue
+
+            seen.add(node)
+
+            if node not in node_bits:
+                node_bits[node] = bits[manager.variables[manager.level(node)]]
+
+            bit = node_bits[node]
+
+            if mask & bit:
+                stack.extend((manager.low(node), manager.high(node)))
+            else:
+                stack.append(manager.high(node) if value & bit else manager.low(node))
+
+        return True
+
+    return is_implicant
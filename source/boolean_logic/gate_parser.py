@@ -12,10 +12,53 @@ class GateNode:
         return f"GateNode({self.gate_type}, {self.children})"
 
 
+class Netlist:
+    """
+    A gate-level circuit with several named outputs. Gates are (gate_type, inputs)
+    pairs referred to by their index: "VAR" and "CONST" gates hold a variable name
+    or a 0/1 value, the others ("AND", "OR", "NOT") the indices of their inputs.
+    Identical gates are created once, so outputs share every common subcircuit.
+    """
+
+    def __init__(self):
+        self.gates = []
+        self.outputs = {}
+        self._index = {}
+
+    def gate(self, gate_type, *inputs):
+        """
+        Return the index of the gate of the given type and inputs, creating it if needed.
+        The inputs of AND and OR gates are unordered.
+        """
+        if gate_type in ("AND", "OR"):
+            inputs = tuple(sorted(set(inputs)))
+
+        key = (gate_type, inputs)
+
+        if key not in self._index:
+            self._index[key] = len(self.gates)
+            self.gates.append(key)
+
+        return self._index[key]
+
+    def gate_count(self):
+        """
+        Number of logic gates (AND, OR, NOT), inputs and constants excluded.
+        """
+        return sum(gate_type not in ("VAR", "CONST") for gate_type, _ in self.gates)
+
+    def gate_input_count(self):
+        """
+        Total number of inputs of the logic gates, the usual measure of the wiring.
+        """
+        return sum(len(inputs) for gate_type, inputs in self.gates if gate_type not in ("VAR", "CONST"))
+
+
 def parse_minimized_expression(expression):
     """
-    Parse a minimized Boolean expression (e.g., "A AND B", "(NOT A) OR B")
-    into a GateNode AST structure suitable for further processing or visualization.
+    Parse a minimized Boolean expression (e.g., "A AND B", "(NOT A) OR B",
+    "(A AND NOT B) XOR C") into a GateNode AST structure suitable for further
+    processing or visualization.
     """
     expression = expression.strip()
 
@@ -46,7 +89,12 @@ def parse_minimized_expression(expression):
             elif ch == ")":
                 count -= 1
             else:
-                if count == 0:
+                # An operator starts a word: "FXOR" and "LAND" are variables.
+                if count == 0 and (i == 0 or expression[i - 1] in (" ", ")")):
+                    if expression[i:].startswith("XOR"):
+                        next_index = i + 3
+                        if next_index >= len(expression) or expression[next_index] in (" ", "("):
+                            return "XOR", i
                     if expression[i:].startswith("AND"):
                         next_index = i + 3
                         if next_index >= len(expression) or expression[next_index] in (" ", "("):
@@ -84,6 +132,15 @@ def parse_minimized_expression(expression):
 
             return GateNode("OR", [left_node, right_node])
 
+        elif operator == "XOR":
+            left = expression[:index].strip()
+            right = expression[index+3:].strip()
+
+            left_node = parse_minimized_expression(left)
+            right_node = parse_minimized_expression(right)
+
+            return GateNode("XOR", [left_node, right_node])
+
     if expression.startswith("NOT"):
         sub_expression = expression[3:].strip()
 
@@ -124,3 +181,24 @@ def gate_ast_to_graphviz(node, graph):
             graph.edge(node_id, c_id)
             
     return node_id
+
+def netlist_to_graphviz(netlist, graph):
+    """
+    Add every gate of the Netlist to a graphviz Digraph, drawn like gate_ast_to_graphviz
+    (boxes for gates, circles for variables), plus one node per output.
+    Shared gates are drawn once, with an edge to each gate using them.
+    """
+    for index, (gate_type, inputs) in enumerate(netlist.gates):
+        if gate_type == "VAR":
+            graph.node(f"gate{index}", inputs[0], shape="circle")
+        elif gate_type == "CONST":
+            graph.node(f"gate{index}", str(inputs[0]), shape="circle")
+        else:
+            graph.node(f"gate{index}", gate_type, shape="box")
+
+            for input_index in inputs:
+                graph.edge(f"gate{index}", f"gate{input_index}")
+
+    for position, (name, index) in enumerate(netlist.outputs.items()):
+        graph.node(f"output{position}", name, shape="doublecircle")
+        graph.edge(f"output{position}", f"gate{index}")
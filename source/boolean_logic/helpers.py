@@ -8,13 +8,14 @@ def add_polynomials(polynomial1, polynomial2):
 def multiply_polynomials(polynomial1, polynomial2):
     """
     Returns the product of two Zhegalkin polynomials,
-    where monomials are combined via XOR.
+    where monomials are combined via OR (x*x = x) and
+    equal products cancel out in pairs.
     """
     result = set()
 
     for m1 in polynomial1:
         for m2 in polynomial2:
-            product_monom = m1 ^ m2
+            product_monom = m1 | m2
 
             if product_monom in result:
                 result.remove(product_monom)
@@ -47,3 +48,85 @@ def zhegalkin_polynomial_to_str(polynomial, variables):
     terms = [monomial_to_str(m, variables) for m in polynomial]
     
     return " + ".join(terms)
+
+# The positions of the set bits of every byte value.
+BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+def vector_bytes(vector, bits_count):
+    """
+    Return the packed vector as little-endian bytes: bit r is bit r % 8 of byte r // 8.
+    """
+    return vector.to_bytes((max(bits_count, vector.bit_length()) + 7) // 8, "little")
+
+def set_bit_indices(vector):
+    """
+    Yield the indices of the bits set in 'vector', lowest first, in one linear pass
+    over its bytes (clearing the lowest bit repeatedly would copy the whole
+    integer once per bit).
+    """
+    for offset, byte in enumerate(vector_bytes(vector, 0)):
+        if byte:
+            base = offset << 3
+
+            for bit in BYTE_BITS[byte]:
+                yield base + bit
+
+def truth_table_mask(variables_count):
+    """
+    Return an integer with one set bit per truth table row (2^n bits in total).
+    """
+    return (1 << (1 << variables_count)) - 1
+
+def truth_table_column(index, variables_count):
+    """
+    Return the packed truth table column of the variable at 'index'.
+    Bit r of the result is the value of that variable in row r, where rows
+    follow itertools.product order (the first variable is the most significant bit).
+    """
+    block = 1 << (variables_count - index - 1)
+    rows_count = 1 << variables_count
+    column = ((1 << block) - 1) << block
+    width = 2 * block
+
+    while width < rows_count:
+        column |= column << width
+        width *= 2
+
+    return column
+
+def truth_table_columns(variables):
+    """
+    Map every variable name to its packed truth table column.
+    """
+    variables_count = len(variables)
+
+    return {
+        variable: truth_table_column(index, variables_count)
+        for index, variable in enumerate(variables)
+    }
+
+def mobius_transform(truth_vector, variables_count):
+    """
+    Fast Möbius (butterfly) transform of a packed truth table over GF(2).
+    Bit r of the result is the coefficient of the monomial made of the variables
+    that are 1 in row r. Each variable costs one shift and one XOR of the whole
+    vector, so the transform is O(n * 2^n) bit operations.
+    """
+    for index in range(variables_count):
+        column = truth_table_column(index, variables_count)
+        block = 1 << (variables_count - index - 1)
+        truth_vector ^= (truth_vector & ~column) << block
+
+    return truth_vector
+
+def anf_vector_to_polynomial(anf_vector, variables_count):
+    """
+    Convert the packed output of mobius_transform into a Zhegalkin polynomial
+    (set of monomial bitmasks, where bit i stands for the i-th variable).
+    The coefficients are read in one linear pass (see set_bit_indices); the
+    monomial of row r is r with its variables_count bits reversed.
+    """
+    return {
+        int(format(row, f"0{variables_count}b")[::-1], 2) if variables_count else 0
+        for row in set_bit_indices(anf_vector)
+        }
@@ -5,7 +5,7 @@ import numpy as np
 class KarnaughMap:
     """
     Constructs and plots a Karnaugh map (K-map) for a given Boolean function,
-    supporting 2 to 4 variables.
+    supporting 2 to 4 variables. Don't-care cells are marked "X".
     """
     
     def __init__(self, boolean_function):
@@ -20,6 +20,7 @@ class KarnaughMap:
         if self.variable_count < 2 or self.variable_count > 4:
             raise ValueError("Karnaugh maps are only supported for 2 to 4 variables.")
         self.truth_table = boolean_function.get_truth_table()
+        self.dont_cares = boolean_function.get_dont_care_vector()
 
     def generate_map(self):
         """
@@ -33,6 +34,12 @@ class KarnaughMap:
         elif self.variable_count == 4:
             return self._generate_map_4vars()
 
+    def _cell(self, index, result):
+        """
+        The text of the cell of a truth table row: "X" for a don't care, else the value.
+        """
+        return "X" if self.dont_cares >> index & 1 else str(result)
+
     def _generate_map_2vars(self):
         variables_order = self.variables
         mapping = {
@@ -43,9 +50,9 @@ class KarnaughMap:
         }
         kmap = [""]*4
 
-        for values, result in self.truth_table:
+        for index, (values, result) in enumerate(self.truth_table):
             position = mapping[values]
-            kmap[position] = str(result)
+            kmap[position] = self._cell(index, result)
 
         kmap = np.array(kmap).reshape((2,2))
         return kmap, variables_order
@@ -60,9 +67,9 @@ class KarnaughMap:
         }
         kmap = [""]*8
 
-        for values, result in self.truth_table:
+        for index, (values, result) in enumerate(self.truth_table):
             position = mapping[values]
-            kmap[position] = str(result)
+            kmap[position] = self._cell(index, result)
 
         kmap = np.array(kmap).reshape((2,4))
         return kmap, variables_order
@@ -77,9 +84,9 @@ class KarnaughMap:
         }
         kmap = [""]*16
 
-        for values, result in self.truth_table:
+        for index, (values, result) in enumerate(self.truth_table):
             position = mapping[values]
-            kmap[position] = str(result)
+            kmap[position] = self._cell(index, result)
 
         kmap = np.array(kmap).reshape((4,4))
         return kmap, variables_order
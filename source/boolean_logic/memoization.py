@@ -0,0 +1,117 @@
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    A least-recently-used mapping with a size bound and hit/miss statistics.
+    When more than 'maxsize' entries are stored, or the total weight of the entries
+    (as measured by 'weigher') exceeds 'maxweight', the least recently used entries
+    are evicted. A bound of None means the cache is unbounded in that dimension.
+    An entry heavier than 'maxweight' on its own is not kept, rather than flushing
+    every other entry for it. With 'reweigh', entries are weighed again when they
+    are read, for values that grow after being cached.
+    """
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, reweigh=False):
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weigher = weigher
+        self.reweigh = reweigh
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._weights = {}
+
+    def get(self, key, default=None):
+        """
+        Return the value stored under 'key' (marking it as recently used),
+        or 'default' if it is not cached.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = self._entries[key]
+
+            if self.reweigh and self.weigher is not None:
+                self._weigh(key, value)
+                self._evict()
+
+            return value
+        
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """
+        Store 'value' under 'key', evicting the least recently used entries if needed.
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        if self.weigher is not None:
+            self._weigh(key, value)
+
+        self._evict()
+
+    def _weigh(self, key, value):
+        weight = self.weigher(value)
+        self.weight += weight - self._weights.get(key, 0)
+        self._weights[key] = weight
+
+        if self.maxweight is not None and weight > self.maxweight:
+            del self._entries[key]
+            self.weight -= self._weights.pop(key)
+
+    def _evict(self):
+        while self._entries and (
+            (self.maxsize is not None and len(self._entries) > self.maxsize) or
+            (self.maxweight is not None and self.weight > self.maxweight)
+            ):
+            key, _ = self._entries.popitem(last=False)
+            self.weight -= self._weights.pop(key, 0)
+
+    def clear(self):
+        self._entries.clear()
+        self._weights.clear()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def memoized_artifact(method):
+    """
+    Cache the result of a method in the instance's '_artifacts' LRUCache, keyed
+    by the method name (plus the arguments, when it is called with any, which
+    must then be hashable). Because the cache lives on the instance, it is
+    released together with it, unlike a functools.lru_cache on the method.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items()))) if args or kwargs else name
+        value = self._artifacts.get(key, _MISSING)
+
+        if value is _MISSING:
+            value = method(self, *args, **kwargs)
+            self._artifacts.put(key, value)
+
+        return value
+
+    return wrapper
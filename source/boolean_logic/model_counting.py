@@ -0,0 +1,44 @@
+import time
+
+from boolean_logic.helpers import truth_table_columns, truth_table_mask
+from boolean_logic.ordering import ordered_bdd
+
+
+# Up to this many variables the models are counted by evaluating the function once
+# over packed truth table columns, which beats building a diagram.
+ENUMERATION_VARIABLE_LIMIT = 16
+
+COUNTING_METHODS = ("auto", "enumeration", "bdd")
+
+
+def count_models(
+        node, variables, method="auto", ordering="force", max_nodes=None, time_limit=None, truth_vector=None
+        ):
+    """
+    Count the assignments of 'variables' (a superset of the variables of 'node')
+    that satisfy 'node', without enumerating them one by one.
+
+    method="enumeration" evaluates the function bit-parallel over the packed
+    columns of all 2^n rows, with 'truth_vector' (a callable taking the columns
+    by variable name and the row mask, such as a compiled evaluator) when given,
+    else by walking the AST; method="bdd" builds the ROBDD (with the given
+    variable 'ordering') and uses its sat_count; "auto" enumerates up to
+    ENUMERATION_VARIABLE_LIMIT variables and uses the BDD above.
+    'max_nodes' and 'time_limit' (seconds) bound the BDD; exceeding either
+    raises BudgetExceeded.
+    """
+    if method not in COUNTING_METHODS:
+        raise ValueError(f"Unknown model counting method {method}")
+
+    if method == "enumeration" or (method == "auto" and len(variables) <= ENUMERATION_VARIABLE_LIMIT):
+        columns = truth_table_columns(variables)
+        mask = truth_table_mask(len(variables))
+        vector = node.evaluate_bitwise(columns, mask) if truth_vector is None else truth_vector(columns, mask)
+
+        return vector.bit_count()
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    manager, (root,) = ordered_bdd([node], ordering, max_nodes, deadline)
+
+    # Variables the node does not depend on double the count each.
+    return manager.sat_count(root) << (len(variables) - len(manager.variables))
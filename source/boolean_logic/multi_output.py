@@ -0,0 +1,183 @@
+from collections import namedtuple
+
+from boolean_logic.covering import CoveringSolver, iterate_bits
+from boolean_logic.gate_parser import Netlist
+
+
+# 'products' lists the selected (value, mask) implicants once; 'outputs' holds,
+# for every output, the indices of the products its sum uses.
+MultiOutputCover = namedtuple("MultiOutputCover", ["products", "outputs"])
+
+
+def cube_vector(implicant):
+    """
+    The minterms of a (value, mask) implicant as a packed truth vector.
+    """
+    value, mask = implicant
+    vector = 0
+    subset = mask
+
+    # Walk every subset of the free bits.
+    while True:
+        vector |= 1 << (value | subset)
+
+        if subset == 0:
+            return vector
+
+        subset = (subset - 1) & mask
+
+def multi_output_prime_implicants(on_sets, dont_care_sets, num_vars):
+    """
+    Prime implicants of several functions at once, tagged with the outputs they
+    are implicants of: a dict (value, mask) -> bitset of output indices.
+
+    The functions are packed truth vectors over the same variables. Every term
+    carries the outputs whose on-set or don't cares contain it; two terms merge
+    as in Quine-McCluskey when they share an output, into a term tagged with
+    the outputs they share. A term is checked off only when a merge keeps all of
+    its outputs, so a term shared by two outputs stays prime even when each
+    output alone would merge it into something larger.
+    """
+    tags = {}
+
+    for output, (on_set, dont_cares) in enumerate(zip(on_sets, dont_care_sets)):
+        for minterm in iterate_bits(on_set | dont_cares):
+            tags[minterm] = tags.get(minterm, 0) | (1 << output)
+
+    groups = {}
+
+    for minterm, tag in tags.items():
+        groups.setdefault((minterm.bit_count(), 0), {})[minterm] = tag
+
+    full_mask = (1 << num_vars) - 1
+    primes = {}
+
+    while groups:
+        new_groups = {}
+        checked = set()
+
+        for (count_of_ones, mask), terms in groups.items():
+            next_terms = groups.get((count_of_ones + 1, mask))
+
+            if not next_terms:
+                continue
+
+            free_bits = full_mask & ~mask
+
+            for value, tag in terms.items():
+                zero_bits = free_bits & ~value
+
+                while zero_bits:
+                    bit = zero_bits & -zero_bits
+                    zero_bits ^= bit
+                    partner_tag = next_terms.get(value | bit)
+
+                    if partner_tag is None or not tag & partner_tag:
+                        continue
+
+                    shared = tag & partner_tag
+                    new_groups.setdefault((count_of_ones, mask | bit), {})[value] = shared
+
+                    if shared == tag:
+                        checked.add((value, mask))
+                    if shared == partner_tag:
+                        checked.add((value | bit, mask))
+
+        for (_, mask), terms in groups.items():
+            primes.update(((value, mask), tag) for value, tag in terms.items() if (value, mask) not in checked)
+
+        groups = new_groups
+
+    return primes
+
+def minimize_multi_output(on_sets, dont_care_sets, num_vars, time_limit=None):
+    """
+    Minimize several functions over the same variables together, so that they share
+    product terms: one generation of tagged prime implicants, then one covering
+    problem whose rows are the (output, minterm) pairs of the on-sets and whose
+    columns are the implicants, each covering its minterms in all of its outputs.
+    The cover has the fewest distinct products, then the fewest literals; every
+    output then keeps an irredundant subset of the products available to it.
+    Returns a MultiOutputCover.
+    """
+    rows_count = 1 << num_vars
+    primes = multi_output_prime_implicants(on_sets, dont_care_sets, num_vars)
+    candidates = sorted(primes)
+    vectors = [cube_vector(implicant) for implicant in candidates]
+    coverage = []
+
+    for implicant, vector in zip(candidates, vectors):
+        rows = 0
+
+        for output in iterate_bits(primes[implicant]):
+            rows |= (vector & on_sets[output]) << (output * rows_count)
+
+        coverage.append(rows)
+
+    all_rows = 0
+
+    for output, on_set in enumerate(on_sets):
+        all_rows |= on_set << (output * rows_count)
+
+    # Any product costs more than the literals of the whole cover, so the count comes first.
+    implicant_cost = num_vars * len(candidates) + 1
+    costs = [implicant_cost + num_vars - mask.bit_count() for _, mask in candidates]
+    selected = CoveringSolver(coverage, costs).solve(all_rows, time_limit) if all_rows else []
+    products = [candidates[column] for column in selected]
+    outputs = []
+
+    for output, on_set in enumerate(on_sets):
+        usable = [
+            index for index, column in enumerate(selected)
+            if primes[candidates[column]] >> output & 1 and vectors[column] & on_set
+            ]
+        # Drop, smallest first, the products the others already cover for this output.
+        for index in sorted(usable, key=lambda index: products[index][1].bit_count()):
+            others = 0
+
+            for other in usable:
+                if other != index:
+                    others |= vectors[selected[other]]
+
+            if vectors[selected[index]] & on_set & ~others == 0:
+                usable.remove(index)
+
+        outputs.append(sorted(usable))
+
+    return MultiOutputCover(products, outputs)
+
+def cover_netlist(cover, variables, output_names):
+    """
+    Build the shared-gate Netlist of a MultiOutputCover: one NOT gate per
+    complemented variable, one AND gate per product and one OR gate per output.
+    """
+    netlist = Netlist()
+    num_vars = len(variables)
+    product_gates = []
+
+    for value, mask in cover.products:
+        literals = []
+
+        for index, name in enumerate(variables):
+            bit = 1 << (num_vars - index - 1)
+
+            if not mask & bit:
+                variable = netlist.gate("VAR", name)
+                literals.append(variable if value & bit else netlist.gate("NOT", variable))
+
+        if not literals:
+            product_gates.append(netlist.gate("CONST", 1))
+        elif len(literals) == 1:
+            product_gates.append(literals[0])
+        else:
+            product_gates.append(netlist.gate("AND", *literals))
+
+    for name, product_indices in zip(output_names, cover.outputs):
+        if not product_indices:
+            netlist.outputs[name] = netlist.gate("CONST", 0)
+        elif len(product_indices) == 1:
+            netlist.outputs[name] = product_gates[product_indices[0]]
+        else:
+            netlist.outputs[name] = netlist.gate("OR", *(product_gates[index] for index in product_indices))
+
+    return netlist
@@ -0,0 +1,229 @@
+import time
+from collections import namedtuple
+
+from ast_nodes.nodes import VariableNode, fold, postorder
+from boolean_logic.bdd import BDD
+
+
+OrderingResult = namedtuple("OrderingResult", ["method", "order", "node_count"])
+
+ORDERING_METHODS = ("alphabetical", "dfs", "force", "sifting")
+
+# Size of the unique table at which building with sifting first reorders.
+REORDER_THRESHOLD = 4096
+
+
+def dfs_order(*roots):
+    """
+    Variables in the order of their first appearance in a left-to-right
+    depth-first traversal of the ASTs, so that variables used together
+    in a subexpression end up next to each other.
+    """
+    order = {}
+
+    for root in roots:
+        for node in postorder(root):
+            if isinstance(node, VariableNode):
+                order.setdefault(node.name, None)
+
+    return list(order)
+
+def support_hyperedges(*roots):
+    """
+    The distinct variable supports of the internal nodes of the ASTs with at least
+    two variables: the "nets" that FORCE tries to keep short.
+    """
+    edges = set()
+
+    def combine(node, operands):
+        if isinstance(node, VariableNode):
+            return frozenset((node.name,))
+
+        support = frozenset().union(*operands)
+
+        if len(support) > 1:
+            edges.add(support)
+
+        return support
+
+    for root in roots:
+        fold(root, combine)
+
+    return edges
+
+def force_order(*roots, initial=None, iterations=50):
+    """
+    FORCE heuristic (Aloul, Markov, Sakallah): repeatedly move every variable
+    to the average center of gravity of the hyperedges it belongs to, and stop
+    when the total span of the hyperedges no longer decreases.
+    Starts from 'initial', or from the DFS order.
+    """
+    order = list(initial) if initial is not None else dfs_order(*roots)
+    edges = [tuple(edge) for edge in support_hyperedges(*roots)]
+
+    def total_span(position):
+        return sum(
+            max(position[name] for name in edge) - min(position[name] for name in edge)
+            for edge in edges
+            )
+
+    position = {name: index for index, name in enumerate(order)}
+    span = total_span(position)
+
+    for _ in range(iterations):
+        totals = {name: 0.0 for name in order}
+        counts = {name: 0 for name in order}
+
+        for edge in edges:
+            center = sum(position[name] for name in edge) / len(edge)
+
+            for name in edge:
+                totals[name] += center
+                counts[name] += 1
+
+        new_order = sorted(
+            order,
+            key=lambda name: (totals[name] / counts[name] if counts[name] else position[name], position[name])
+            )
+        new_position = {name: index for index, name in enumerate(new_order)}
+        new_span = total_span(new_position)
+
+        if new_span >= span:
+            break
+
+        order, position, span = new_order, new_position, new_span
+
+    return order
+
+def build_bdd(roots, order, max_nodes=None, deadline=None):
+    """
+    Build the ASTs in one BDD manager with the given variable order
+    (and node/time budget) and return (manager, list of roots).
+    """
+    manager = BDD(order, max_nodes=max_nodes, deadline=deadline)
+
+    return manager, [root.to_bdd(manager) for root in roots]
+
+def sift(manager, roots, max_growth=1.2):
+    """
+    Rudell's sifting: take the variables one at a time, most populated level first,
+    move each through every position by swapping adjacent levels in place (see
+    BDD.swap_levels), toward the nearer end of the order first, and leave it where
+    the diagram had the fewest nodes. A direction is abandoned once the diagram
+    grows beyond 'max_growth' times the best size seen for that variable, and the
+    whole pass stops at the manager's deadline.
+    The nodes keep their functions, so 'roots' stay valid; returns (manager, roots).
+    """
+    manager.collect_garbage(*roots)
+    last_level = len(manager.variables) - 1
+    names = sorted(
+        manager.variables, key=lambda name: manager.level_population(manager.levels[name]), reverse=True
+        )
+
+    for name in names:
+        if manager.deadline is not None and time.perf_counter() > manager.deadline:
+            break
+
+        level = manager.levels[name]
+        best_size, best_level = manager.live_node_count(), level
+        ends = (last_level, 0) if last_level - level < level else (0, last_level)
+
+        for end in ends:
+            step = 1 if end > level else -1
+
+            while level != end:
+                manager.swap_levels(min(level, level + step))
+                level += step
+                size = manager.live_node_count()
+
+                if size < best_size:
+                    best_size, best_level = size, level
+                elif size > max_growth * best_size:
+                    break
+
+        while level != best_level:
+            step = 1 if best_level > level else -1
+            manager.swap_levels(min(level, level + step))
+            level += step
+
+    return manager, roots
+
+def build_bdd_sifting(roots, order, max_nodes=None, deadline=None, growth=2.0):
+    """
+    Build the ASTs in one BDD manager starting from the given variable order and
+    sift it whenever its unique table has grown 'growth' times since the last
+    reordering (and past REORDER_THRESHOLD nodes), then once more at the end.
+    Reordering happens between AST nodes, with the results still needed by
+    later nodes as its roots. Returns (manager, list of roots).
+    """
+    manager = BDD(order, max_nodes=max_nodes, deadline=deadline)
+    uses = {}
+
+    for root in roots:
+        for node in postorder(root):
+            uses.setdefault(node, 0)
+
+            for child in set(node.children()):
+                uses[child] = uses.get(child, 0) + 1
+
+    for root in roots:
+        uses[root] += 1
+
+    results = {}
+    threshold = REORDER_THRESHOLD
+
+    for root in roots:
+        for node in postorder(root):
+            if node in results:
+                continue
+
+            children = node.children()
+            results[node] = node._to_bdd([results[child] for child in children], manager)
+
+            for child in set(children):
+                uses[child] -= 1
+
+                if uses[child] == 0:
+                    del results[child]
+
+            if manager.live_node_count() > threshold:
+                sift(manager, list(results.values()))
+                threshold = max(REORDER_THRESHOLD, growth * manager.live_node_count())
+
+    bdd_roots = [results[root] for root in roots]
+
+    return sift(manager, bdd_roots)
+
+def ordered_bdd(roots, method="force", max_nodes=None, deadline=None):
+    """
+    Build the ASTs in one BDD manager whose variable order is chosen by 'method':
+    "alphabetical", "dfs", "force" (static heuristics) or "sifting" (dynamic
+    reordering, starting from the FORCE order, as the diagram grows).
+    Returns (manager, list of roots).
+    """
+    if method not in ORDERING_METHODS:
+        raise ValueError(f"Unknown variable ordering method {method}")
+
+    if method == "dfs":
+        return build_bdd(roots, dfs_order(*roots), max_nodes, deadline)
+
+    if method == "force":
+        return build_bdd(roots, force_order(*roots), max_nodes, deadline)
+
+    if method == "sifting":
+        return build_bdd_sifting(roots, force_order(*roots), max_nodes, deadline)
+
+    return build_bdd(roots, sorted(dfs_order(*roots)), max_nodes, deadline)
+
+def ordering_report(roots, methods=ORDERING_METHODS):
+    """
+    Build the ASTs with every ordering method and report the variable order
+    and the number of BDD nodes each one gives.
+    """
+    results = []
+
+    for method in methods:
+        manager, bdd_roots = ordered_bdd(roots, method)
+        results.append(OrderingResult(method, list(manager.variables), manager.node_count(*bdd_roots)))
+
+    return results
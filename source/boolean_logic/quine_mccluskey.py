@@ -1,148 +1,183 @@
-def quine_mccluskey(minterms, num_vars, dont_cares=None):
-    """
-    Quine-McCluskey algorithm to find prime implicants for given minterms/don't cares.
-    """
-    if dont_cares is None:
-        dont_cares = []
-
-    all_terms = minterms + dont_cares
-    groups = {}
-
-    for term in all_terms:
-        count_of_ones = bin(term).count("1")
-        groups.setdefault(count_of_ones, []).append(f"{term:0{num_vars}b}")
-
-    prime_implicants = set()
-    current_groups = groups
+from concurrent.futures import ProcessPoolExecutor
 
-    while True:
-        new_groups = {}
-        checked = set()
-        group_keys = sorted(current_groups.keys())
+from boolean_logic.covering import CoveringSolver
 
-        for group_index in range(len(group_keys)-1):
-            group1 = current_groups[group_keys[group_index]]
-            group2 = current_groups[group_keys[group_index+1]]
 
-            for term1 in group1:
-                for term2 in group2:
-                    bit_difference = sum(c1 != c2 for c1, c2 in zip(term1, term2))
+# Rounds of prime implicant generation with fewer terms than this are merged in
+# the calling process: below it, pickling the groups costs more than it saves.
+PARALLEL_THRESHOLD = 4096
 
-                    if bit_difference == 1:
-                        bit_position = next(idx for idx, (c1, c2) in enumerate(zip(term1, term2)) if c1 != c2)
-                        combined = term1[:bit_position] + "-" + term1[bit_position+1:]
-                        new_groups.setdefault(group_index, []).append(combined)
-                        checked.add(term1)
-                        checked.add(term2)
 
-        leftover_terms = []
-
-        for group in current_groups.values():
-            for term in group:
-                if term not in checked:
-                    leftover_terms.append(term)
+def quine_mccluskey(minterms, num_vars, dont_cares=None, time_limit=None, workers=None, return_finished=False):
+    """
+    Quine-McCluskey algorithm to find prime implicants for given minterms/don't cares.
+    Returns the selected implicants as strings like "1-0-" (most significant variable first).
+    With 'return_finished', returns (implicants, finished): 'finished' is False when
+    'time_limit' cut the covering short, so the cover may not be minimum.
+    """
+    implicants = prime_implicants(minterms, num_vars, dont_cares, workers)
+    selected, finished = find_essential_prime_implicants_with_dont_cares(
+        implicants, minterms, num_vars, time_limit, return_finished=True
+        )
+    implicants = {implicant_to_string(implicant, num_vars) for implicant in selected}
 
-        prime_implicants.update(leftover_terms)
+    return (implicants, finished) if return_finished else implicants
 
-        if not new_groups:
-            break
+def merge_groups(task):
+    """
+    Merge one group of terms with the group holding one more one: 'task' is
+    (values, next_values, free_bits), the values of two groups sharing a mask.
+    Returns (merged, checked, next_checked): a dict eliminated bit -> merged
+    values, and the values of each group that took part in a merge.
+    """
+    values, next_values, free_bits = task
+    merged = {}
+    checked = set()
+    next_checked = set()
 
-        current_groups = {}
-        unique_combined_terms = set()
+    for value in values:
+        zero_bits = free_bits & ~value
 
-        for terms in new_groups.values():
-            for term in terms:
-                unique_combined_terms.add(term)
+        while zero_bits:
+            bit = zero_bits & -zero_bits
+            zero_bits ^= bit
 
-        for term in unique_combined_terms:
-            count_of_ones = term.count("1")
-            current_groups.setdefault(count_of_ones, []).append(term)
+            if value | bit in next_values:
+                merged.setdefault(bit, []).append(value)
+                checked.add(value)
+                next_checked.add(value | bit)
 
-    essential_prime_implicants = find_essential_prime_implicants_with_dont_cares(
-        prime_implicants, minterms, num_vars
-        )
-    return essential_prime_implicants
+    return merged, checked, next_checked
 
-def find_essential_prime_implicants_with_dont_cares(prime_implicants, minterms, num_vars):
+def prime_implicants(minterms, num_vars, dont_cares=None, workers=None, serial_threshold=PARALLEL_THRESHOLD):
     """
-    Identify essential prime implicants, considering don't cares if any.
+    Return the prime implicants of the minterms and don't cares as (value, mask)
+    integer pairs: the bits set in 'mask' are the eliminated variables ("-")
+    and 'value' holds the remaining bits (0 under the mask).
+
+    Terms are grouped by (number of ones, mask) in sets; two terms merge when they
+    share the mask and differ in exactly one bit, so the partner of a term is found
+    by setting each of its free zero bits and looking it up in the next group.
+
+    Within a round every pair of adjacent groups merges independently, so with
+    'workers' above 1 the pairs of the rounds holding at least 'serial_threshold'
+    terms are fanned out to a process pool; the groups travel as plain integers
+    and the merged terms are deduplicated in the next round's sets.
     """
-    def matches_pattern(prime_implicant, minterm):
-        return all(
-            current_prime_implicant == minterm_bit_state or current_prime_implicant == "-" 
-            for current_prime_implicant, minterm_bit_state in zip(prime_implicant, minterm)
-        )
+    if dont_cares is None:
+        dont_cares = []
 
-    bin_minterms = [f'{minterm_bin:0{num_vars}b}' for minterm_bin in minterms]
-    coverage = {}
+    groups = {}
 
-    for prime_implicant in prime_implicants:
-        coverage[prime_implicant] = [
-            minterm_bin for minterm_bin in bin_minterms
-            if matches_pattern(prime_implicant, minterm_bin)
-            ]
+    for term in set(minterms) | set(dont_cares):
+        groups.setdefault((term.bit_count(), 0), set()).add(term)
 
-    essential_pis = set()
-    uncovered_minterms = set(bin_minterms)
+    full_mask = (1 << num_vars) - 1
+    primes = set()
+    executor = None
 
-    for minterm_bin in bin_minterms:
-        covering_pis = [
-            current_prime_implicant for current_prime_implicant,
-            covered in coverage.items() if minterm_bin in covered
-            ]
+    try:
+        while groups:
+            keys = [key for key in groups if (key[0] + 1, key[1]) in groups]
+            tasks = [(groups[key], groups[key[0] + 1, key[1]], full_mask & ~key[1]) for key in keys]
+            terms_count = sum(len(values) for values in groups.values())
 
-        if len(covering_pis) == 1:
-            essential_pis.add(covering_pis[0])
+            if workers is not None and workers > 1 and terms_count >= serial_threshold:
+                if executor is None:
+                    executor = ProcessPoolExecutor(workers)
 
-    for epi in essential_pis:
-        for minterm_bin in coverage[epi]:
+                results = executor.map(merge_groups, tasks, chunksize=max(1, len(tasks) // (4 * workers)))
+            else:
+                results = map(merge_groups, tasks)
 
-            if minterm_bin in uncovered_minterms:
-                uncovered_minterms.remove(minterm_bin)
+            new_groups = {}
+            checked = {}
 
-    if not uncovered_minterms:
-        return essential_pis
+            for (count_of_ones, mask), (merged, low_checked, high_checked) in zip(keys, results):
+                for bit, values in merged.items():
+                    new_groups.setdefault((count_of_ones, mask | bit), set()).update(values)
 
-    remaining_pis = set(prime_implicants) - essential_pis
-    uncovered_minterms = list(uncovered_minterms)
+                checked.setdefault((count_of_ones, mask), set()).update(low_checked)
+                checked.setdefault((count_of_ones + 1, mask), set()).update(high_checked)
 
-    def covers_all(selected_pis, minterms_to_cover):
-        covered = set()
-        
-        for prime_implicant in selected_pis:
-            covered.update(coverage[prime_implicant])
+            for key, values in groups.items():
+                primes.update((value, key[1]) for value in values - checked.get(key, set()))
 
-        return all(minterm_bin in covered for minterm_bin in minterms_to_cover)
+            groups = new_groups
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-    best_solution = None
+    return primes
 
-    def backtrack(selected_prime_implicants, candidates):
-        nonlocal best_solution
+def implicant_to_string(implicant, num_vars):
+    """
+    Format a (value, mask) implicant as a string of "0", "1" and "-",
+    most significant variable first.
+    """
+    value, mask = implicant
 
-        if best_solution is not None and len(selected_prime_implicants) >= len(best_solution):
-            return
+    return "".join(
+        "-" if mask >> bit & 1 else "1" if value >> bit & 1 else "0"
+        for bit in range(num_vars - 1, -1, -1)
+    )
 
-        if covers_all(selected_prime_implicants, uncovered_minterms):
-            if best_solution is None or len(selected_prime_implicants) < len(best_solution):
-                best_solution = selected_prime_implicants[:]
-            return
+def find_essential_prime_implicants_with_dont_cares(
+        prime_implicants, minterms, num_vars, time_limit=None, return_finished=False
+        ):
+    """
+    Select a minimum cover of the minterms (don't cares need no covering) by the
+    prime implicants: the fewest implicants, and among those the fewest literals.
+    Implicants are (value, mask) pairs; the minterms each one covers are kept
+    as a bitset over the positions of 'minterms' and the covering problem is
+    solved exactly by CoveringSolver (see boolean_logic/covering.py), or as well
+    as possible within 'time_limit' seconds. With 'return_finished', returns
+    (cover, finished), 'finished' telling whether the cover is proven minimum.
+    """
+    if not minterms:
+        return (set(), True) if return_finished else set()
 
-        if not candidates:
-            return
+    candidates = sorted(prime_implicants)
+    coverage = implicant_coverage(candidates, minterms)
+    # Any implicant costs more than the literals of the whole cover, so the count comes first.
+    implicant_cost = num_vars * len(candidates) + 1
+    costs = [implicant_cost + num_vars - mask.bit_count() for _, mask in candidates]
+    solver = CoveringSolver(coverage, costs)
+    selected = {candidates[column] for column in solver.solve((1 << len(minterms)) - 1, time_limit)}
 
-        next_prime_implicant = candidates[0]
-        selected_prime_implicants.append(next_prime_implicant)
-        backtrack(selected_prime_implicants, candidates[1:])
-        selected_prime_implicants.pop()
-        backtrack(selected_prime_implicants, candidates[1:])
+    return (selected, solver.optimal) if return_finished else selected
 
-    backtrack([], list(remaining_pis))
+def implicant_coverage(implicants, minterms):
+    """
+    For each (value, mask) implicant, the bitset of the positions in 'minterms'
+    of the minterms it covers.
+    """
+    return [
+        sum(1 << position for position, minterm in enumerate(minterms) if minterm & ~mask == value)
+        for value, mask in implicants
+        ]
+
+def literal_covering_solver(prime_implicants, minterms, num_vars):
+    """
+    The CoveringSolver of the minterms by the prime implicants (sorted, one
+    column each) with their literals as costs, to examine the covering problem
+    before solving it.
+    """
+    candidates = sorted(prime_implicants)
+    literals = [num_vars - mask.bit_count() for _, mask in candidates]
+
+    return CoveringSolver(implicant_coverage(candidates, minterms), literals)
 
-    if best_solution is None:
-        best_solution = list(remaining_pis)
+def cover_literal_bound(prime_implicants, minterms, num_vars):
+    """
+    A lower bound on the literals of every cover of the minterms by the prime
+    implicants, found without solving the covering problem: minterms that share
+    no implicant each need their own, with at least the fewest literals among theirs.
+    """
+    if not minterms:
+        return 0
 
-    final_solution = essential_pis.union(best_solution)
-    return final_solution
+    return literal_covering_solver(prime_implicants, minterms, num_vars).lower_bound()
 
 def matches_pattern(prime_implicant, minterm):
     """
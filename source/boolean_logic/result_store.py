@@ -0,0 +1,279 @@
+import argparse
+import json
+import os
+import sqlite3
+import time
+from functools import wraps
+
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".logic_crusher", "results.sqlite")
+
+# Default bound on the stored values, in bytes of their JSON encoding.
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Number of reads whose recency is kept in memory before it is written out.
+ACCESS_BATCH_SIZE = 1024
+
+_MISSING = object()
+
+
+class ResultStore:
+    """
+    A persistent, content-addressed store of computed results, kept in an SQLite
+    database. Functions are identified by a key hashed from their canonical truth
+    table (see BooleanFunction.content_key), so equal functions written differently
+    share their results. The 'functions' table keeps the variables, truth vector
+    and don't-care vector of every key; the 'results' table keeps one JSON value
+    per (key, artifact). When the values exceed 'max_bytes', the least recently
+    used ones are evicted.
+
+    Reads do not write: the time of each read is kept in memory and written in
+    one transaction by flush(), which prune() and close() call, as does get()
+    every ACCESS_BATCH_SIZE reads.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._accessed = {}
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS functions (
+                key TEXT PRIMARY KEY, variables TEXT, truth_vector TEXT, dont_care_vector TEXT
+                );
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT, artifact TEXT, value TEXT, size INTEGER, accessed REAL,
+                PRIMARY KEY (key, artifact)
+                );
+            CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+            """
+            )
+        self.size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def add_function(self, key, variables, truth_vector, dont_care_vector=0):
+        """
+        Record the truth table a key was hashed from.
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO functions VALUES (?, ?, ?, ?)",
+                (key, ",".join(variables), format(truth_vector, "x"), format(dont_care_vector, "x"))
+                )
+
+    def get(self, key, artifact, default=None):
+        """
+        Return the value stored for (key, artifact), marking it as recently used,
+        or 'default' if there is none.
+        """
+        row = self._connection.execute(
+            "SELECT value FROM results WHERE key = ? AND artifact = ?", (key, artifact)
+            ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._accessed[key, artifact] = time.time()
+
+        if len(self._accessed) >= ACCESS_BATCH_SIZE:
+            self.flush()
+
+        return json.loads(row[0])
+
+    def flush(self):
+        """
+        Write the times of the reads since the last flush.
+        """
+        if not self._accessed:
+            return
+
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE results SET accessed = ? WHERE key = ? AND artifact = ?",
+                [(accessed, key, artifact) for (key, artifact), accessed in self._accessed.items()]
+                )
+
+        self._accessed.clear()
+
+    def put(self, key, artifact, value):
+        """
+        Store 'value' (JSON-encodable; sets are stored as sorted lists) for
+        (key, artifact), evicting the least recently used values if needed.
+        """
+        encoded = json.dumps(value, default=sorted)
+        self._accessed.pop((key, artifact), None)
+
+        with self._connection:
+            previous = self._connection.execute(
+                "SELECT size FROM results WHERE key = ? AND artifact = ?", (key, artifact)
+                ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, artifact, encoded, len(encoded), time.time())
+                )
+
+        self.size += len(encoded) - (previous[0] if previous else 0)
+
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            self.prune(self.max_bytes)
+
+    def prune(self, max_bytes):
+        """
+        Evict the least recently used values until they take at most 'max_bytes',
+        then drop the functions left without results. Returns the number of
+        values evicted.
+        """
+        evicted = 0
+        self.flush()
+
+        with self._connection:
+            self.size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            rows = self._connection.execute("SELECT key, artifact, size FROM results ORDER BY accessed")
+
+            for key, artifact, size in rows.fetchall():
+                if self.size <= max_bytes:
+                    break
+
+                self._connection.execute("DELETE FROM results WHERE key = ? AND artifact = ?", (key, artifact))
+                self.size -= size
+                evicted += 1
+
+            self._connection.execute("DELETE FROM functions WHERE key NOT IN (SELECT key FROM results)")
+
+        return evicted
+
+    def clear(self):
+        self._accessed.clear()
+
+        with self._connection:
+            self._connection.execute("DELETE FROM results")
+            self._connection.execute("DELETE FROM functions")
+
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Return a dict with the number of functions and values and their size in bytes.
+        """
+        functions_count = self._connection.execute("SELECT COUNT(*) FROM functions").fetchone()[0]
+        results_count = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+        return {"functions": functions_count, "results": results_count, "bytes": self.size}
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+def stored_artifact(decode=None, finished=None, budget=()):
+    """
+    Keep the results of a method in the class's 'result_store' (when one is set),
+    under the instance's content_key() and an artifact named after the method and
+    its arguments, so that they survive the process. 'decode' rebuilds the value
+    from its JSON form (e.g. set for a set). Instances whose content_key() is None
+    always compute; the others record their truth table with their first result.
+
+    When 'finished' is given, only the values it accepts are stored, so a result
+    cut short by a time limit is never kept. The keyword arguments named in
+    'budget' only bound the work: they are left out of the artifact name, and
+    a finished result serves every budget.
+    """
+    def decorator(method):
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            store = self.result_store
+            key = self.content_key() if store is not None else None
+
+            if key is None:
+                return method(self, *args, **kwargs)
+
+            arguments = sorted((argument, value) for argument, value in kwargs.items() if argument not in budget)
+            artifact = f"{name}{json.dumps([args, arguments])}" if args or arguments else name
+            value = store.get(key, artifact, _MISSING)
+
+            if value is _MISSING:
+                value = method(self, *args, **kwargs)
+
+                if finished is None or finished(value):
+                    store.add_function(key, self.variables, self.get_truth_vector(), self.get_dont_care_vector())
+                    store.put(key, artifact, value)
+            elif decode is not None:
+                value = decode(value)
+
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def warm(store, expressions, time_limit=None):
+    """
+    Compute and store the results of the given expressions: truth table,
+    Zhegalkin polynomial, Post classes and the minimized forms. Each
+    minimization gets 'time_limit' seconds, without limit by default: the
+    covers cut short by a time limit are not stored.
+    """
+    from boolean_logic.boolean_functions import BooleanFunction
+
+    previous_store = BooleanFunction.result_store
+    BooleanFunction.result_store = store
+
+    try:
+        for expression in expressions:
+            boolean_function = BooleanFunction(expression)
+            boolean_function.minimization_time_limit = time_limit
+            boolean_function.get_zhegalkin_polynomial()
+            boolean_function.post_classes()
+            boolean_function.minimize(form="best")
+    finally:
+        BooleanFunction.result_store = previous_store
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Manage the on-disk store of minimization and analysis results.")
+    parser.add_argument("--path", default=DEFAULT_STORE_PATH, help="the SQLite database of the store")
+    commands = parser.add_subparsers(dest="command", required=True)
+    warm_parser = commands.add_parser("warm", help="compute and store the results of expressions")
+    warm_parser.add_argument("file", help="a file with one expression per line")
+    warm_parser.add_argument(
+        "--time-limit", type=float, default=None,
+        help="seconds allowed to each minimization (no limit by default; unfinished covers are not stored)"
+        )
+    prune_parser = commands.add_parser("prune", help="evict the least recently used results")
+    prune_parser.add_argument("max_bytes", type=int, help="the size to shrink the stored results to")
+    commands.add_parser("stats", help="show the size of the store")
+    commands.add_parser("clear", help="remove every stored result")
+    options = parser.parse_args(arguments)
+    store = ResultStore(options.path)
+
+    try:
+        if options.command == "warm":
+            with open(options.file, encoding="utf-8") as file:
+                warm(store, [line.strip() for line in file if line.strip()], options.time_limit)
+        elif options.command == "prune":
+            print(f"Evicted {store.prune(options.max_bytes)} results.")
+        elif options.command == "clear":
+            store.clear()
+
+        stats = store.stats()
+        print(f"{stats['functions']} functions, {stats['results']} results, {stats['bytes']} bytes")
+    finally:
+        store.close()
+
+if __name__ == "__main__":
+    main()
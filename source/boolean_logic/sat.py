@@ -0,0 +1,429 @@
+import heapq
+
+
+def luby(index):
+    """
+    The index-th term (counting from 0) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, ...
+    used to space out restarts.
+    """
+    size = 1
+
+    while size < index + 1:
+        size = 2 * size + 1
+
+    while size - 1 != index:
+        size //= 2
+        index %= size
+
+    return (size + 1) // 2
+
+
+class CDCLSolver:
+    """
+    A conflict-driven clause learning SAT solver.
+
+    Variables are positive integers and literals are non-zero integers (-v is the
+    negation of v), as in the DIMACS format. The solver uses two watched literals
+    per clause for unit propagation, learns first-UIP clauses with non-chronological
+    backjumping, picks decisions by VSIDS activity with phase saving, and restarts
+    following the Luby sequence.
+    """
+
+    restart_interval = 64
+    activity_decay = 0.95
+
+    def __init__(self):
+        self.variables_count = 0
+        self.clauses = []
+        self.learned = []
+        self.watches = {}
+        self.values = [0]
+        self.levels = [0]
+        self.reasons = [None]
+        self.phases = [False]
+        self.activity = [0.0]
+        self.trail = []
+        self.trail_limits = []
+        self.propagated = 0
+        self.increment = 1.0
+        self.heap = []
+        self.unsatisfiable = False
+        self.conflicts = 0
+        self.decisions = 0
+
+    def new_variable(self):
+        self.variables_count += 1
+        variable = self.variables_count
+        self.watches[variable] = []
+        self.watches[-variable] = []
+        self.values.append(0)
+        self.levels.append(0)
+        self.reasons.append(None)
+        self.phases.append(False)
+        self.activity.append(0.0)
+        heapq.heappush(self.heap, (0.0, variable))
+
+        return variable
+
+    def value(self, literal):
+        """
+        1 if the literal is true, -1 if it is false, 0 if it is unassigned.
+        """
+        value = self.values[abs(literal)]
+
+        return value if literal > 0 else -value
+
+    def add_clause(self, literals):
+        """
+        Add a clause (an iterable of literals). Returns False if the clause
+        set is now known to be unsatisfiable.
+        """
+        self._backtrack(0)
+        clause = []
+
+        for literal in literals:
+            if -literal in clause or self.value(literal) == 1:
+                return True
+            if literal not in clause and self.value(literal) == 0:
+                clause.append(literal)
+
+        if not clause:
+            self.unsatisfiable = True
+        elif len(clause) == 1:
+            self._assign(clause[0], None)
+            self.unsatisfiable = self._propagate() is not None
+        else:
+            self.clauses.append(clause)
+            self._watch(clause)
+
+        return not self.unsatisfiable
+
+    def solve(self):
+        """
+        Decide satisfiability of the clauses added so far. After a True answer
+        the satisfying assignment is available from model().
+        """
+        if self.unsatisfiable:
+            return False
+
+        restarts = 1
+        conflicts_until_restart = self.restart_interval * luby(restarts)
+
+        while True:
+            conflict = self._propagate()
+
+            if conflict is not None:
+                self.conflicts += 1
+
+                if not self.trail_limits:
+                    self.unsatisfiable = True
+                    return False
+
+                learned, level = self._analyze(conflict)
+                self._backtrack(level)
+
+                if len(learned) == 1:
+                    self._assign(learned[0], None)
+                else:
+                    self.learned.append(learned)
+                    self._watch(learned)
+                    self._assign(learned[0], learned)
+
+                self._decay_activity()
+                conflicts_until_restart -= 1
+
+                if conflicts_until_restart == 0:
+                    restarts += 1
+                    conflicts_until_restart = self.restart_interval * luby(restarts)
+                    self._backtrack(0)
+            else:
+                variable = self._pick_branching_variable()
+
+                if variable is None:
+                    return True
+
+                self.decisions += 1
+                self.trail_limits.append(len(self.trail))
+                self._assign(variable if self.phases[variable] else -variable, None)
+
+    def model(self):
+        """
+        The current assignment as a dict variable -> bool (unassigned variables are False).
+        """
+        return {variable: self.values[variable] == 1 for variable in range(1, self.variables_count + 1)}
+
+    def _watch(self, clause):
+        self.watches[clause[0]].append(clause)
+        self.watches[clause[1]].append(clause)
+
+    def _assign(self, literal, reason):
+        variable = abs(literal)
+        self.values[variable] = 1 if literal > 0 else -1
+        self.levels[variable] = len(self.trail_limits)
+        self.reasons[variable] = reason
+        self.trail.append(literal)
+
+    def _propagate(self):
+        """
+        Unit propagation over the watched literals. Returns a conflicting clause or None.
+        """
+        values = self.values
+
+        while self.propagated < len(self.trail):
+            false_literal = -self.trail[self.propagated]
+            self.propagated += 1
+            watch_list = self.watches[false_literal]
+            kept = []
+
+            for index, clause in enumerate(watch_list):
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+
+                first = clause[0]
+                first_value = values[first] if first > 0 else -values[-first]
+
+                if first_value == 1:
+                    kept.append(clause)
+                    continue
+
+                for position in range(2, len(clause)):
+                    literal = clause[position]
+
+                    if (values[literal] if literal > 0 else -values[-literal]) != -1:
+                        clause[1], clause[position] = literal, false_literal
+                        self.watches[literal].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+
+                    if first_value == -1:
+                        kept.extend(watch_list[index + 1:])
+                        self.watches[false_literal] = kept
+                        return clause
+
+                    self._assign(first, clause)
+
+            self.watches[false_literal] = kept
+
+        return None
+
+    def _analyze(self, conflict):
+        """
+        First-UIP conflict analysis. Returns the learned clause, with the asserting
+        literal first and a literal of the backjump level second, and that level.
+        """
+        level = len(self.trail_limits)
+        learned = [None]
+        seen = set()
+        pending = 0
+        index = len(self.trail) - 1
+        clause = conflict
+
+        while True:
+            for literal in clause:
+                variable = abs(literal)
+
+                if variable not in seen and self.levels[variable] > 0:
+                    seen.add(variable)
+                    self._bump(variable)
+
+                    if self.levels[variable] == level:
+                        pending += 1
+                    else:
+                        learned.append(literal)
+
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+
+            literal = self.trail[index]
+            index -= 1
+            pending -= 1
+
+            if pending == 0:
+                break
+
+            clause = self.reasons[abs(literal)]
+
+        learned[0] = -literal
+
+        if len(learned) == 1:
+            return learned, 0
+
+        highest = max(range(1, len(learned)), key=lambda position: self.levels[abs(learned[position])])
+        learned[1], learned[highest] = learned[highest], learned[1]
+
+        return learned, self.levels[abs(learned[1])]
+
+    def _backtrack(self, level):
+        if len(self.trail_limits) <= level:
+            return
+
+        limit = self.trail_limits[level]
+
+        for literal in self.trail[limit:]:
+            variable = abs(literal)
+            self.phases[variable] = literal > 0
+            self.values[variable] = 0
+            self.reasons[variable] = None
+            heapq.heappush(self.heap, (-self.activity[variable], variable))
+
+        del self.trail[limit:]
+        del self.trail_limits[level:]
+        self.propagated = len(self.trail)
+
+    def _pick_branching_variable(self):
+        while self.heap:
+            _, variable = heapq.heappop(self.heap)
+
+            if self.values[variable] == 0:
+                return variable
+
+        for variable in range(1, self.variables_count + 1):
+            if self.values[variable] == 0:
+                return variable
+
+        return None
+
+    def _bump(self, variable):
+        self.activity[variable] += self.increment
+
+        if self.activity[variable] > 1e100:
+            self.activity = [activity * 1e-100 for activity in self.activity]
+            self.increment *= 1e-100
+            self.heap = [(-self.activity[item], item) for _, item in self.heap]
+            heapq.heapify(self.heap)
+
+        if self.values[variable] == 0:
+            heapq.heappush(self.heap, (-self.activity[variable], variable))
+
+    def _decay_activity(self):
+        self.increment /= self.activity_decay
+
+
+class TseitinEncoder:
+    """
+    Encodes ASTs into clauses of a CDCLSolver with one fresh variable per gate
+    (Tseitin transformation), so the CNF stays linear in the size of the AST.
+    Gates over the same literals are encoded once, and negation costs nothing:
+    it flips the sign of the literal.
+    """
+
+    def __init__(self, solver):
+        self.solver = solver
+        self.variables = {}
+        self._true_literal = None
+        self._gates = {}
+
+    def variable(self, name):
+        if name not in self.variables:
+            self.variables[name] = self.solver.new_variable()
+
+        return self.variables[name]
+
+    def constant(self, value):
+        if self._true_literal is None:
+            self._true_literal = self.solver.new_variable()
+            self.solver.add_clause([self._true_literal])
+
+        return self._true_literal if value else -self._true_literal
+
+    def gate(self, operator, literals):
+        """
+        Return the literal of the given operator (AND, OR, XOR, IMP, EQV, NAND, NOR)
+        applied to 'literals'.
+        """
+        if operator == "AND":
+            return self._and(literals)
+        if operator == "OR":
+            return -self._and([-literal for literal in literals])
+        if operator == "XOR":
+            result = literals[0]
+
+            for literal in literals[1:]:
+                result = self._xor(result, literal)
+            return result
+        if operator == "IMP":
+            return -self._and([literals[0], -literals[1]])
+        if operator == "EQV":
+            return -self._xor(*literals)
+        if operator == "NAND":
+            return -self._and(literals)
+        if operator == "NOR":
+            return self._and([-literal for literal in literals])
+
+        raise ValueError(f"Unknown operator {operator}")
+
+    def assignment(self):
+        """
+        The solver's model restricted to the encoded variables, as a dict
+        name -> 0/1 in alphabetical order.
+        """
+        return {name: int(self.solver.values[self.variables[name]] == 1) for name in sorted(self.variables)}
+
+    def _and(self, literals):
+        true_literal = self._true_literal
+        operands = set()
+
+        for literal in literals:
+            if -literal in operands or (true_literal is not None and literal == -true_literal):
+                return self.constant(False)
+            if literal != true_literal:
+                operands.add(literal)
+
+        if not operands:
+            return self.constant(True)
+        if len(operands) == 1:
+            return next(iter(operands))
+
+        key = ("AND", frozenset(operands))
+
+        if key not in self._gates:
+            output = self.solver.new_variable()
+
+            for literal in operands:
+                self.solver.add_clause([-output, literal])
+
+            self.solver.add_clause([output] + [-literal for literal in operands])
+            self._gates[key] = output
+
+        return self._gates[key]
+
+    def _xor(self, left, right):
+        if left == right:
+            return self.constant(False)
+        if left == -right:
+            return self.constant(True)
+
+        # a XOR b = NOT a XOR NOT b: normalize the signs so both share one gate.
+        negated = (left < 0) != (right < 0)
+        left, right = sorted((abs(left), abs(right)))
+        key = ("XOR", left, right)
+
+        if key not in self._gates:
+            output = self.solver.new_variable()
+            self.solver.add_clause([-output, left, right])
+            self.solver.add_clause([-output, -left, -right])
+            self.solver.add_clause([output, -left, right])
+            self.solver.add_clause([output, left, -right])
+            self._gates[key] = output
+
+        return -self._gates[key] if negated else self._gates[key]
+
+
+def find_difference(root1, root2):
+    """
+    Decide the equivalence of two ASTs as the unsatisfiability of their miter
+    (root1 XOR root2). Returns None when they are equivalent, otherwise an
+    assignment (variable name -> 0/1, over the variables of both) on which they differ.
+    """
+    solver = CDCLSolver()
+    encoder = TseitinEncoder(solver)
+    literal1 = root1.to_cnf(encoder)
+    literal2 = root2.to_cnf(encoder)
+    solver.add_clause([literal1, literal2])
+    solver.add_clause([-literal1, -literal2])
+
+    if not solver.solve():
+        return None
+
+    return encoder.assignment()
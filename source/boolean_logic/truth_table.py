@@ -0,0 +1,83 @@
+from itertools import product
+
+from boolean_logic.helpers import set_bit_indices, vector_bytes
+
+
+class TruthTable:
+    """
+    A compact truth table of an n-variable Boolean function, stored as a single
+    integer bitset: bit r holds the function value in row r, where rows follow
+    itertools.product order (the first variable is the most significant bit).
+    Row access goes through the bytes of the vector, built on first use: shifting
+    the integer would copy all of its 2^n bits for every row.
+    """
+
+    def __init__(self, vector, variables_count):
+        self.vector = vector
+        self.variables_count = variables_count
+        self._bytes = None
+
+    def _row_bytes(self):
+        if self._bytes is None:
+            self._bytes = vector_bytes(self.vector, len(self))
+
+        return self._bytes
+
+    def __len__(self):
+        return 1 << self.variables_count
+
+    def __getitem__(self, index):
+        """
+        Return the function value (0 or 1) for the row with the given minterm index.
+        """
+        rows_count = len(self)
+
+        if index < 0:
+            index += rows_count
+        if not 0 <= index < rows_count:
+            raise IndexError("truth table row index out of range")
+        
+        return self._row_bytes()[index >> 3] >> (index & 7) & 1
+
+    def popcount(self):
+        """
+        Return the number of rows where the function is 1.
+        """
+        return self.vector.bit_count()
+
+    def minterms(self):
+        """
+        Yield the indices of the on-set rows in increasing order.
+        """
+        yield from set_bit_indices(self.vector)
+
+    def row_values(self, index):
+        """
+        Return the input tuple of the row with the given minterm index.
+        """
+        variables_count = self.variables_count
+
+        return tuple(
+            (index >> (variables_count - position - 1)) & 1 
+            for position in range(variables_count)
+            )
+
+    def __iter__(self):
+        """
+        Lazily yield (input_tuple, result) pairs, the layout of the former list-based table.
+        """
+        row_bytes = self._row_bytes()
+
+        for index, values in enumerate(product([0, 1], repeat=self.variables_count)):
+            yield values, row_bytes[index >> 3] >> (index & 7) & 1
+
+    def __eq__(self, other):
+        if not isinstance(other, TruthTable):
+            return NotImplemented
+        return self.vector == other.vector and self.variables_count == other.variables_count
+
+    def __hash__(self):
+        return hash((self.vector, self.variables_count))
+
+    def __repr__(self):
+        return f"TruthTable({self.vector:#x}, {self.variables_count})"
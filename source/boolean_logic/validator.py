@@ -12,8 +12,7 @@ class Validator:
     def validate(expression):
         try:
             lexer = Lexer(expression)
-            tokens = lexer.tokenize()
-            parser = Parser(tokens)
+            parser = Parser(lexer.iter_tokens())
             parser.parse()
             return True, None
         except (SyntaxError, ValueError) as e:
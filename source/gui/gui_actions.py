@@ -1,5 +1,4 @@
 import json
-from itertools import product
 from tkinter import messagebox, filedialog
 import graphviz
 
@@ -7,6 +6,7 @@ from boolean_logic.boolean_functions import BooleanFunction
 from boolean_logic.validator import Validator
 from boolean_logic.karnaugh import KarnaughMap
 from boolean_logic.gate_parser import parse_minimized_expression, gate_ast_to_graphviz
+from boolean_logic.bdd import BudgetExceeded
 from . import gui_main
 
 
@@ -34,7 +34,7 @@ def simplify_expression():
         messagebox.showerror("Syntax error.", error_message)
         return
     try:
-        boolean_function = BooleanFunction(expression_text)
+        boolean_function = BooleanFunction.get(expression_text)
         gui_main.function_set.add_function(boolean_function)
         simplified_expression = boolean_function.simplify()
         gui_main.expression_result_display.config(
@@ -59,7 +59,7 @@ def zhegalkin_polynomial():
         messagebox.showerror("Syntax error.", error_message)
         return
     try:
-        boolean_function = BooleanFunction(expression_text)
+        boolean_function = BooleanFunction.get(expression_text)
         gui_main.function_set.add_function(boolean_function)
         zhegalkin = boolean_function.to_zhegalkin()
         gui_main.expression_result_display.config(
@@ -84,27 +84,28 @@ def check_properties():
         messagebox.showerror("Syntax error.", error_message)
         return
     try:
-        boolean_function = BooleanFunction(expression_text)
+        boolean_function = BooleanFunction.get(expression_text)
         gui_main.function_set.add_function(boolean_function)
+        post_classes = boolean_function.post_classes()
         properties = []
 
-        if boolean_function.preserves_zero():
+        if post_classes["T0"]:
             properties.append("Preserves the zero.")
         else:
             properties.append("Does not preserve zero.")
-        if boolean_function.preserves_one():
+        if post_classes["T1"]:
             properties.append("Preserves the one.")
         else:
             properties.append("Does not preserve the one.")
-        if boolean_function.is_self_dual():
+        if post_classes["S"]:
             properties.append("Self-dual.")
         else:
             properties.append("It is not self-dual.")
-        if boolean_function.is_monotonic():
+        if post_classes["M"]:
             properties.append("Monotonous.")
         else:
             properties.append("It is not monotonous.")
-        if boolean_function.is_linear():
+        if post_classes["L"]:
             properties.append("Linear.")
         else:
             properties.append("Non-linear.")
@@ -131,7 +132,7 @@ def minimize_expression():
         messagebox.showerror("Syntax error.", error_message)
         return
     try:
-        boolean_function = BooleanFunction(expression_text)
+        boolean_function = BooleanFunction.get(expression_text)
         gui_main.function_set.add_function(boolean_function)
         minimized_expression = boolean_function.minimize()
         gui_main.expression_result_display.config(
@@ -157,7 +158,7 @@ def decompose_expression():
         messagebox.showerror("Syntax error.", error_message)
         return
     try:
-        boolean_function = BooleanFunction(expression_text)
+        boolean_function = BooleanFunction.get(expression_text)
         gui_main.function_set.add_function(boolean_function)
         cofactor_0, cofactor_1 = boolean_function.decompose(variable)
         gui_main.expression_result_display.config(
@@ -184,7 +185,7 @@ def generate_kmap():
         messagebox.showerror("Syntax error.", error_message)
         return
     try:
-        boolean_function = BooleanFunction(expression_text)
+        boolean_function = BooleanFunction.get(expression_text)
         gui_main.function_set.add_function(boolean_function)
         number_of_variables = len(boolean_function.variables)
         if number_of_variables < 2 or number_of_variables > 4:
@@ -215,7 +216,7 @@ def visualize_ast():
         messagebox.showerror("Syntax error.", error_message)
         return
     try:
-        boolean_function = BooleanFunction(expression_text)
+        boolean_function = BooleanFunction.get(expression_text)
         gui_main.function_set.add_function(boolean_function)
         abstract_syntax_tree = boolean_function.ast
         graph = graphviz.Digraph()
@@ -241,9 +242,9 @@ def generate_circuit():
         messagebox.showerror("Syntax error.", error_message)
         return
     try:
-        boolean_function = BooleanFunction(expression_text)
+        boolean_function = BooleanFunction.get(expression_text)
         gui_main.function_set.add_function(boolean_function)
-        minimized_expression = boolean_function.minimize()
+        minimized_expression = boolean_function.minimize(form="best")
         gate_root = parse_minimized_expression(minimized_expression)
         graph = graphviz.Digraph()
         gate_ast_to_graphviz(gate_root, graph)
@@ -253,20 +254,13 @@ def generate_circuit():
 
 def difference_measure(f1, f2):
     """Count how many input assignments produce different outputs between f1 and f2."""
-    expression_variables = sorted(list(set(f1.variables).union(set(f2.variables))))
-    difference_count = 0
-
-    for values in product([0, 1], repeat=len(expression_variables)):
-        evaluation_context = dict(zip(expression_variables, values))
-        f1_result = f1.evaluate(evaluation_context)
-        f2_result = f2.evaluate(evaluation_context)
-        if f1_result != f2_result:
-            difference_count += 1
-
-    return difference_count
+    try:
+        return f1.difference_measure(f2)
+    except BudgetExceeded:
+        return "too many to count"
 
 def check_equivalence():
-    """Check if two expressions are equivalent by comparing their Zhegalkin polynomials."""
+    """Check if two expressions are equivalent with the SAT solver, showing a counterexample if not."""
     expression_text1 = gui_main.first_expression_entry.get()
     expression_text2 = gui_main.second_expression_entry.get()
 
@@ -287,26 +281,26 @@ def check_equivalence():
         return
 
     try:
-        boolean_function1 = BooleanFunction(expression_text1)
-        boolean_function2 = BooleanFunction(expression_text2)
+        boolean_function1 = BooleanFunction.get(expression_text1)
+        boolean_function2 = BooleanFunction.get(expression_text2)
         gui_main.function_set.add_function(boolean_function1)
         gui_main.function_set.add_function(boolean_function2)
 
-        zhegalkin_polynomial1 = boolean_function1.to_zhegalkin()
-        zhegalkin_polynomial2 = boolean_function2.to_zhegalkin()
+        counterexample = boolean_function1.find_counterexample(boolean_function2)
 
-        if zhegalkin_polynomial1 == zhegalkin_polynomial2:
+        if counterexample is None:
             gui_main.expression_result_display.config(
-                text=f"The expressions are equivalent.\n"
-                     f"Zhegalkin polynomial:\n{zhegalkin_polynomial1}"
+                text="The expressions are equivalent."
             )
         else:
+            assignment = ", ".join(f"{variable}={value}" for variable, value in counterexample.items())
             difference = difference_measure(boolean_function1, boolean_function2)
             gui_main.expression_result_display.config(
                 text=(
                     f"The expressions are not equivalent.\n\n"
-                    f"Zhegalkin polynomial of the first expression:\n{zhegalkin_polynomial1}\n"
-                    f"Zhegalkin polynomial of the second expression:\n{zhegalkin_polynomial2}\n\n"
+                    f"Counterexample: {assignment}\n"
+                    f"First expression: {int(boolean_function1.ast.evaluate(counterexample))}, "
+                    f"second expression: {int(boolean_function2.ast.evaluate(counterexample))}\n\n"
                     f"Difference measure (number of input assignments where they differ): {difference}"
                 )
             )
@@ -1,7 +1,15 @@
+from boolean_logic.boolean_functions import BooleanFunction
+from boolean_logic.result_store import ResultStore
 from gui.gui_main import show_splash
 
 def main():
-    show_splash()
+    # Results computed in earlier sessions are reused from the on-disk store.
+    BooleanFunction.result_store = ResultStore()
+
+    try:
+        show_splash()
+    finally:
+        BooleanFunction.result_store.close()
 
 if __name__ == "__main__":
     main()
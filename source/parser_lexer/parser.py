@@ -1,20 +1,34 @@
 from ast_nodes.nodes import (
-    EqvNode, ImpNode, OrNode, NorNode, 
-    XorNode, AndNode, NandNode, NotNode, 
-    VariableNode, ConstNode
+    EqvNode, ImpNode, OrNode, NorNode,
+    XorNode, AndNode, NandNode, NotNode,
+    NaryNode, VariableNode, ConstNode
 )
 
 
+# Binary operators with their precedence (higher binds tighter) and node class.
+# All of them are left-associative, see grammer.txt.
+BINARY_OPERATORS = {
+    "EQV":  (1, EqvNode),
+    "IMP":  (2, ImpNode),
+    "OR":   (3, OrNode),
+    "NOR":  (3, NorNode),
+    "XOR":  (4, XorNode),
+    "AND":  (5, AndNode),
+    "NAND": (6, NandNode),
+}
+
+
 class Parser:
     """
-    Parses a list of tokens (from the Lexer) into an abstract syntax tree (AST).
-    Implements a recursive descent parser for Boolean expressions.
+    Parses a list or a lazy stream of tokens (from the Lexer) into an abstract syntax tree (AST).
+    Implements an operator-precedence (shunting-yard) parser with explicit operand
+    and operator stacks, so nesting depth is bounded only by memory.
     """
 
     def __init__(self, tokens):
-        self.tokens = tokens
+        self.tokens = iter(tokens)
         self.position = 0
-        self.current_token = self.tokens[self.position]
+        self.current_token = next(self.tokens)
 
     def eat(self, token_type):
         """
@@ -23,7 +37,7 @@ class Parser:
         """
         if self.current_token.type == token_type:
             self.position += 1
-            self.current_token = self.tokens[self.position]
+            self.current_token = next(self.tokens)
         else:
             raise ValueError(
                 f"Expected token {token_type} but received {self.current_token.type} at position {self.position + 1}"
@@ -41,81 +55,93 @@ class Parser:
         return node
 
     def expr(self):
-        return self.equiv_expr()
-
-    def equiv_expr(self):
-        node = self.imp_expr()
-
-        while self.current_token.type == "EQV":
-            self.eat("EQV")
-            node = EqvNode(node, self.imp_expr())
-
-        return node
-
-    def imp_expr(self):
-        node = self.or_expr()
-
-        while self.current_token.type == "IMP":
-            self.eat("IMP")
-            node = ImpNode(node, self.or_expr())
-
-        return node
-
-    def or_expr(self):
-        node = self.xor_expr()
-
-        while self.current_token.type in {"OR", "NOR"}:
-            op = self.current_token.type
-            self.eat(op)
-            node = OrNode(node, self.xor_expr()) if op == "OR" else NorNode(node, self.xor_expr())
-
-        return node
-
-    def xor_expr(self):
-        node = self.and_expr()
-
-        while self.current_token.type == "XOR":
-            self.eat("XOR")
-            node = XorNode(node, self.and_expr())
-
-        return node
-
-    def and_expr(self):
-        node = self.nand_expr()
-
-        while self.current_token.type in ("AND",):
-            self.eat("AND")
-            node = AndNode(node, self.nand_expr())
-
-        return node
-
-    def nand_expr(self):
-        node = self.factor()
-
-        while self.current_token.type == "NAND":
-            self.eat("NAND")
-            node = NandNode(node, self.factor())
-
-        return node
+        """
+        Parse one expression, stopping at the first token that cannot continue it
+        (EOF or an unmatched RPAREN).
+        """
+        operands = []
+        operators = []
+        open_parentheses = 0
+        expect_operand = True
+
+        while True:
+            token = self.current_token
+
+            if expect_operand:
+                if token.type in ("NOT", "LPAREN"):
+                    self.eat(token.type)
+                    operators.append(token.type)
+                    open_parentheses += token.type == "LPAREN"
+                    continue
+
+                operands.append(self.factor())
+                self._reduce_negations(operands, operators)
+                expect_operand = False
+            elif token.type in BINARY_OPERATORS:
+                precedence = BINARY_OPERATORS[token.type][0]
+
+                while operators and operators[-1] in BINARY_OPERATORS and \
+                        BINARY_OPERATORS[operators[-1]][0] >= precedence:
+                    self._reduce_binary(operands, operators)
+
+                self.eat(token.type)
+                operators.append(token.type)
+                expect_operand = True
+            elif token.type == "RPAREN" and open_parentheses:
+                while operators[-1] != "LPAREN":
+                    self._reduce_binary(operands, operators)
+
+                self.eat("RPAREN")
+                operators.pop()
+                open_parentheses -= 1
+                self._reduce_negations(operands, operators)
+            else:
+                break
+
+        while operators:
+            if operators[-1] == "LPAREN":
+                # An unclosed parenthesis: report the missing RPAREN.
+                self.eat("RPAREN")
+            self._reduce_binary(operands, operators)
+
+        return self._build(operands[0])
 
     def factor(self):
         token = self.current_token
-        
-        if token.type == "NOT":
-            self.eat("NOT")
-            node = NotNode(self.factor())
-            return node
-        elif token.type == "IDENTIFIER":
+
+        if token.type == "IDENTIFIER":
             self.eat("IDENTIFIER")
             return VariableNode(token.value)
         elif token.type == "CONST":
             self.eat("CONST")
             value = True if token.value.lower() in {"1", "true"} else False
             return ConstNode(value)
-        elif token.type == "LPAREN":
-            self.eat("LPAREN")
-            node = self.expr()
-            self.eat("RPAREN")
-            return node
-        
+
         raise ValueError(f"Unexpected token {token.type} at position {self.position + 1}")
+
+    def _reduce_negations(self, operands, operators):
+        while operators and operators[-1] == "NOT":
+            operators.pop()
+            operands.append(NotNode(self._build(operands.pop())))
+
+    def _reduce_binary(self, operands, operators):
+        node_class = BINARY_OPERATORS[operators.pop()][1]
+        right = self._build(operands.pop())
+        left = operands.pop()
+
+        # An associative chain is kept as (node_class, operand list) on the stack
+        # until it is complete, so building it takes linear time.
+        if isinstance(left, tuple) and left[0] is node_class:
+            left[1].append(right)
+            operands.append(left)
+        elif issubclass(node_class, NaryNode):
+            operands.append((node_class, [self._build(left), right]))
+        else:
+            operands.append(node_class(self._build(left), right))
+
+    def _build(self, operand):
+        if isinstance(operand, tuple):
+            node_class, chain = operand
+            return node_class(*chain)
+
+        return operand
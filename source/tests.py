@@ -1,12 +1,32 @@
+import gc
+import random
 import unittest
 import tempfile
+import time
+import weakref
+from itertools import product
 
 from gui.gui_main import *
 from gui.gui_actions import *
-from parser_lexer.lexer import Lexer
+from parser_lexer.lexer import Lexer, Token
 from parser_lexer.parser import Parser
-from boolean_logic.boolean_functions import BooleanFunctionSet
-from boolean_logic.quine_mccluskey import quine_mccluskey
+from boolean_logic.boolean_functions import BooleanFunctionSet, count_literals
+from boolean_logic.quine_mccluskey import cover_literal_bound, implicant_to_string, prime_implicants, quine_mccluskey
+from boolean_logic.helpers import anf_vector_to_polynomial, mobius_transform
+from boolean_logic.memoization import LRUCache
+from boolean_logic.bdd import BDD, BudgetExceeded
+from boolean_logic.covering import CoveringSolver
+from boolean_logic.esop import anf_cubes, exorcism
+from boolean_logic.espresso import complement, espresso, is_tautology, isop
+from boolean_logic.gate_parser import Netlist, netlist_to_graphviz
+from boolean_logic.multi_output import cover_netlist, minimize_multi_output
+from boolean_logic.model_counting import count_models
+from boolean_logic.truth_table import TruthTable
+from boolean_logic.ordering import build_bdd, dfs_order, force_order, sift
+from boolean_logic.result_store import ResultStore, main as result_store_main, warm
+from boolean_logic.sat import CDCLSolver, luby
+from ast_nodes.nodes import ConstNode, NotNode
+from ast_nodes.rewriting import RewriteEngine, absorption, rewrite_rule
 
 
 class TestLexer(unittest.TestCase):
@@ -48,6 +68,20 @@ class TestLexer(unittest.TestCase):
         nand_nor_count = sum(1 for t in tokens if t.type in ["NAND","NOR"])
         self.assertEqual(nand_nor_count, 10)
 
+    def test_iter_tokens_is_lazy(self):
+        tokens = Lexer("A AND B ?").iter_tokens()
+        self.assertEqual(next(tokens), Token("IDENTIFIER", "A"))
+        self.assertEqual(next(tokens), Token("AND", "AND"))
+        self.assertEqual(next(tokens).type, "IDENTIFIER")
+
+        with self.assertRaises(ValueError):
+            next(tokens)
+
+    def test_parser_consumes_token_stream(self):
+        ast = Parser(Lexer("NOT (A OR B) AND C").iter_tokens()).parse()
+        self.assertEqual(str(ast), "(NOT (A OR B) AND C)")
+        self.assertIs(Lexer("A").token_regex, Lexer("B").token_regex)
+
 
 class TestParser(unittest.TestCase):
     def test_simple_parse(self):
@@ -102,6 +136,12 @@ class TestAST(unittest.TestCase):
         boolean_function4 = BooleanFunction(expression4)
         self.assertEqual(boolean_function4.simplify(), "0")
 
+        boolean_function5 = BooleanFunction.get("A AND A")
+        parsed_ast = boolean_function5.ast
+        self.assertEqual(boolean_function5.simplify(), "A")
+        self.assertIs(BooleanFunction.get("A AND A").ast, parsed_ast)
+        self.assertNotEqual(str(parsed_ast), "A")
+
     def test_substitute(self):
         boolean_function = BooleanFunction("A AND B")
         new_boolean_function1 = boolean_function.cofactor("A", 1)
@@ -125,6 +165,365 @@ class TestAST(unittest.TestCase):
         self.assertEqual(str(new_boolean_function), "(B OR D)")
 
 
+class TestDeepExpressions(unittest.TestCase):
+    depth = 10 ** 5
+
+    def test_deep_negations(self):
+        boolean_function = BooleanFunction("NOT " * self.depth + "A")
+        self.assertEqual(boolean_function.variables, ["A"])
+        self.assertTrue(boolean_function.evaluate({"A": 1}))
+        self.assertEqual(len(str(boolean_function.ast)), 4 * self.depth + 1)
+        self.assertEqual(boolean_function.simplify(), "A")
+
+    def test_deep_parentheses(self):
+        boolean_function = BooleanFunction("(" * self.depth + "A OR B" + ")" * self.depth)
+        self.assertEqual(boolean_function.simplify(), "A OR B")
+
+        with self.assertRaises(ValueError):
+            BooleanFunction("(" * self.depth + "A" + ")" * (self.depth - 1))
+
+    def test_deep_right_nesting(self):
+        expression = "A AND (B OR (" * (self.depth // 2) + "C" + "))" * (self.depth // 2)
+        boolean_function = BooleanFunction(expression)
+        self.assertEqual(boolean_function.variables, ["A", "B", "C"])
+        self.assertFalse(boolean_function.evaluate({"A": 0, "B": 1, "C": 1}))
+        self.assertTrue(boolean_function.evaluate({"A": 1, "B": 0, "C": 1}))
+        self.assertEqual(list(boolean_function.get_truth_table().minterms()), [5, 6, 7])
+        self.assertEqual(boolean_function.to_zhegalkin().count("+"), 2)
+        substituted = boolean_function.ast.substitute({"B": 1})
+        self.assertEqual(str(substituted), "A")
+
+
+class TestNaryNodes(unittest.TestCase):
+    def test_chains_are_flat(self):
+        expression = " OR ".join(["A", "B"] * 2500)
+        ast = Parser(Lexer(expression).iter_tokens()).parse()
+        self.assertEqual(len(ast.operands), 5000)
+        self.assertIs(ast, Parser(Lexer("(A OR B) OR (" + expression[10:] + ")").iter_tokens()).parse())
+        self.assertEqual(str(ast.simplify()), "(A OR B)")
+
+    def test_simplify_in_one_pass(self):
+        boolean_function1 = BooleanFunction("A AND B AND 1 AND NOT A")
+        self.assertEqual(boolean_function1.simplify(), "0")
+
+        boolean_function2 = BooleanFunction("A OR (B OR A) OR 0 OR (C IMP B)")
+        self.assertEqual(boolean_function2.simplify(), "A OR B OR NOT C")
+
+        boolean_function3 = BooleanFunction("A XOR B XOR NOT A XOR C XOR B")
+        self.assertEqual(boolean_function3.simplify(), "NOT C")
+
+    def test_operations_on_nary_nodes(self):
+        boolean_function = BooleanFunction("A AND B AND C OR A XOR B XOR C")
+        self.assertEqual(len(boolean_function.ast.operands), 2)
+        self.assertEqual(boolean_function.get_zhegalkin_polynomial(), {1, 2, 4})
+        self.assertEqual(list(boolean_function.get_truth_table().minterms()), [1, 2, 4, 7])
+
+
+class TestRewriting(unittest.TestCase):
+    def test_default_rules(self):
+        self.assertEqual(BooleanFunction("A AND (B OR A)").simplify(), "A")
+        self.assertEqual(BooleanFunction("A OR (NOT A AND B)").simplify(), "A OR B")
+        self.assertEqual(BooleanFunction("(A AND B) OR (C AND A)").simplify(), "A AND (B OR C)")
+        self.assertEqual(BooleanFunction("NOT (NOT A OR NOT B)").simplify(), "A AND B")
+        self.assertEqual(BooleanFunction("(A AND B) OR (A AND NOT B)").simplify(), "A")
+
+    def test_rule_statistics(self):
+        engine = RewriteEngine(rules=[absorption])
+        root = Parser(Lexer("A OR (A AND B) OR (A AND C)").iter_tokens()).parse()
+        self.assertEqual(str(engine.rewrite(root)), "A")
+        self.assertEqual(engine.rewrite(root), engine.memo[root])
+        (info,) = engine.rule_info()
+        self.assertEqual((info.name, info.hits), ("absorption", 1))
+        self.assertGreaterEqual(info.seconds, 0)
+
+    def test_custom_rule_runs_to_fixed_point(self):
+        @rewrite_rule(NotNode)
+        def drop_negation(node):
+            return node.operand
+
+        engine = RewriteEngine(rules=[drop_negation])
+        root = Parser(Lexer("NOT (A AND NOT (B OR NOT C))").iter_tokens()).parse()
+        self.assertEqual(str(engine.rewrite(root)), "(A AND (B OR C))")
+        self.assertEqual(engine.rule_info()[0].hits, 3)
+
+
+class TestHashConsing(unittest.TestCase):
+    def test_structurally_equal_nodes_are_shared(self):
+        ast1 = Parser(Lexer("(A AND B) OR NOT C").tokenize()).parse()
+        ast2 = Parser(Lexer("(A && B) | ~C").tokenize()).parse()
+        self.assertIs(ast1, ast2)
+        self.assertEqual(hash(ast1), hash(ast2))
+        self.assertIsNot(ast1, Parser(Lexer("(A AND B) OR NOT D").tokenize()).parse())
+
+    def test_shared_subexpressions(self):
+        ast = Parser(Lexer("(A AND B) XOR (A AND B)").tokenize()).parse()
+        self.assertIs(ast.operands[0], ast.operands[1])
+        self.assertIs(ConstNode(1), ConstNode(True))
+
+    def test_simplify_is_memoized(self):
+        ast = Parser(Lexer("(A AND 1) OR (0 OR B)").tokenize()).parse()
+        self.assertIs(ast.simplify(), ast.simplify())
+        self.assertEqual(str(ast.simplify()), "(A OR B)")
+
+
+class TestBDD(unittest.TestCase):
+    def test_canonical_nodes(self):
+        manager = BDD(["A", "B", "C"])
+        root1 = Parser(Lexer("(A AND B) OR (A AND NOT B)").iter_tokens()).parse().to_bdd(manager)
+        root2 = Parser(Lexer("NOT (A NAND (C OR 1))").iter_tokens()).parse().to_bdd(manager)
+        self.assertEqual(root1, manager.variable("A"))
+        self.assertEqual(root1, root2)
+        self.assertEqual(manager.node_count(root1), 3)
+
+    def test_operations(self):
+        boolean_function = BooleanFunction("(A IMP B) XOR (C NOR A)")
+        manager, root = boolean_function.to_bdd()
+        truth_table = boolean_function.get_truth_table()
+        self.assertEqual(manager.sat_count(root), truth_table.popcount())
+
+        for values, result in truth_table:
+            self.assertEqual(manager.evaluate(root, dict(zip("ABC", values))), bool(result))
+
+        restricted = manager.restrict(root, "A", 1)
+        self.assertEqual(restricted, manager.variable("B"))
+        self.assertEqual(manager.ite(manager.variable("A"), restricted, manager.restrict(root, "A", 0)), root)
+        self.assertTrue(manager.evaluate(root, manager.satisfying_assignment(root)))
+        self.assertIsNone(manager.satisfying_assignment(0))
+
+    def test_many_variables(self):
+        pairs = [(name + "X", name + "Y") for name in [chr(65 + index // 26) + chr(65 + index % 26) for index in range(30)]]
+        expression1 = " OR ".join(f"({first} AND {second})" for first, second in pairs)
+        expression2 = "NOT (" + " AND ".join(f"(NOT {first} OR NOT {second})" for first, second in pairs) + ")"
+        expression3 = expression1.split(" OR ", 1)[1]
+        boolean_function1 = BooleanFunction(expression1)
+        self.assertEqual(len(boolean_function1.variables), 60)
+        self.assertTrue(boolean_function1.is_equivalent(BooleanFunction(expression2)))
+        self.assertFalse(boolean_function1.is_equivalent(BooleanFunction(expression3)))
+        self.assertEqual(boolean_function1.difference_measure(BooleanFunction(expression3)), 3 ** 29)
+        self.assertEqual(BooleanFunction("A AND B").difference_measure(BooleanFunction("A OR C")), 4)
+
+    def test_deep_diagrams(self):
+        names = [f"V{index}" for index in range(1200)]
+        manager = BDD(names)
+        ones = zeros = 1
+
+        for name in reversed(names):
+            ones = manager.apply("AND", manager.variable(name), ones)
+            zeros = manager.apply("AND", manager.negate(manager.variable(name)), zeros)
+
+        equal = manager.apply("OR", ones, zeros)
+        self.assertEqual(manager.sat_count(equal), 2)
+        restricted = manager.restrict(equal, names[-1], 1)
+        self.assertEqual(restricted, manager.restrict(ones, names[-1], 1))
+        self.assertEqual(manager.sat_count(restricted), 2)
+        target = BDD(names)
+        self.assertEqual(target.sat_count(manager.transfer(equal, target)), 2)
+        self.assertEqual(sorted(isop(manager, equal, equal, names)), [(0, 0), ((1 << 1200) - 1, 0)])
+        manager.collect_garbage(equal)
+        manager.swap_levels(0)
+        self.assertEqual(manager.sat_count(equal), 2)
+
+
+class TestVariableOrdering(unittest.TestCase):
+    expression = " OR ".join(f"(A{letter} AND B{letter})" for letter in "ABCDEF")
+
+    def test_static_orders(self):
+        ast = Parser(Lexer(self.expression).iter_tokens()).parse()
+        self.assertEqual(dfs_order(ast)[:4], ["AA", "BA", "AB", "BB"])
+        self.assertEqual(force_order(ast, initial=sorted(dfs_order(ast)))[:4], ["AA", "BA", "AB", "BB"])
+
+    def test_report_and_presentation(self):
+        boolean_function = BooleanFunction(self.expression)
+        node_counts = {result.method: result.node_count for result in boolean_function.variable_order_report()}
+        self.assertEqual(node_counts, {"alphabetical": 128, "dfs": 14, "force": 14, "sifting": 14})
+
+        manager, root = boolean_function.to_bdd()
+        self.assertNotEqual(manager.variables, boolean_function.variables)
+        self.assertEqual(list(manager.satisfying_assignment(root)), boolean_function.variables)
+
+    def test_sifting(self):
+        ast = Parser(Lexer(self.expression).iter_tokens()).parse()
+        manager, roots = build_bdd([ast], sorted(dfs_order(ast)))
+        sifted_manager, sifted_roots = sift(manager, roots)
+        self.assertEqual(sifted_manager.node_count(*sifted_roots), 14)
+        self.assertEqual(sifted_manager.sat_count(sifted_roots[0]), manager.sat_count(roots[0]))
+
+
+class TestSAT(unittest.TestCase):
+    def test_solver(self):
+        solver = CDCLSolver()
+        a, b, c = (solver.new_variable() for _ in range(3))
+        clauses = [[a, b], [-a, c], [-b, -c], [-c, b, a]]
+
+        for clause in clauses:
+            solver.add_clause(clause)
+
+        self.assertTrue(solver.solve())
+        model = solver.model()
+        self.assertTrue(all(any(model[abs(literal)] == (literal > 0) for literal in clause) for clause in clauses))
+
+        solver.add_clause([-a])
+        self.assertTrue(solver.solve())
+        self.assertEqual(solver.model(), {a: False, b: True, c: False})
+
+        solver.add_clause([-b])
+        self.assertFalse(solver.solve())
+
+    def test_pigeonhole_is_unsatisfiable(self):
+        solver = CDCLSolver()
+        holes = {(pigeon, hole): solver.new_variable() for pigeon in range(5) for hole in range(4)}
+
+        for pigeon in range(5):
+            solver.add_clause([holes[pigeon, hole] for hole in range(4)])
+
+        for hole in range(4):
+            for first in range(5):
+                for second in range(first + 1, 5):
+                    solver.add_clause([-holes[first, hole], -holes[second, hole]])
+
+        self.assertFalse(solver.solve())
+        self.assertGreater(solver.conflicts, 0)
+        self.assertEqual([luby(index) for index in range(8)], [1, 1, 2, 1, 1, 2, 4, 1])
+
+    def test_equivalence_with_counterexample(self):
+        boolean_function1 = BooleanFunction("A IMP (B AND C)")
+        self.assertTrue(boolean_function1.is_equivalent(BooleanFunction("(NOT A OR B) AND (C OR NOT A)")))
+
+        boolean_function2 = BooleanFunction("A IMP (B OR D)")
+        counterexample = boolean_function1.find_counterexample(boolean_function2)
+        self.assertEqual(list(counterexample), ["A", "B", "C", "D"])
+        self.assertNotEqual(boolean_function1.evaluate(counterexample), boolean_function2.evaluate(counterexample))
+
+    def test_many_variables(self):
+        names = [chr(65 + index // 26) + chr(65 + index % 26) for index in range(201)]
+        groups = list(zip(names[0::3], names[1::3], names[2::3]))
+        expression1 = " XOR ".join(f"({a} AND ({b} OR {c}))" for a, b, c in groups)
+        expression2 = " XOR ".join(f"(({a} AND {b}) OR ({c} AND {a}))" for a, b, c in groups)
+        boolean_function1 = BooleanFunction(expression1)
+        self.assertTrue(boolean_function1.is_equivalent(BooleanFunction(expression2)))
+
+        expression3 = expression2.replace("(BB AND BC)", "(BB AND NOT BC)")
+        counterexample = boolean_function1.find_counterexample(BooleanFunction(expression3))
+        self.assertEqual(len(counterexample), 201)
+        self.assertNotEqual(
+            boolean_function1.ast.evaluate(counterexample), 
+            BooleanFunction(expression3).ast.evaluate(counterexample)
+            )
+
+
+class TestModelCounting(unittest.TestCase):
+    def test_methods_agree(self):
+        boolean_function = BooleanFunction("(A IMP B) XOR (C NOR (D EQV A))")
+        expected = boolean_function.get_truth_table().popcount()
+
+        for method in ("auto", "enumeration", "bdd"):
+            self.assertEqual(boolean_function.count_models(method), expected)
+
+        ast = boolean_function.ast
+        self.assertEqual(count_models(ast, ["A", "B", "C", "D", "E"], "bdd"), 2 * expected)
+        self.assertEqual(count_models(ast, ["A", "B", "C", "D", "E"], "enumeration"), 2 * expected)
+
+    def test_difference_measure(self):
+        boolean_function1 = BooleanFunction("A AND B")
+        boolean_function2 = BooleanFunction("A OR C")
+        self.assertEqual(boolean_function1.difference_measure(boolean_function2, "enumeration"), 4)
+        self.assertEqual(boolean_function1.difference_measure(boolean_function2, "bdd"), 4)
+
+        names = [chr(65 + index // 26) + chr(65 + index % 26) for index in range(80)]
+        expression = " OR ".join(f"({first} AND {second})" for first, second in zip(names[0::2], names[1::2]))
+        boolean_function3 = BooleanFunction(expression)
+        boolean_function4 = BooleanFunction(expression.split(" OR ", 1)[1])
+        self.assertEqual(boolean_function3.difference_measure(boolean_function4), 3 ** 39)
+        self.assertEqual(boolean_function3.count_models(), 4 ** 40 - 3 ** 40)
+
+    def test_budget(self):
+        names = [chr(65 + index // 26) + chr(65 + index % 26) for index in range(40)]
+        expression = " OR ".join(f"({first} AND {second})" for first, second in zip(names[:20], names[20:]))
+        boolean_function = BooleanFunction(expression)
+
+        with self.assertRaises(BudgetExceeded):
+            count_models(boolean_function.ast, boolean_function.variables, "bdd", "alphabetical", max_nodes=1000)
+
+        with self.assertRaises(BudgetExceeded):
+            count_models(boolean_function.ast, boolean_function.variables, "bdd", "alphabetical", time_limit=0)
+
+        self.assertEqual(boolean_function.count_models(max_nodes=1000), 4 ** 20 - 3 ** 20)
+
+    def test_enumeration_uses_compiled_function(self):
+        boolean_function1 = BooleanFunction("(A AND B) OR C")
+        boolean_function2 = BooleanFunction("B XOR D")
+        self.assertEqual(boolean_function1.count_models("enumeration"), 5)
+        self.assertEqual(boolean_function1.difference_measure(boolean_function2, "enumeration"), 8)
+        self.assertIsNotNone(boolean_function1._artifacts.get("compile"))
+        self.assertIsNotNone(boolean_function2._artifacts.get("compile"))
+
+    def test_wide_functions(self):
+        names = ["V" + "".join("BCDFGHJKLM"[int(digit)] for digit in f"{index:04d}") for index in range(1200)]
+        boolean_function1 = BooleanFunction(" AND ".join(names))
+        boolean_function2 = BooleanFunction(" AND ".join(reversed(names[1:])))
+        self.assertEqual(boolean_function1.count_models(), 1)
+        self.assertEqual(boolean_function1.difference_measure(boolean_function2), 1)
+        self.assertTrue(boolean_function1.is_equivalent(BooleanFunction(" AND ".join(reversed(names))), "bdd"))
+
+
+class TestTruthTable(unittest.TestCase):
+    def test_truth_vector_matches_evaluate(self):
+        boolean_function = BooleanFunction("(A IMP B) EQV (C NAND A)")
+        truth_vector = boolean_function.get_truth_vector()
+
+        for index, values in enumerate(product([0, 1], repeat=3)):
+            expected = int(boolean_function.evaluate(dict(zip(["A", "B", "C"], values))))
+            self.assertEqual((truth_vector >> index) & 1, expected)
+
+    def test_truth_table_view(self):
+        boolean_function = BooleanFunction("A AND NOT B")
+        truth_table = boolean_function.get_truth_table()
+        self.assertEqual(list(truth_table), [((0, 0), 0), ((0, 1), 0), ((1, 0), 1), ((1, 1), 0)])
+
+    def test_constant_function(self):
+        boolean_function = BooleanFunction("1 OR 0")
+        self.assertEqual(list(boolean_function.get_truth_table()), [((), 1)])
+
+    def test_packed_row_access(self):
+        boolean_function = BooleanFunction("(A AND B) OR C")
+        truth_table = boolean_function.get_truth_table()
+        self.assertEqual(len(truth_table), 8)
+        self.assertEqual(truth_table.popcount(), 5)
+        self.assertEqual(list(truth_table.minterms()), [1, 3, 5, 6, 7])
+        self.assertEqual(truth_table[6], 1)
+        self.assertEqual(truth_table[4], 0)
+        self.assertEqual(truth_table.row_values(6), (1, 1, 0))
+
+        with self.assertRaises(IndexError):
+            _ = truth_table[8]
+
+    def test_wide_vector_scans(self):
+        vector = (1 << 700) | (1 << 64) | (1 << 9) | 1
+        truth_table = TruthTable(vector, 10)
+        self.assertEqual(list(truth_table.minterms()), [0, 9, 64, 700])
+        self.assertEqual([row for row, (_, value) in enumerate(truth_table) if value], [0, 9, 64, 700])
+        self.assertEqual((truth_table[700], truth_table[701], truth_table[-1]), (1, 0, 0))
+
+
+class TestCompile(unittest.TestCase):
+    def test_compiled_matches_evaluate(self):
+        boolean_function = BooleanFunction("((A AND B) XOR (NOT C OR 1)) NAND (D IMP (E NOR 0))")
+        compiled = boolean_function.compile()
+
+        for values in product([0, 1], repeat=5):
+            expected = int(boolean_function.evaluate(dict(zip(["A", "B", "C", "D", "E"], values))))
+            self.assertEqual(compiled(*values), expected)
+
+    def test_compiled_is_cached(self):
+        boolean_function = BooleanFunction("A EQV B")
+        self.assertIs(boolean_function.compile(), boolean_function.compile())
+
+    def test_keyword_variable_names(self):
+        boolean_function = BooleanFunction("if AND def")
+        self.assertEqual(boolean_function.compile()(1, 1), 1)
+        self.assertEqual(boolean_function.compile()(0, 1), 0)
+
+
 class TestZhegalkin(unittest.TestCase):
     def test_not_node(self):
         expression = "NOT A"
@@ -147,6 +546,33 @@ class TestZhegalkin(unittest.TestCase):
         polynomial_parts = set(part.strip() for part in polynomial.split("+"))
         self.assertSetEqual(expected_parts, polynomial_parts)
 
+    def test_mobius_matches_ast(self):
+        expressions = [
+            "(A AND B) OR (B AND C) OR (A AND C)",
+            "(A IMP B) EQV (C NAND D)",
+            "NOT (A NOR B) XOR (C OR 1)",
+            "A OR B OR C OR D OR E",
+        ]
+
+        for expression in expressions:
+            boolean_function = BooleanFunction(expression)
+            variables_count = len(boolean_function.variables)
+            anf_vector = mobius_transform(boolean_function.get_truth_vector(), variables_count)
+            self.assertEqual(
+                anf_vector_to_polynomial(anf_vector, variables_count),
+                boolean_function.ast.to_zhegalkin(boolean_function.variables)
+                )
+
+    def test_zhegalkin_strategy(self):
+        boolean_function_or = BooleanFunction("A OR B OR C OR D OR E OR F OR G OR H OR I OR J")
+        self.assertEqual(boolean_function_or.zhegalkin_strategy(), "mobius")
+        self.assertEqual(len(boolean_function_or.get_zhegalkin_polynomial()), 2 ** 10 - 1)
+
+        names = [first + second for first in "ABCDE" for second in "ABCDEF"]
+        boolean_function_xor = BooleanFunction(" XOR ".join(names))
+        self.assertEqual(boolean_function_xor.zhegalkin_strategy(), "ast")
+        self.assertEqual(len(boolean_function_xor.get_zhegalkin_polynomial()), 30)
+
 
 class TestProperties(unittest.TestCase):
     def test_preserves_zero(self):
@@ -173,12 +599,109 @@ class TestProperties(unittest.TestCase):
         boolean_function_xor = BooleanFunction("A XOR B")
         self.assertFalse(boolean_function_xor.is_monotonic())
 
+    def test_monotonicity_witness(self):
+        boolean_function_or = BooleanFunction("(A AND B) OR C")
+        self.assertIsNone(boolean_function_or.monotonicity_witness())
+
+        boolean_function_imp = BooleanFunction("A IMP B")
+        lower, upper = boolean_function_imp.monotonicity_witness()
+        self.assertEqual(sum(u - l for l, u in zip(lower, upper)), 1)
+        self.assertTrue(all(l <= u for l, u in zip(lower, upper)))
+        self.assertTrue(boolean_function_imp.evaluate(dict(zip(["A", "B"], lower))))
+        self.assertFalse(boolean_function_imp.evaluate(dict(zip(["A", "B"], upper))))
+
     def test_is_linear(self):
         boolean_function_xor = BooleanFunction("A XOR B")
         self.assertTrue(boolean_function_xor.is_linear())
         boolean_function_and = BooleanFunction("A AND B")
         self.assertFalse(boolean_function_and.is_linear())
 
+    def test_post_classes(self):
+        boolean_function_majority = BooleanFunction("(A AND B) OR (B AND C) OR (A AND C)")
+        self.assertEqual(
+            boolean_function_majority.post_classes(),
+            {"T0": True, "T1": True, "S": True, "M": True, "L": False}
+            )
+        boolean_function_not = BooleanFunction("NOT A")
+        self.assertEqual(
+            boolean_function_not.post_classes(),
+            {"T0": False, "T1": False, "S": True, "M": False, "L": True}
+            )
+
+    def test_properties_share_one_computation(self):
+        boolean_function = BooleanFunction("A XOR B XOR C")
+        boolean_function.preserves_zero()
+        info = boolean_function.cache_info()
+        boolean_function.preserves_one()
+        boolean_function.is_self_dual()
+        boolean_function.is_monotonic()
+        boolean_function.is_linear()
+        self.assertEqual(boolean_function.cache_info().misses, info.misses)
+        self.assertEqual(boolean_function.cache_info().hits, info.hits + 4)
+
+
+class TestArtifactCache(unittest.TestCase):
+    def test_cache_info(self):
+        boolean_function = BooleanFunction("A AND B")
+        boolean_function.to_zhegalkin()
+        boolean_function.to_zhegalkin()
+        info = boolean_function.cache_info()
+        self.assertEqual(info.maxsize, BooleanFunction.artifact_cache_size)
+        self.assertGreater(info.hits, 0)
+        self.assertGreater(info.currsize, 0)
+
+    def test_size_bound_and_eviction(self):
+        boolean_function = BooleanFunction("A OR B", cache_size=2)
+        boolean_function.minimize()
+        boolean_function.to_zhegalkin()
+        boolean_function.post_classes()
+        self.assertEqual(boolean_function.cache_info().currsize, 2)
+        self.assertEqual(set(boolean_function.minimize().split(" OR ")), {"A", "B"})
+
+    def test_expression_cache_shares_instances(self):
+        BooleanFunction.expression_cache.clear()
+        boolean_function1 = BooleanFunction.get("A AND NOT B")
+        boolean_function2 = BooleanFunction.get("A && ~B")
+        boolean_function3 = BooleanFunction.get("A and not b")
+        self.assertIs(boolean_function1, boolean_function2)
+        self.assertIsNot(boolean_function1, boolean_function3)
+        info = BooleanFunction.expression_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_expression_cache_memory_cap(self):
+        cache = LRUCache(maxsize=None, maxweight=100, weigher=len)
+        cache.put("a", "x" * 60)
+        cache.put("b", "x" * 30)
+        cache.put("c", "x" * 30)
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.weight, 60)
+        cache.put("d", "x" * 200)
+        self.assertNotIn("d", cache)
+        self.assertEqual((len(cache), cache.weight), (2, 60))
+
+    def test_function_weight_follows_its_artifacts(self):
+        BooleanFunction.expression_cache.clear()
+        wide_expression = " OR ".join(f"X{letter}" for letter in "ABCDEFGHIJKLMNOPQRSTUV")
+
+        for expression in ("A AND B", "A OR B", wide_expression):
+            BooleanFunction.get(expression)
+
+        self.assertEqual(len(BooleanFunction.expression_cache), 3)
+        boolean_function = BooleanFunction.get("A AND B")
+        empty_size = boolean_function.estimated_size()
+        boolean_function.get_truth_table()
+        boolean_function.post_classes()
+        self.assertGreater(boolean_function.estimated_size(), empty_size)
+        self.assertLess(BooleanFunction.get(wide_expression).estimated_size(), 1 << 16)
+
+    def test_functions_are_released(self):
+        boolean_function = BooleanFunction("A AND NOT B")
+        boolean_function.to_zhegalkin()
+        reference = weakref.ref(boolean_function)
+        del boolean_function
+        gc.collect()
+        self.assertIsNone(reference())
+
 
 class TestMinimizeAndQuine(unittest.TestCase):
     def test_minimize_simple(self):
@@ -197,6 +720,20 @@ class TestMinimizeAndQuine(unittest.TestCase):
         pis = quine_mccluskey(minterms, 4, dont_cares)
         self.assertTrue(len(pis) > 0)
 
+    def test_prime_implicants_are_integer_pairs(self):
+        primes = prime_implicants([0b000, 0b001, 0b011, 0b111], 3)
+        self.assertEqual(primes, {(0b000, 0b001), (0b001, 0b010), (0b011, 0b100)})
+        self.assertEqual(sorted(implicant_to_string(prime, 3) for prime in primes), ["-11", "0-1", "00-"])
+        self.assertEqual(quine_mccluskey([0b000, 0b001, 0b011, 0b111], 3), {"00-", "-11"})
+        self.assertEqual(prime_implicants([0b0110, 0b0111], 4, [0b1110, 0b1111]), {(0b0110, 0b1001)})
+
+    def test_parallel_prime_implicants(self):
+        generator = random.Random(5)
+        minterms = generator.sample(range(1 << 8), 96)
+        serial = prime_implicants(minterms, 8)
+        self.assertEqual(prime_implicants(minterms, 8, workers=2, serial_threshold=0), serial)
+        self.assertEqual(quine_mccluskey(minterms, 8, workers=2), quine_mccluskey(minterms, 8))
+
     def test_minimize_equiv_expression(self):
         boolean_function = BooleanFunction("A EQV B")
         min_expression = boolean_function.minimize()
@@ -209,6 +746,310 @@ class TestMinimizeAndQuine(unittest.TestCase):
             )
 
 
+class TestCovering(unittest.TestCase):
+    def test_cyclic_core(self):
+        # Sum of m(0, 1, 2, 5, 6, 7): six primes, no essential one, two minimum covers of three.
+        minterms = [0, 1, 2, 5, 6, 7]
+        primes = sorted(prime_implicants(minterms, 3))
+        solver = CoveringSolver([
+            sum(1 << position for position, minterm in enumerate(minterms) if minterm & ~mask == value)
+            for value, mask in primes
+            ])
+        self.assertEqual(len(solver.solve()), 3)
+        self.assertEqual(solver.cyclic_core, (6, 6))
+        self.assertTrue(solver.optimal)
+        self.assertEqual(len(quine_mccluskey(minterms, 3)), 3)
+
+    def test_costs_and_dominance(self):
+        # Column 0 alone covers everything but costs more than columns 1 and 2 together.
+        solver = CoveringSolver([0b111, 0b011, 0b100, 0b001], costs=[5, 2, 2, 1])
+        self.assertEqual(solver.solve(), [1, 2])
+        self.assertEqual(solver.solve(0b001), [3])
+
+        with self.assertRaises(ValueError):
+            solver.solve(0b1000)
+
+    def test_exact_minimum(self):
+        # The minterms with between one and five ones of six variables: a ring of six primes.
+        minterms = [minterm for minterm in range(64) if 0 < minterm.bit_count() < 6]
+        self.assertEqual(len(prime_implicants(minterms, 6)), 30)
+        self.assertEqual(len(quine_mccluskey(minterms, 6)), 6)
+
+    def test_time_limit_is_reported(self):
+        minterms = [minterm for minterm in range(64) if 0 < minterm.bit_count() < 6]
+        terms, finished = quine_mccluskey(minterms, 6, time_limit=0, return_finished=True)
+        self.assertFalse(finished)
+        self.assertGreater(len(terms), 6)
+
+        boolean_function = BooleanFunction("(A OR B OR C OR D OR E OR F) AND NOT (A AND B AND C AND D AND E AND F)")
+        self.assertFalse(boolean_function.minimized_cover("exact", 0)[1])
+        terms, finished = boolean_function.minimized_cover("exact")
+        self.assertTrue(finished)
+        self.assertEqual(len(terms), 6)
+        self.assertTrue(boolean_function.minimized_cover("heuristic")[1])
+        self.assertTrue(boolean_function.minimized_cover(form="esop")[1])
+
+
+class TestEspresso(unittest.TestCase):
+    def test_cube_operations(self):
+        full = 0b111
+        self.assertTrue(is_tautology([(0b000, 0b011), (0b100, 0b011)], full))
+        self.assertFalse(is_tautology([(0b000, 0b011), (0b110, 0b001)], full))
+        self.assertEqual(sorted(complement([(0b110, 0b001)], full)), [(0b000, 0b011), (0b000, 0b101)])
+
+    def test_cover_respects_on_off_and_dont_cares(self):
+        on_set = [0b0110, 0b0111, 0b0101, 0b1101]
+        dont_cares = [0b0100, 0b1111]
+        cover = espresso([(minterm, 0) for minterm in on_set], [(minterm, 0) for minterm in dont_cares], 4)
+        covered = {
+            minterm for minterm in range(16)
+            if any(minterm & ~mask == value for value, mask in cover)
+            }
+        self.assertTrue(set(on_set) <= covered <= set(on_set) | set(dont_cares))
+        self.assertEqual(len(cover), 2)
+
+    def test_minimize_methods(self):
+        boolean_function = BooleanFunction("(A AND B) OR (NOT A AND C) OR (B AND C)")
+        self.assertEqual(boolean_function.minimize("exact"), "(A AND B) OR (NOT A AND C)")
+        self.assertEqual(boolean_function.minimize("heuristic"), "(A AND B) OR (NOT A AND C)")
+
+        with self.assertRaises(ValueError):
+            boolean_function.minimize("karnaugh")
+
+    def test_minimize_many_variables(self):
+        names = [chr(65 + index // 26) + chr(65 + index % 26) for index in range(24)]
+        expression = " OR ".join(f"({names[index]} AND NOT {names[index + 1]})" for index in range(0, 24, 2))
+        boolean_function = BooleanFunction(expression)
+        minimized = boolean_function.minimize()
+        self.assertEqual(minimized.count(" OR "), 11)
+        self.assertTrue(boolean_function.is_equivalent(BooleanFunction(minimized)))
+        self.assertEqual(BooleanFunction("A AND NOT A AND " + names[0]).minimize("heuristic"), "0")
+
+
+class TestDontCares(unittest.TestCase):
+    def test_minterm_dont_cares(self):
+        boolean_function = BooleanFunction("NOT A AND B", dont_cares=[0b11])
+        self.assertEqual(boolean_function.get_dont_care_vector(), 0b1000)
+        self.assertEqual(boolean_function.minimize(), "B")
+        self.assertEqual(boolean_function.minimize("heuristic"), "B")
+        self.assertEqual(BooleanFunction("NOT A AND B").minimize(), "NOT A AND B")
+
+        with self.assertRaises(ValueError):
+            BooleanFunction("A AND B", dont_cares=[4])
+
+    def test_expression_dont_cares(self):
+        # Binary-coded decimal digits above 9 never occur.
+        boolean_function = BooleanFunction("A AND NOT B AND NOT C AND D", dont_cares="A AND (B OR C)")
+        self.assertEqual(boolean_function.minimize(), "A AND D")
+        self.assertEqual(boolean_function.minimize("heuristic"), "A AND D")
+        self.assertEqual(BooleanFunction("A AND C", dont_cares="B").variables, ["A", "B", "C"])
+        self.assertEqual(BooleanFunction("A", dont_cares="NOT A").minimize(), "1")
+
+    def test_cofactors_keep_dont_cares(self):
+        boolean_function = BooleanFunction("A AND NOT B AND C", dont_cares=[0b111, 0b011])
+        cofactor0, cofactor1 = boolean_function.decompose("A")
+        self.assertEqual(cofactor1.minimize(), "C")
+        self.assertEqual(cofactor1.get_dont_care_vector(), 0b1000)
+        self.assertEqual(cofactor0.minimize(), "0")
+        self.assertEqual(cofactor0.get_dont_care_vector(), 0b1000)
+        self.assertIsNone(boolean_function.cofactor("C", 0).dont_cares)
+        self.assertIsNone(BooleanFunction("A AND B", dont_cares="A AND C").cofactor("A", 0).dont_cares)
+
+    def test_cache_key_and_karnaugh_map(self):
+        BooleanFunction.expression_cache.clear()
+        boolean_function1 = BooleanFunction.get("A XOR B", dont_cares=[3])
+        self.assertIs(BooleanFunction.get("A ^ B", dont_cares={3}), boolean_function1)
+        self.assertIsNot(BooleanFunction.get("A XOR B"), boolean_function1)
+        self.assertIsNot(BooleanFunction.get("A XOR B", dont_cares="A AND B"), boolean_function1)
+        self.assertNotEqual(BooleanFunction("A XOR B"), boolean_function1)
+
+        arr, _ = KarnaughMap(boolean_function1).generate_map()
+        self.assertEqual(arr[1, 1], "X")
+        self.assertEqual(arr[0, 1], "1")
+
+
+class TestMultiOutput(unittest.TestCase):
+    def test_joint_minimization_is_equivalent(self):
+        boolean_function_set = BooleanFunctionSet()
+        expressions = ["A AND B OR C", "A AND B AND NOT C OR A AND C", "NOT A AND C OR B AND C"]
+
+        for expression in expressions:
+            boolean_function_set.add_function(BooleanFunction(expression))
+
+        for boolean_function, minimized in boolean_function_set.minimize_jointly().items():
+            self.assertTrue(boolean_function.is_equivalent(BooleanFunction(minimized)))
+
+    def test_shared_products(self):
+        # f = BC + AB and g = A'BC: sharing A'BC, f = A'BC + AB needs two products instead of three.
+        cover = minimize_multi_output([0b11001000, 0b00001000], [0, 0], 3)
+        self.assertEqual(sorted(cover.products), [(3, 0), (6, 1)])
+
+        netlist = cover_netlist(cover, ["A", "B", "C"], ["f", "g"])
+        self.assertEqual(netlist.gate_count(), 4)
+        self.assertEqual(set(netlist.outputs), {"f", "g"})
+
+        graph = graphviz.Digraph()
+        netlist_to_graphviz(netlist, graph)
+        self.assertIn("doublecircle", graph.source)
+
+    def test_netlist_hash_consing(self):
+        netlist = Netlist()
+        a = netlist.gate("VAR", "A")
+        b = netlist.gate("VAR", "B")
+        self.assertEqual(netlist.gate("AND", a, b), netlist.gate("AND", b, a, a))
+        self.assertEqual(netlist.gate_count(), 1)
+        self.assertEqual(netlist.gate_input_count(), 2)
+
+
+class TestMinimizationForms(unittest.TestCase):
+    def test_forms_are_equivalent(self):
+        boolean_function = BooleanFunction("(A OR B) AND (C OR D) AND (NOT A OR E)")
+
+        for form in ("sop", "pos", "esop", "best"):
+            minimized = BooleanFunction(boolean_function.minimize(form=form))
+            self.assertTrue(minimized.is_equivalent(boolean_function))
+
+        self.assertEqual(boolean_function.minimize(form="best"), boolean_function.minimize(form="pos"))
+
+    def test_best_form_shares_one_deadline(self):
+        # 64 random minterms of 8 variables: the exact product of sums would not be proven
+        # within the default 10 seconds, its cyclic core is left to Espresso.
+        names = "ABCDEFGH"
+        boolean_function = BooleanFunction(" OR ".join(
+            "(" + " AND ".join(name if minterm >> (7 - index) & 1 else f"NOT {name}" for index, name in enumerate(names)) + ")"
+            for minterm in random.Random(25).sample(range(256), 64)
+            ))
+        start = time.perf_counter()
+        form, terms = boolean_function.best_form()
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertEqual((form, count_literals(terms)), ("esop", 225))
+        self.assertTrue(boolean_function.minimized_cover("heuristic", form="pos")[1])
+        minimized = BooleanFunction(boolean_function.minimize(form="best"))
+        self.assertEqual(minimized.get_truth_vector(), boolean_function.get_truth_vector())
+
+        # A AND B OR C: the product of sums needs 4 literals, the sum of products 3.
+        minterms, primes = BooleanFunction("A AND B OR C").exact_cover_problem("pos")
+        self.assertEqual(cover_literal_bound(primes, minterms, 3), 4)
+
+        with self.assertRaises(ValueError):
+            boolean_function.minimize(form="nand")
+
+    def test_parity_prefers_esop(self):
+        boolean_function = BooleanFunction("A XOR B XOR C XOR D")
+        self.assertEqual(boolean_function.minimize(form="esop"), "A XOR B XOR C XOR D")
+        self.assertEqual(boolean_function.minimize(form="best"), "A XOR B XOR C XOR D")
+        self.assertEqual(len(boolean_function.minimized_terms(form="sop")), 8)
+        self.assertEqual(BooleanFunction("A AND B OR C").minimize(form="esop"), "(A AND B AND NOT C) XOR C")
+        self.assertEqual(BooleanFunction("A AND B OR C").minimize(form="pos"), "(B OR C) AND (A OR C)")
+
+    def test_exorcism(self):
+        # A + B + AB is the Zhegalkin polynomial of A OR B, which is 1 XOR NOT A AND NOT B.
+        self.assertEqual(exorcism(anf_cubes({0b01, 0b10, 0b11}, 2), 2), [(0b00, 0b00), (0b00, 0b11)])
+        self.assertEqual(exorcism(anf_cubes({0b01}, 2), 2), [(0b10, 0b01)])
+        self.assertEqual(exorcism([(0b00, 0b01), (0b00, 0b01)], 2), [])
+
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = f"{self.directory.name}/results.sqlite"
+        BooleanFunction.result_store = ResultStore(self.path)
+
+    def tearDown(self):
+        BooleanFunction.result_store.close()
+        BooleanFunction.result_store = None
+        self.directory.cleanup()
+
+    def test_results_are_shared_by_equal_functions(self):
+        store = BooleanFunction.result_store
+        self.assertEqual(BooleanFunction("A AND B OR C").minimize(form="best"), "(A AND B) OR C")
+        self.assertEqual(store.hits, 0)
+        self.assertEqual(store.stats()["functions"], 1)
+
+        # The choice of "best" is stored as a whole, and so is each form it minimized.
+        boolean_function = BooleanFunction("C OR B AND A")
+        self.assertEqual(boolean_function.minimize(form="best"), "(A AND B) OR C")
+        self.assertEqual(store.hits, 1)
+        self.assertEqual(boolean_function.minimized_terms(form="sop"), {"11-", "--1"})
+        self.assertEqual(store.hits, 2)
+        self.assertIsNotNone(BooleanFunction("A AND B", dont_cares=[0]).content_key())
+        self.assertNotEqual(
+            BooleanFunction("A AND B", dont_cares=[0]).content_key(), BooleanFunction("A AND B").content_key()
+            )
+
+    def test_results_cut_short_are_not_stored(self):
+        store = BooleanFunction.result_store
+        expression = "(A OR B OR C OR D OR E OR F) AND NOT (A AND B AND C AND D AND E AND F)"
+        boolean_function = BooleanFunction(expression)
+        self.assertFalse(boolean_function.minimized_cover("exact", 0)[1])
+        self.assertEqual(len(store), 0)
+
+        terms, finished = boolean_function.minimized_cover("exact", 60)
+        self.assertTrue(finished)
+        self.assertEqual(len(terms), 6)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(boolean_function.minimized_cover("exact", 0), (terms, True))
+        self.assertEqual(BooleanFunction(expression).minimized_cover("exact", 0), (terms, True))
+        self.assertEqual(store.hits, 1)
+
+    def test_warm_has_no_time_limit(self):
+        store = BooleanFunction.result_store
+        expression = "(A OR B OR C OR D OR E OR F) AND NOT (A AND B AND C AND D AND E AND F)"
+        warm(store, [expression], time_limit=0)
+        stored = len(store)
+        warm(store, [expression])
+        self.assertGreater(len(store), stored)
+
+        hits = store.hits
+        boolean_function = BooleanFunction(expression)
+        boolean_function.minimization_time_limit = 0
+        form, terms = boolean_function.best_form()
+        self.assertEqual(store.hits, hits + 1)
+        self.assertEqual(count_literals(terms), 12)
+
+    def test_persistence_and_eviction(self):
+        BooleanFunction("A XOR B").get_zhegalkin_polynomial()
+        BooleanFunction.result_store.close()
+        BooleanFunction.result_store = ResultStore(self.path, max_bytes=None)
+        self.assertEqual(BooleanFunction("B XOR A").get_zhegalkin_polynomial(), {0b01, 0b10})
+        self.assertEqual(BooleanFunction.result_store.hits, 1)
+
+        # The Post classes store the Zhegalkin polynomial they are computed from as well.
+        for expression in ("A AND B", "A OR B", "NOT A"):
+            BooleanFunction(expression).post_classes()
+
+        self.assertEqual(BooleanFunction.result_store.prune(0), 7)
+        self.assertEqual(BooleanFunction.result_store.stats(), {"functions": 0, "results": 0, "bytes": 0})
+
+    def test_reads_are_batched(self):
+        store = BooleanFunction.result_store
+        store.put("a", "value", [1])
+        time.sleep(0.01)
+        store.put("b", "value", [2])
+        changes = store._connection.total_changes
+        self.assertEqual(store.get("a", "value"), [1])
+        self.assertEqual(store._connection.total_changes, changes)
+
+        # Eviction sees the read: "b" is now the least recently used value.
+        self.assertEqual(store.prune(store.size - 1), 1)
+        self.assertEqual(store.get("a", "value"), [1])
+        self.assertIsNone(store.get("b", "value"))
+
+    def test_command_line(self):
+        expressions = f"{self.directory.name}/expressions.txt"
+
+        with open(expressions, "w", encoding="utf-8") as file:
+            file.write("A AND B\nA OR NOT C\n")
+
+        result_store_main(["--path", self.path, "warm", expressions])
+        self.assertEqual(BooleanFunction.result_store.stats()["functions"], 2)
+        results_count = len(BooleanFunction.result_store)
+        result_store_main(["--path", self.path, "warm", "--time-limit", "5", expressions])
+        self.assertEqual(len(BooleanFunction.result_store), results_count)
+        result_store_main(["--path", self.path, "prune", "0"])
+        self.assertEqual(len(BooleanFunction.result_store), 0)
+
+
 class TestKarnaughMap(unittest.TestCase):
     def test_kmap_2vars(self):
         boolean_function = BooleanFunction("A XOR B")
@@ -272,6 +1113,22 @@ class TestParseMinimizedExpression(unittest.TestCase):
         node = parse_minimized_expression(expression)
         self.assertEqual(node.gate_type, "OR")
 
+    def test_parse_minimized_xor(self):
+        node = parse_minimized_expression("(A AND NOT B) XOR C")
+        self.assertEqual(node.gate_type, "XOR")
+        self.assertEqual(node.children[0].gate_type, "AND")
+        self.assertEqual(parse_minimized_expression("A XOR B OR C").gate_type, "XOR")
+
+    def test_identifiers_containing_operators(self):
+        node = parse_minimized_expression("FXOR OR B")
+        self.assertEqual(node.gate_type, "OR")
+        self.assertEqual(node.children[0].children, ["FXOR"])
+
+        node = parse_minimized_expression("LAND OR (XORB AND NOT ORA)")
+        self.assertEqual(node.gate_type, "OR")
+        self.assertEqual(node.children[0].children, ["LAND"])
+        self.assertEqual(node.children[1].gate_type, "AND")
+
 
 class TestSets(unittest.TestCase):
     def setUp(self):